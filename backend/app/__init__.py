@@ -0,0 +1,126 @@
+from flask import Flask
+
+def create_app(test_config: dict = None) -> Flask:
+    """
+    Application factory.
+
+    Controllers and services are imported here rather than at module level,
+    so `import app.<module>` stays cheap. The Andon model is loaded lazily on
+    the first analysis unless ANDON_MODEL_PRELOAD is set, in which case it is
+    loaded here, before a pre-fork server (gunicorn --preload "app:create_app()")
+    forks its workers.
+    """
+    from flask_restful import Api
+    from flask_cors import CORS
+    from flasgger import Swagger
+    from flask_jwt_extended import JWTManager
+
+    from app import config
+    from app.swagger import build_swagger_template
+    from app.extensions import db, bcrypt, ma
+
+    # Imports de Controllers
+    from app.controllers.ticket import initializeRoutes
+    from app.controllers.log import initializeLogRoutes
+    from app.controllers.auth import initializeAuthRoutes
+    from app.controllers.sync import initializeSyncRoutes
+    from app.controllers.stream import initializeStreamRoutes
+    from app.controllers.andon import initializeAndonRoutes
+    from app.controllers.model_registry import initializeModelRoutes
+    from app.controllers.cache import initializeCacheRoutes
+
+    from app.cli import andon_cli
+    from app.utils import deadline, query_counter
+    from app.utils.json_output import output_json
+    from app.utils import wire
+    from app.utils.db import configure_database, configure_sqlite_pragmas, ensure_columns, ensure_indexes, dispose_engine_after_fork
+    from app.utils.migrations import fill_priority_rank, migrate_logs_to_telemetry
+    from app.services.andon_queue import ingest_queue
+    from app.services.audit_writer import audit_writer
+    from app.services.response_cache import response_cache, TICKETS, LOGS
+    from app.services.device_store import device_store
+    from app.services.shadow import shadow_evaluator
+    from app.services.ticket import TicketService
+    from app.ml_logic.registry import predictor_registry
+
+    app = Flask(__name__)
+    app.config.from_object(config)
+    if test_config:
+        app.config.update(test_config)
+
+    # Configurações do Banco e Segurança (URL, pool e pragmas do SQLite em app/config.py)
+    configure_database(app)
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config["JWT_SECRET_KEY"] = app.config['SECRET_KEY']
+    # Tokens only in headers; /api/stream alone also accepts ?jwt=<token> (EventSource cannot send headers)
+    app.config["JWT_TOKEN_LOCATION"] = ["headers"]
+
+    # Inicialização de Extensões
+    JWTManager(app)
+    api = Api(app)
+    api.representations['application/json'] = output_json
+    for mediatype in wire.MSGPACK_TYPES:
+        api.representations[mediatype] = wire.output_msgpack
+    db.init_app(app)
+    configure_sqlite_pragmas(app)
+    bcrypt.init_app(app)
+    ma.init_app(app)
+    ingest_queue.init_app(app)
+    audit_writer.init_app(app, mode=app.config['AUDIT_LOG_MODE'])
+    response_cache.init_app(app)
+    predictor_registry.init_app(app)
+    shadow_evaluator.init_app(app)
+    CORS(app)
+
+    # Criação das tabelas e manutenção de inicialização
+    with app.app_context():
+        print("Creating database...")
+        db.create_all()
+    ensure_columns(app)
+    ensure_indexes(app)
+
+    with app.app_context():
+        fill_priority_rank()
+        TicketService.rebuild_counters()
+        moved = migrate_logs_to_telemetry()
+        if moved:
+            print(f"Moved {moved} Andon analyses from logs to telemetry.")
+        device_store.rebuild()
+    # O banco pode ter mudado com a aplicação parada: nenhuma página em cache ou ETag antiga continua válida
+    response_cache.invalidate(TICKETS, LOGS)
+
+    # Connections opened above must not be shared with forked workers
+    dispose_engine_after_fork(app)
+
+    if app.config['ANDON_MODEL_PRELOAD']:
+        predictor_registry.preload()
+
+    app.config['SWAGGER'] = {
+        'title': 'Ticket Management API',
+        'uiversion': 3
+    }
+
+    # --- Timeout por requisição (deadline cooperativo, seguro para threads e múltiplos workers) ---
+    deadline.init_app(app)
+    # Contador de comandos SQL por requisição (cabeçalho X-SQL-Statements com SQL_STATEMENT_HEADER)
+    query_counter.init_app(app)
+    # Compressão de respostas JSON/MessagePack acima de RESPONSE_COMPRESS_MIN_BYTES
+    wire.init_app(app)
+
+    # --- INICIALIZAÇÃO DAS ROTAS (PADRÃO DO PROJETO) ---
+    initializeRoutes(api)      # Tickets
+    initializeLogRoutes(api)   # Logs
+    initializeAuthRoutes(api)  # Auth
+    initializeSyncRoutes(api)  # Delta sync
+    initializeStreamRoutes(api) # Server-Sent Events
+    initializeAndonRoutes(api) # IA Andon
+    initializeModelRoutes(api) # Versões do modelo Andon
+    initializeCacheRoutes(api) # Métricas do cache de respostas
+
+    # Comandos de linha (flask --app app andon ...)
+    app.cli.add_command(andon_cli)
+
+    # Configuração do Swagger
+    Swagger(app, template=build_swagger_template())
+
+    return app
@@ -0,0 +1,63 @@
+import json
+import click
+from flask.cli import AppGroup
+from app.ml_logic.registry import UnknownModelVersion
+from app.services.andon_import import import_telemetry
+from app.services.rescore import rescore_telemetry
+from app.services.rollups import RollupService
+from app.services.log import LogService
+from app.utils.json_stream import iter_json_records
+from app.config import ANDON_IMPORT_CHUNK_SIZE, ANDON_RESCORE_CHUNK_SIZE, ANDON_RESCORE_WORKERS, ANDON_ROLLUP_CHUNK_SIZE
+
+andon_cli = AppGroup('andon', help='Andon telemetry maintenance commands.')
+
+@andon_cli.command('import')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--chunk-size', default=ANDON_IMPORT_CHUNK_SIZE, show_default=True, help='Records scored and inserted per transaction.')
+def import_command(path, chunk_size):
+    """Streams a JSON array (or JSON Lines) file of telemetry records into the telemetry table."""
+    def progress(report):
+        click.echo(f"  {report.imported} imported, {report.rejected} rejected ({report.rate:,.0f} records/s)")
+
+    with open(path, encoding='utf-8') as stream:
+        try:
+            report = import_telemetry(iter_json_records(stream), chunk_size=chunk_size, on_chunk=progress)
+        except ValueError as e:
+            raise click.ClickException(str(e))
+
+    LogService.create_log("AI_ANDON_IMPORT", f"Imported {report.imported} records from {path} ({report.rejected} rejected)")
+    click.echo(
+        f"Imported {report.imported} records ({report.rejected} rejected) "
+        f"in {report.elapsed:.2f}s - {report.rate:,.0f} records/s"
+    )
+
+@andon_cli.command('rescore')
+@click.option('--version', default=None, help='Model version to score with (default: the active one).')
+@click.option('--workers', default=ANDON_RESCORE_WORKERS, show_default=True, help='Scoring processes.')
+@click.option('--chunk-size', default=ANDON_RESCORE_CHUNK_SIZE, show_default=True, help='Rows per chunk.')
+@click.option('--dry-run', is_flag=True, help='Only report which verdicts would change.')
+@click.option('--checkpoint', type=click.Path(dir_okay=False), default=None, help='Progress file; an existing one is resumed.')
+def rescore_command(version, workers, chunk_size, dry_run, checkpoint):
+    """Re-scores the stored telemetry with a model version and updates changed verdicts."""
+    def progress(report):
+        click.echo(f"  {report.scanned} scanned, {report.changed} changed ({report.scanned / report.elapsed:,.0f} rows/s)")
+
+    try:
+        report = rescore_telemetry(version, workers, chunk_size, dry_run, checkpoint, on_chunk=progress)
+    except (UnknownModelVersion, ValueError) as e:
+        raise click.ClickException(str(e))
+
+    if not dry_run:
+        LogService.create_log("AI_ANDON_RESCORE", f"Re-scored {report.scanned} rows with {report.version}: {report.changed} changed")
+    click.echo(json.dumps(report.to_json(), indent=2))
+
+@andon_cli.command('backfill-rollups')
+@click.option('--chunk-size', default=ANDON_ROLLUP_CHUNK_SIZE, show_default=True, help='Rows per transaction.')
+def backfill_rollups_command(chunk_size):
+    """Rebuilds the minute/hour/day rollups from the stored telemetry."""
+    processed = RollupService.backfill(chunk_size, on_chunk=lambda count: click.echo(f"  {count} rows rolled up"))
+    click.echo(f"Rolled up {processed} telemetry rows.")
+
+__all__ = [
+    "andon_cli",
+]
@@ -1,21 +1,48 @@
+import queue
+from datetime import datetime, timedelta
 from flask import request
 from flask_restful import Resource, Api
+from marshmallow import ValidationError
+from app.extensions import db
+from app.models.telemetry import Telemetry
 from app.services.andon import AndonService
+from app.services.andon_queue import ingest_queue
+from app.services.device_store import device_store
 from app.services.log import LogService
-from app.utils.httpResponses import success_201, error_400, error_500
+from app.services.rollups import RollupService
+from app.utils.httpResponses import success_200, success_201, success_202, error_400, error_404, error_413, error_429, error_500
 from app.schemas.andon import AndonAnalysisSchema
+from app.utils.pagination import parse_limit, parse_datetime
+from app.utils.wire import request_body, PayloadTooLarge
+from app.config import ANDON_BATCH_MAX_SIZE, TELEMETRY_PAGE_DEFAULT, TELEMETRY_PAGE_MAX, ANDON_TRENDS_DEFAULT_HOURS
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 def initializeAndonRoutes(api: Api):
     api.add_resource(AndonResource, '/api/andon/analyze')
+    api.add_resource(AndonBatchResource, '/api/andon/analyze/batch')
+    api.add_resource(TelemetryHistoryResource, '/api/andon/telemetry')
+    api.add_resource(TrendsResource, '/api/andon/trends')
+    api.add_resource(DeviceListResource, '/api/andon/devices')
+    api.add_resource(DeviceRecentResource, '/api/andon/devices/<string:device_id>/recent')
+    api.add_resource(AndonStatusResource, '/api/andon/analyze/<string:tracking_id>')
+
+def _prefers_async() -> bool:
+    prefer = request.headers.get('Prefer', '')
+    return 'respond-async' in [token.strip().lower() for token in prefer.split(',')]
 
 class AndonResource(Resource):
     
     @jwt_required() 
     def post(self):
+        try:
+            data = request_body()
+        except PayloadTooLarge as e:
+            return error_413(str(e))
+        except ValueError as e:
+            return error_400(str(e))
+
         try:
             current_user_id = get_jwt_identity()
-            data = request.get_json()
 
             required = [
                 'device_id', 
@@ -25,9 +52,12 @@ class AndonResource(Resource):
                 'untrusted_processes'
             ]
             
-            if not all(field in data for field in required):
+            if not isinstance(data, dict) or not all(field in data for field in required):
                 return error_400("Missing required telemetry fields")
 
+            if _prefers_async():
+                return self._enqueue(data, current_user_id)
+
             analysis_log = AndonService.analyze_telemetry(data)
 
             LogService.create_log(
@@ -44,4 +74,167 @@ class AndonResource(Resource):
             try: user_id = get_jwt_identity()
             except: pass
             LogService.create_log("AI_ANALYSIS_ERROR", str(e), user_id=user_id)
-            return error_500(f"AI Engine Error: {str(e)}")
\ No newline at end of file
+            return error_500(f"AI Engine Error: {str(e)}")
+
+    def _enqueue(self, data, user_id):
+        try:
+            sample = AndonAnalysisSchema().load(data)
+        except ValidationError as err:
+            return error_400("Invalid telemetry sample", errors=err.messages)
+
+        try:
+            tracking_id = ingest_queue.submit(sample, user_id)
+        except queue.Full:
+            return error_429("Andon ingestion queue is full, retry later")
+
+        return success_202({
+            "tracking_id": tracking_id,
+            "status": "queued",
+            "status_url": f"/api/andon/analyze/{tracking_id}"
+        })
+
+class AndonStatusResource(Resource):
+
+    @jwt_required()
+    def get(self, tracking_id):
+        # Only the submitter sees a result; another user's tracking id is as unknown as a made-up one
+        current_user_id = get_jwt_identity()
+        result = ingest_queue.status(tracking_id, current_user_id)
+        if result is None:
+            # Result evicted from memory (or handled by another worker): fall back to the stored row
+            entry = db.session.get(Telemetry, tracking_id)
+            if entry is None or entry.user_id != current_user_id:
+                return error_404("Unknown tracking id")
+            result = {
+                "status": "done",
+                "andon_status": entry.andon_status,
+                "timestamp": entry.timestamp.isoformat()
+            }
+
+        return success_200({"tracking_id": tracking_id, **result})
+
+class AndonBatchResource(Resource):
+
+    @jwt_required()
+    def post(self):
+        try:
+            data = request_body(silent=True)
+        except PayloadTooLarge as e:
+            return error_413(str(e))
+
+        try:
+            current_user_id = get_jwt_identity()
+
+            if not isinstance(data, list) or not data:
+                return error_400("Expected a non-empty array of telemetry samples")
+
+            if len(data) > ANDON_BATCH_MAX_SIZE:
+                return error_400(f"Batch exceeds the limit of {ANDON_BATCH_MAX_SIZE} samples")
+
+            schema = AndonAnalysisSchema(many=True)
+            invalid = schema.validate(data)
+            errors = [
+                {"index": index, "errors": messages}
+                for index, messages in sorted(invalid.items())
+            ]
+
+            valid_indexes = [index for index in range(len(data)) if index not in invalid]
+            if not valid_indexes:
+                return error_400("No valid telemetry samples in batch", errors=errors)
+
+            samples = schema.load([data[index] for index in valid_indexes])
+            analysis_logs = AndonService.analyze_batch(samples)
+
+            LogService.create_log(
+                "AI_ANDON_BATCH_ANALYSIS",
+                f"Batch analysis: {len(analysis_logs)} scored, {len(errors)} rejected",
+                user_id=current_user_id
+            )
+
+            item_schema = AndonAnalysisSchema()
+            results = [
+                {"index": index, **item_schema.dump(analysis_log)}
+                for index, analysis_log in zip(valid_indexes, analysis_logs)
+            ]
+            return success_201({"results": results, "errors": errors})
+
+        except Exception as e:
+            user_id = None
+            try: user_id = get_jwt_identity()
+            except: pass
+            LogService.create_log("AI_ANALYSIS_ERROR", str(e), user_id=user_id)
+            return error_500(f"AI Engine Error: {str(e)}")
+
+class TelemetryHistoryResource(Resource):
+
+    @jwt_required()
+    def get(self):
+        try:
+            args = request.args
+            limit = parse_limit(args.get('limit'), TELEMETRY_PAGE_DEFAULT, TELEMETRY_PAGE_MAX)
+            andon_status = args.get('andon_status', type=int)
+            if 'andon_status' in args and andon_status is None:
+                return error_400("'andon_status' must be an integer")
+
+            rows, next_cursor = AndonService.history(
+                limit,
+                cursor=args.get('cursor'),
+                device_id=args.get('device_id'),
+                andon_status=andon_status,
+                since=parse_datetime(args.get('since'), 'since'),
+                until=parse_datetime(args.get('until'), 'until')
+            )
+            return success_200({
+                "data": AndonAnalysisSchema(many=True).dump(rows),
+                "next_cursor": next_cursor
+            })
+
+        except ValueError as e:
+            return error_400(str(e))
+        except Exception as e:
+            print(f"Error getting telemetry: {e}")
+            return error_500("An error occurred while fetching telemetry.")
+
+class TrendsResource(Resource):
+
+    @jwt_required()
+    def get(self):
+        try:
+            args = request.args
+            until = parse_datetime(args.get('until'), 'until') or datetime.utcnow()
+            since = parse_datetime(args.get('since'), 'since') or until - timedelta(hours=ANDON_TRENDS_DEFAULT_HOURS)
+            if since >= until:
+                return error_400("'since' must be earlier than 'until'")
+
+            return success_200(RollupService.trends(
+                since,
+                until,
+                device_id=args.get('device_id'),
+                granularity=args.get('granularity')
+            ))
+
+        except ValueError as e:
+            return error_400(str(e))
+        except Exception as e:
+            print(f"Error getting trends: {e}")
+            return error_500("An error occurred while fetching trends.")
+
+class DeviceListResource(Resource):
+
+    @jwt_required()
+    def get(self):
+        return success_200(device_store.devices())
+
+class DeviceRecentResource(Resource):
+
+    @jwt_required()
+    def get(self, device_id):
+        try:
+            limit = parse_limit(request.args.get('limit'), device_store.capacity, device_store.capacity)
+        except ValueError as e:
+            return error_400(str(e))
+
+        samples = device_store.recent(device_id, limit)
+        if samples is None:
+            return error_404(f"No recent telemetry for device {device_id}")
+        return success_200({"device_id": device_id, "data": samples})
@@ -0,0 +1,13 @@
+from flask_restful import Resource, Api
+from app.services.response_cache import response_cache
+from app.utils.httpResponses import success_200
+from flask_jwt_extended import jwt_required
+
+def initializeCacheRoutes(api: Api):
+    api.add_resource(ResponseCacheResource, '/api/cache')
+
+class ResponseCacheResource(Resource):
+
+    @jwt_required()
+    def get(self):
+        return success_200({"cache": response_cache.stats()})
@@ -1,7 +1,11 @@
 from flask import request
 from flask_restful import Resource, Api
 from app.services.log import LogService
-from app.utils.httpResponses import success_200, error_404, error_500
+from app.services.response_cache import response_cache, LOGS
+from app.utils.conditional import etag_for, not_modified, with_etag
+from app.utils.httpResponses import success_200, error_400, error_404, error_500
+from app.utils.pagination import parse_limit, parse_datetime
+from app.config import LOGS_PAGE_DEFAULT, LOGS_PAGE_MAX
 from flask_jwt_extended import jwt_required
 from app.extensions import ma 
 from marshmallow import fields 
@@ -23,13 +27,33 @@ class LogResource(Resource):
     @jwt_required()
     def get(self):
         try:
-            logs = LogService.getAll()
-            if not logs:
-                return success_200([]) 
-            
-            log_schema = LogSchema(many=True)
-            return success_200(log_schema.dump(logs)) 
-        
+            args = request.args
+            limit = parse_limit(args.get('limit'), LOGS_PAGE_DEFAULT, LOGS_PAGE_MAX)
+
+            params = {
+                "limit": limit,
+                "cursor": args.get('cursor'),
+                "action": args.get('action'),
+                "user_id": args.get('user_id'),
+                "since": parse_datetime(args.get('since'), 'since'),
+                "until": parse_datetime(args.get('until'), 'until')
+            }
+            etag = etag_for(LOGS, params)
+            unchanged = not_modified(etag)
+            if unchanged:
+                return unchanged
+
+            def page():
+                logs, next_cursor = LogService.get_page_rows(**params)
+                return {
+                    "data": logs,
+                    "next_cursor": next_cursor
+                }
+
+            return with_etag(success_200(response_cache.get_or_compute(LOGS, params, page)), etag)
+
+        except ValueError as e:
+            return error_400(str(e))
         except Exception as e:
             print(f"Error getting logs: {e}")
             return error_500("An error occurred while fetching logs.")
\ No newline at end of file
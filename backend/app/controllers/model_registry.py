@@ -0,0 +1,92 @@
+from flask import request, current_app
+from flask_restful import Resource, Api
+from app.extensions import db
+from app.models.user import User
+from app.ml_logic.registry import predictor_registry, UnknownModelVersion, ModelBusyError
+from app.services.shadow import shadow_evaluator
+from app.services.log import LogService
+from app.utils.httpResponses import success_200, success_202, error_400, error_403, error_404, error_409, error_500
+from flask_jwt_extended import jwt_required, get_jwt_identity
+
+def initializeModelRoutes(api: Api):
+    api.add_resource(ModelListResource, '/api/andon/models')
+    api.add_resource(ModelActivateResource, '/api/andon/models/active')
+    api.add_resource(ModelRollbackResource, '/api/andon/models/rollback')
+    api.add_resource(ShadowStatsResource, '/api/andon/shadow')
+
+def _admin_user():
+    """The current user when listed in ANDON_MODEL_ADMINS, otherwise None."""
+    user = db.session.get(User, get_jwt_identity())
+    if user is None or user.username not in current_app.config['ANDON_MODEL_ADMINS']:
+        return None
+    return user
+
+def _switched(version, user, wait, action):
+    LogService.create_log(action, f"Model version '{version}' requested by {user.username}", user_id=user.id)
+    if wait:
+        return success_200({"model": predictor_registry.status()}, message=f"Model version '{version}' is active")
+    return success_202({"version": version, "status": "loading", "status_url": "/api/andon/models"})
+
+class ModelListResource(Resource):
+
+    @jwt_required()
+    def get(self):
+        return success_200({
+            "model": predictor_registry.status(),
+            "data": predictor_registry.versions()
+        })
+
+class ModelActivateResource(Resource):
+
+    @jwt_required()
+    def put(self):
+        user = _admin_user()
+        if user is None:
+            return error_403("Only model administrators can switch model versions")
+
+        data = request.get_json(silent=True) or {}
+        version = data.get('version')
+        if not isinstance(version, str) or not version:
+            return error_400("'version' is required")
+        wait = bool(data.get('wait', False))
+
+        try:
+            predictor_registry.activate(version, wait=wait)
+        except UnknownModelVersion as e:
+            return error_404(str(e))
+        except ModelBusyError as e:
+            return error_409(str(e))
+        except Exception as e:
+            LogService.create_log("AI_MODEL_ACTIVATE_ERROR", f"{version}: {e}", user_id=user.id)
+            return error_500(f"Model version '{version}' failed to load: {e}")
+
+        return _switched(version, user, wait, "AI_MODEL_ACTIVATE")
+
+class ModelRollbackResource(Resource):
+
+    @jwt_required()
+    def post(self):
+        user = _admin_user()
+        if user is None:
+            return error_403("Only model administrators can switch model versions")
+
+        wait = bool((request.get_json(silent=True) or {}).get('wait', False))
+        try:
+            version = predictor_registry.rollback(wait=wait)
+        except (UnknownModelVersion, ModelBusyError) as e:
+            return error_409(str(e))
+        except Exception as e:
+            LogService.create_log("AI_MODEL_ROLLBACK_ERROR", str(e), user_id=user.id)
+            return error_500(f"Rollback failed: {e}")
+
+        return _switched(version, user, wait, "AI_MODEL_ROLLBACK")
+
+class ShadowStatsResource(Resource):
+
+    @jwt_required()
+    def get(self):
+        try:
+            return success_200({"shadow": shadow_evaluator.stats()})
+        except Exception as e:
+            print(f"Error getting shadow statistics: {e}")
+            return error_500("An error occurred while fetching shadow statistics.")
@@ -0,0 +1,30 @@
+from flask import Response
+from flask_restful import Resource, Api
+from app.services.events import event_hub
+from app.utils.httpResponses import error_503
+from flask_jwt_extended import jwt_required
+
+def initializeStreamRoutes(api: Api):
+    api.add_resource(StreamResource, '/api/stream')
+
+class StreamResource(Resource):
+
+    # EventSource cannot send headers: this route alone also takes ?jwt=<token>
+    @jwt_required(locations=["headers", "query_string"])
+    def get(self):
+        subscription = event_hub.subscribe()
+        if subscription is None:
+            return error_503("Too many event stream subscribers, retry later")
+
+        response = Response(
+            event_hub.stream(subscription),
+            mimetype='text/event-stream',
+            headers={
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'
+            }
+        )
+        # The generator's finally only runs once it has started; the server
+        # closes the response even when the client left before the first frame
+        response.call_on_close(lambda: event_hub.unsubscribe(subscription))
+        return response
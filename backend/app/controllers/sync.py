@@ -0,0 +1,34 @@
+from flask import request
+from flask_restful import Resource, Api
+from app.services.sync import SyncService
+from app.schemas.ticket import TicketSchema, LogSchema
+from app.services.response_cache import response_cache, TICKETS, LOGS
+from app.utils.conditional import etag_for, not_modified, with_etag
+from app.utils.httpResponses import success_200, error_400, error_500
+from flask_jwt_extended import jwt_required
+
+def initializeSyncRoutes(api: Api):
+    api.add_resource(SyncResource, '/api/sync')
+
+class SyncResource(Resource):
+
+    @jwt_required()
+    def get(self):
+        try:
+            since = request.args.get('since')
+            # Same cursor and unchanged tables: the delta is the one the client already has
+            etag = etag_for(TICKETS, {"sync": since, "logs": response_cache.version(LOGS)})
+            unchanged = not_modified(etag)
+            if unchanged:
+                return unchanged
+
+            changes = SyncService.changes(since)
+            changes["tickets"] = TicketSchema(many=True).dump(changes["tickets"])
+            changes["logs"] = LogSchema(many=True).dump(changes["logs"])
+            return with_etag(success_200(changes), etag)
+
+        except ValueError as e:
+            return error_400(str(e))
+        except Exception as e:
+            print(f"Error computing sync delta: {e}")
+            return error_500("An error occurred while computing changes.")
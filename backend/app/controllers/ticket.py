@@ -2,15 +2,54 @@ from flask import request
 from flask_restful import Resource, Api
 from app.services.ticket import TicketService
 from app.services.log import LogService
+from app.services.response_cache import response_cache, TICKETS
+from app.utils.conditional import etag_for, not_modified, with_etag
 from app.utils.httpResponses import success_200, success_201, error_400, error_404, error_500
 from app.schemas.ticket import TicketSchema
+from app.utils.pagination import parse_limit
+from app.config import TICKETS_PAGE_DEFAULT, TICKETS_PAGE_MAX
 from flask_jwt_extended import jwt_required, get_jwt_identity
 
 class TicketListResource(Resource):
     @jwt_required()
     def get(self):
-        tickets = TicketService.getAll()
-        return success_200(TicketSchema(many=True).dump(tickets))
+        try:
+            args = request.args
+            params = {
+                "limit": parse_limit(args.get('limit'), TICKETS_PAGE_DEFAULT, TICKETS_PAGE_MAX),
+                "cursor": args.get('cursor'),
+                "status": args.get('status'),
+                "priority": args.get('priority'),
+                "assignee_id": args.get('assignee_id'),
+                "creator": args.get('creator')
+            }
+            etag = etag_for(TICKETS, params)
+            unchanged = not_modified(etag)
+            if unchanged:
+                return unchanged
+
+            def page():
+                tickets, next_cursor = TicketService.get_page_rows(**params)
+                return {
+                    "data": tickets,
+                    "next_cursor": next_cursor
+                }
+
+            return with_etag(success_200(response_cache.get_or_compute(TICKETS, params, page)), etag)
+        except ValueError as e:
+            return error_400(str(e))
+
+class TicketSummaryResource(Resource):
+    @jwt_required()
+    def get(self):
+        try:
+            etag = etag_for(TICKETS, {"view": "summary"})
+            unchanged = not_modified(etag)
+            if unchanged:
+                return unchanged
+            return with_etag(success_200(TicketService.summary()), etag)
+        except Exception as e:
+            return error_500(str(e))
 
 class TicketCreateResource(Resource):
     @jwt_required()
@@ -25,6 +64,21 @@ class TicketCreateResource(Resource):
             return error_500(str(e))
 
 class TicketResource(Resource):
+    @jwt_required()
+    def get(self, ticket_id):
+        try:
+            etag = etag_for(TICKETS, {"id": ticket_id})
+            unchanged = not_modified(etag)
+            if unchanged:
+                return unchanged
+
+            ticket = TicketService.getById(ticket_id)
+            if not ticket:
+                return error_404("Ticket not found")
+            return with_etag(success_200(TicketSchema().dump(ticket)), etag)
+        except Exception as e:
+            return error_500(str(e))
+
     @jwt_required()
     def put(self, ticket_id):
         try:
@@ -41,4 +95,5 @@ class TicketResource(Resource):
 def initializeRoutes(api: Api):
     api.add_resource(TicketListResource, '/api/tickets')
     api.add_resource(TicketCreateResource, '/api/tickets')
+    api.add_resource(TicketSummaryResource, '/api/tickets/summary')
     api.add_resource(TicketResource, '/api/tickets/<string:ticket_id>')
\ No newline at end of file
@@ -0,0 +1,81 @@
+import threading
+from collections import OrderedDict
+import numpy as np
+
+class PredictionCache:
+    """
+    Bounded LRU of verdicts keyed by the quantized feature vector.
+
+    CPU and RAM are snapped to buckets of `cpu_step` / `ram_step`; threat and
+    process counts are kept exact. The verdict stored for a key is the one
+    for the bucket's own vector, so it does not depend on which sample filled
+    the entry first. Each AndonPredictor owns its cache, so loading another
+    model version starts from an empty one.
+    """
+
+    def __init__(self, capacity: int, cpu_step: float, ram_step: float):
+        self.capacity = capacity
+        self.cpu_step = cpu_step
+        self.ram_step = ram_step
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def keys(self, features: np.ndarray) -> list[tuple]:
+        """Bucket indices of an N x 4 matrix (cpu, ram, threats, untrusted)."""
+        buckets = np.column_stack([
+            np.rint(features[:, 0] / self.cpu_step),
+            np.rint(features[:, 1] / self.ram_step),
+            np.rint(features[:, 2:4])
+        ]).astype(np.int64)
+        return [tuple(row) for row in buckets.tolist()]
+
+    def vectors(self, keys) -> np.ndarray:
+        """Feature vectors the verdicts are computed on, one per key."""
+        buckets = np.asarray(keys, dtype=float).reshape(-1, 4)
+        return buckets * np.array([self.cpu_step, self.ram_step, 1.0, 1.0])
+
+    def get_many(self, keys) -> list:
+        """Cached verdicts (None for a miss), updating the hit/miss counters."""
+        with self._lock:
+            found = []
+            for key in keys:
+                value = self._entries.get(key)
+                if value is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                found.append(value)
+            return found
+
+    def put_many(self, keys, values):
+        with self._lock:
+            for key, value in zip(keys, values):
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "capacity": self.capacity,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "cpu_step": self.cpu_step,
+                "ram_step": self.ram_step
+            }
+
+__all__ = [
+    "PredictionCache",
+]
@@ -1,24 +1,81 @@
 import joblib
 import os
 import numpy as np
+from app.ml_logic.cache import PredictionCache
+from app.ml_logic.native import NativeSVM
+from app.config import (
+    ANDON_INFERENCE_BACKEND,
+    ANDON_CACHE_SIZE,
+    ANDON_CACHE_CPU_STEP,
+    ANDON_CACHE_RAM_STEP
+)
+
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(__file__), 'svm_andon_model.pkl')
 
 class AndonPredictor:
-    def __init__(self):
-        base_path = os.path.dirname(__file__)
-        model_path = os.path.join(base_path, 'svm_andon_model.pkl')
-        
+    def __init__(
+        self,
+        model_path: str = DEFAULT_MODEL_PATH,
+        mmap_mode: str = None,
+        version: str = None,
+        backend: str = ANDON_INFERENCE_BACKEND,
+        cache_size: int = ANDON_CACHE_SIZE
+    ):
+        model_name = os.path.basename(model_path)
+        self.version = version or os.path.splitext(model_name)[0]
+
         try:
-            self.model = joblib.load(model_path)
-            print("✨ AI Model 'svm_andon_model.pkl' loaded successfully!")
+            # mmap_mode='r' maps the model's NumPy arrays from the page cache, shared by every worker
+            self.model = joblib.load(model_path, mmap_mode=mmap_mode)
+            print(f"✨ AI Model '{model_name}' loaded successfully!")
         except Exception as e:
             print(f"⚠️ Error loading AI Model: {e}")
             self.model = None
 
+        # 'native' evaluates the SVM with NumPy; anything it cannot replicate stays on sklearn
+        self.engine = None
+        if self.model is not None and backend == 'native':
+            try:
+                self.engine = NativeSVM.from_model(self.model)
+            except Exception as e:
+                print(f"⚠️ Native inference unavailable for '{model_name}', using scikit-learn: {e}")
+
+        # Optional memoization of verdicts by quantized feature vector (0 disables it)
+        self.cache = None
+        if cache_size > 0:
+            self.cache = PredictionCache(cache_size, ANDON_CACHE_CPU_STEP, ANDON_CACHE_RAM_STEP)
+
     def predict(self, cpu, ram, threats, untrusted):
         if self.model is None:
             return None
         
-        features = np.array([[cpu, ram, threats, untrusted]])
-        prediction = self.model.predict(features)
-        
-        return int(prediction[0])
\ No newline at end of file
+        features = np.array([[cpu, ram, threats, untrusted]], dtype=float)
+        return self._score(features)[0]
+
+    def predict_batch(self, rows):
+        """Scores an N x 4 matrix (cpu, ram, threats, untrusted) in a single model call."""
+        if self.model is None:
+            return [None] * len(rows)
+        if len(rows) == 0:
+            return []
+
+        features = np.asarray(rows, dtype=float).reshape(-1, 4)
+        return self._score(features)
+
+    def _score(self, features) -> list[int]:
+        if self.cache is None:
+            return [int(p) for p in self._model_predict(features)]
+
+        keys = self.cache.keys(features)
+        results = self.cache.get_many(keys)
+        missing = list(dict.fromkeys(key for key, result in zip(keys, results) if result is None))
+        if missing:
+            computed = dict(zip(missing, (int(p) for p in self._model_predict(self.cache.vectors(missing)))))
+            self.cache.put_many(computed.keys(), computed.values())
+            results = [computed[key] if result is None else result for key, result in zip(keys, results)]
+        return results
+
+    def _model_predict(self, features):
+        if self.engine is not None:
+            return self.engine.predict(features)
+        return self.model.predict(features)
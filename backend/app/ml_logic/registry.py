@@ -0,0 +1,306 @@
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from app.ml_logic.predictor import AndonPredictor
+from app.config import (
+    ANDON_MODEL_DIR,
+    ANDON_MODEL_VERSION,
+    ANDON_MODEL_STATE_DIR,
+    ANDON_MODEL_MMAP,
+    ANDON_MODEL_WATCH_SECONDS,
+    ANDON_MODEL_KEEP_LOADED
+)
+
+ACTIVE_FILE = 'ACTIVE'
+MODEL_SUFFIX = '.pkl'
+
+# Scored once by every new version before it is swapped in
+WARMUP_SAMPLE = (12.0, 14.5, 0, 0)
+
+class UnknownModelVersion(LookupError):
+    pass
+
+class ModelBusyError(RuntimeError):
+    pass
+
+class PredictorRegistry:
+    """
+    Owns the process-wide AndonPredictor and the versions it can switch to.
+
+    Every <version>.pkl in `model_dir` is a version; the ACTIVE file in
+    `state_dir` (`model_dir` by default) names the one in use. The model is loaded on first use, so workers that never
+    score telemetry never import scikit-learn. Calling preload() in a
+    pre-fork master (e.g. gunicorn --preload) loads it once and lets the
+    forked workers share its pages copy-on-write.
+
+    activate() loads a version in a background thread, warms it with one
+    prediction and swaps it in with a single assignment: requests keep
+    using the old predictor until then. The last `keep_loaded` versions
+    stay in memory for instant rollback. A watcher thread per process polls
+    ACTIVE so every worker follows a switch made through any of them.
+    """
+
+    def __init__(
+        self,
+        model_dir: str = ANDON_MODEL_DIR,
+        default_version: str = ANDON_MODEL_VERSION,
+        state_dir: str = ANDON_MODEL_STATE_DIR,
+        mmap: bool = ANDON_MODEL_MMAP,
+        watch_interval: float = ANDON_MODEL_WATCH_SECONDS,
+        keep_loaded: int = ANDON_MODEL_KEEP_LOADED
+    ):
+        self.model_dir = model_dir
+        self.default_version = default_version
+        self.state_dir = state_dir
+        self.mmap = mmap
+        self.watch_interval = watch_interval
+        self.keep_loaded = keep_loaded
+        self.last_error = None
+
+        self._active = None
+        self._loaded = OrderedDict()
+        self._history = []
+        self._loading = None
+        self._rejected = None
+        self._lock = threading.Lock()
+        self._swap_lock = threading.Lock()
+        self._watcher_pid = None
+        self._stopping = threading.Event()
+
+    def init_app(self, app):
+        config = app.config
+        settings = (
+            config['ANDON_MODEL_DIR'],
+            config['ANDON_MODEL_VERSION'],
+            config['ANDON_MODEL_STATE_DIR'],
+            config['ANDON_MODEL_MMAP'],
+            config['ANDON_MODEL_WATCH_SECONDS']
+        )
+        if settings != (self.model_dir, self.default_version, self.state_dir, self.mmap, self.watch_interval):
+            with self._lock:
+                self.model_dir, self.default_version, self.state_dir, self.mmap, self.watch_interval = settings
+                self._active = None
+                self._loaded.clear()
+                self._history = []
+
+    def get(self) -> AndonPredictor:
+        self._ensure_watcher()
+        predictor = self._active
+        if predictor is None:
+            with self._lock:
+                if self._active is None:
+                    version = self.active_version()
+                    self._active = self._remember(version, self._load(version))
+                predictor = self._active
+        return predictor
+
+    def preload(self) -> AndonPredictor:
+        return self.get()
+
+    def is_loaded(self) -> bool:
+        return self._active is not None
+
+    def load(self, version: str) -> AndonPredictor:
+        """A predictor for `version` that is not swapped in (already loaded versions are reused)."""
+        predictor = self._loaded.get(version)
+        if predictor is not None:
+            return predictor
+        self.artifact_path(version)
+        return self._load(version)
+
+    def artifact_path(self, version: str) -> str:
+        """Path of the artifact of `version`. Raises UnknownModelVersion when it does not exist."""
+        path = self._path(version)
+        if not os.path.isfile(path):
+            raise UnknownModelVersion(f"Unknown model version '{version}'")
+        return path
+
+    def active_version(self) -> str:
+        """Version named by the ACTIVE file (the default version when there is none)."""
+        try:
+            with open(self._active_path()) as pointer:
+                return pointer.read().strip() or self.default_version
+        except FileNotFoundError:
+            return self.default_version
+
+    def versions(self) -> list[dict]:
+        """Artifacts available in the registry directory, newest first."""
+        active = self._active.version if self._active else self.active_version()
+        result = []
+        for name in os.listdir(self.model_dir):
+            if not name.endswith(MODEL_SUFFIX):
+                continue
+            stat = os.stat(os.path.join(self.model_dir, name))
+            version = name[:-len(MODEL_SUFFIX)]
+            result.append({
+                "version": version,
+                "size_bytes": stat.st_size,
+                "modified": datetime.utcfromtimestamp(stat.st_mtime).isoformat(),
+                "active": version == active,
+                "loaded": version in self._loaded
+            })
+        return sorted(result, key=lambda item: item["modified"], reverse=True)
+
+    def status(self) -> dict:
+        return {
+            "active": self._active.version if self._active else self.active_version(),
+            "loading": self._loading,
+            "previous": self._history[-1] if self._history else None,
+            "last_error": self.last_error,
+            "cache": self._active.cache.stats() if self._active and self._active.cache else None
+        }
+
+    def activate(self, version: str, wait: bool = False, persist: bool = True) -> threading.Thread:
+        """
+        Loads `version` in the background and swaps it in once warmed up.
+        Raises UnknownModelVersion for a missing artifact and ModelBusyError
+        while another version is loading. With wait=True the call blocks and
+        re-raises a failed load.
+        """
+        self.artifact_path(version)
+        if not self._swap_lock.acquire(blocking=False):
+            raise ModelBusyError(f"Model version '{self._loading}' is still loading")
+
+        self._loading = version
+        errors = []
+        thread = threading.Thread(
+            target=self._swap,
+            args=(version, persist, errors),
+            name=f"andon-model-{version}",
+            daemon=True
+        )
+        thread.start()
+        if wait:
+            thread.join()
+            if errors:
+                raise errors[0]
+        return thread
+
+    def rollback(self, wait: bool = False) -> str:
+        """Switches back to the version that was active before the current one."""
+        if not self._history:
+            raise UnknownModelVersion("No previous model version to roll back to")
+        version = self._history[-1]
+        self.activate(version, wait=wait)
+        return version
+
+    def refresh(self):
+        """Follows the ACTIVE file when another process switched versions; returns the loading thread, if any."""
+        if self._active is None or self._loading is not None:
+            return None
+        version = self.active_version()
+        # A rejected version is retried once its artifact changes on disk (e.g. a repaired upload)
+        if version != self._active.version and self._artifact_key(version) != self._rejected:
+            try:
+                return self.activate(version, persist=False)
+            except ModelBusyError:
+                # A load started in between: not a verdict on this version, the next tick retries it
+                pass
+            except UnknownModelVersion as e:
+                self.last_error = str(e)
+                self._rejected = self._artifact_key(version)
+        return None
+
+    def stop(self):
+        self._stopping.set()
+
+    def _swap(self, version, persist, errors):
+        try:
+            predictor = self._loaded.get(version)
+            if predictor is None or predictor.artifact_mtime != os.path.getmtime(self._path(version)):
+                # Artifact replaced on disk: reload it (with an empty prediction cache)
+                predictor = self._load(version)
+            if predictor.predict(*WARMUP_SAMPLE) is None:
+                raise ValueError(f"Model version '{version}' could not be loaded")
+
+            with self._lock:
+                previous = self._active
+                self._active = self._remember(version, predictor)
+                if previous is not None and previous.version != version:
+                    kept = [v for v in self._history if v not in (version, previous.version)]
+                    self._history = kept + [previous.version]
+            if persist:
+                self._write_active(version)
+            self.last_error = None
+            self._rejected = None
+            print(f"✨ AI Model version '{version}' is now active.")
+        except Exception as e:
+            self.last_error = f"{version}: {e}"
+            self._rejected = self._artifact_key(version)
+            print(f"⚠️ Error activating AI Model version '{version}': {e}")
+            errors.append(e)
+        finally:
+            self._loading = None
+            self._swap_lock.release()
+
+    def _remember(self, version, predictor) -> AndonPredictor:
+        # Keeps the newest loaded versions (the active one included) for instant rollback
+        self._loaded[version] = predictor
+        self._loaded.move_to_end(version)
+        while len(self._loaded) > self.keep_loaded:
+            self._loaded.popitem(last=False)
+        return predictor
+
+    def _load(self, version) -> AndonPredictor:
+        path = self._path(version)
+        mtime = os.path.getmtime(path) if os.path.exists(path) else None
+        predictor = AndonPredictor(path, mmap_mode='r' if self.mmap else None, version=version)
+        if predictor.model is None and self.mmap:
+            # Compressed or non-joblib artifacts cannot be memory-mapped
+            predictor = AndonPredictor(path, version=version)
+        predictor.artifact_mtime = mtime
+        return predictor
+
+    def _path(self, version) -> str:
+        if not version or os.path.basename(version) != version:
+            raise UnknownModelVersion(f"Invalid model version '{version}'")
+        return os.path.join(self.model_dir, version + MODEL_SUFFIX)
+
+    def _artifact_key(self, version):
+        # Identifies one build of an artifact: (version, mtime, size), with None for a missing file
+        try:
+            stat = os.stat(self._path(version))
+            return (version, stat.st_mtime_ns, stat.st_size)
+        except (OSError, UnknownModelVersion):
+            return (version, None, None)
+
+    def _active_path(self) -> str:
+        return os.path.join(self.state_dir or self.model_dir, ACTIVE_FILE)
+
+    def _write_active(self, version):
+        # Written to a temporary file and renamed, so readers never see a partial name
+        path = self._active_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as pointer:
+            pointer.write(version)
+        os.replace(temporary, path)
+
+    def _ensure_watcher(self):
+        # One polling thread per process (threads do not survive fork)
+        if self.watch_interval <= 0 or self._watcher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._watcher_pid == os.getpid():
+                return
+            self._stopping.clear()
+            threading.Thread(target=self._watch, name="andon-model-watcher", daemon=True).start()
+            self._watcher_pid = os.getpid()
+
+    def _watch(self):
+        while not self._stopping.wait(self.watch_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                self.last_error = str(e)
+
+predictor_registry = PredictorRegistry()
+
+__all__ = [
+    "ModelBusyError",
+    "PredictorRegistry",
+    "UnknownModelVersion",
+    "WARMUP_SAMPLE",
+    "predictor_registry",
+]
@@ -4,6 +4,11 @@ from datetime import datetime
 
 class Log(db.Model):
     __tablename__ = 'logs'
+    __table_args__ = (
+        db.Index('ix_logs_timestamp_id', 'timestamp', 'id'),
+        db.Index('ix_logs_action_timestamp', 'action', 'timestamp'),
+        db.Index('ix_logs_user_timestamp', 'user_id', 'timestamp'),
+    )
     
     id = db.Column(
         db.String(36), 
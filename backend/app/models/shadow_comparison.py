@@ -0,0 +1,48 @@
+from app.extensions import db
+
+class ShadowComparison(db.Model):
+    """Verdicts of the shadow model against the primary one, counted per (versions, primary class, shadow class)."""
+    __tablename__ = 'shadow_comparisons'
+
+    primary_version = db.Column(
+        db.String(64), 
+        primary_key=True
+    )
+    shadow_version = db.Column(
+        db.String(64), 
+        primary_key=True
+    )
+    primary_status = db.Column(
+        db.Integer, 
+        primary_key=True
+    )
+    shadow_status = db.Column(
+        db.Integer, 
+        primary_key=True
+    )
+    count = db.Column(
+        db.Integer, 
+        default=0, 
+        nullable=False
+    )
+    latency_ms_total = db.Column(
+        db.Float, 
+        default=0.0, 
+        nullable=False
+    )
+    latency_ms_max = db.Column(
+        db.Float, 
+        default=0.0, 
+        nullable=False
+    )
+
+    def to_json(self):
+        return {
+            "primary_version": self.primary_version,
+            "shadow_version": self.shadow_version,
+            "primary_status": self.primary_status,
+            "shadow_status": self.shadow_status,
+            "count": self.count,
+            "latency_ms_total": self.latency_ms_total,
+            "latency_ms_max": self.latency_ms_max
+        }
@@ -0,0 +1,77 @@
+from app.extensions import db
+import uuid
+from datetime import datetime
+
+class Telemetry(db.Model):
+    """One scored Andon sample. Kept apart from the audit `logs` so device/status queries are index range scans."""
+    __tablename__ = 'telemetry'
+    __table_args__ = (
+        db.Index('ix_telemetry_device_timestamp', 'device_id', 'timestamp'),
+        db.Index('ix_telemetry_status_timestamp', 'andon_status', 'timestamp'),
+    )
+
+    id = db.Column(
+        db.String(36), 
+        primary_key=True, 
+        default=lambda: str(uuid.uuid4())
+    )
+
+    device_id = db.Column(
+        db.String(64), 
+        nullable=False
+    )
+
+    timestamp = db.Column(
+        db.DateTime, 
+        default=datetime.utcnow, 
+        nullable=False
+    )
+
+    cpu_usage_pct = db.Column(
+        db.Float, 
+        nullable=False
+    )
+
+    mem_available_gb = db.Column(
+        db.Float, 
+        nullable=False
+    )
+
+    active_threats = db.Column(
+        db.Integer, 
+        nullable=False
+    )
+
+    untrusted_processes = db.Column(
+        db.Integer, 
+        nullable=False
+    )
+
+    andon_status = db.Column(
+        db.Integer, 
+        nullable=True
+    ) # 0, 1 ou 2
+
+    model_version = db.Column(
+        db.String(64), 
+        nullable=True
+    ) # versão do modelo que gerou o veredito
+
+    user_id = db.Column(
+        db.String(36), 
+        db.ForeignKey('users.id'), 
+        nullable=True
+    ) # quem enviou a amostra assíncrona (dono do tracking id)
+
+    def to_json(self):
+        return {
+            "id": self.id,
+            "device_id": self.device_id,
+            "timestamp": self.timestamp.isoformat(),
+            "cpu_usage_pct": self.cpu_usage_pct,
+            "mem_available_gb": self.mem_available_gb,
+            "active_threats": self.active_threats,
+            "untrusted_processes": self.untrusted_processes,
+            "andon_status": self.andon_status,
+            "model_version": self.model_version
+        }
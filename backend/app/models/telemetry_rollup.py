@@ -0,0 +1,87 @@
+from app.extensions import db
+
+class TelemetryRollup(db.Model):
+    """
+    Aggregates of one device's telemetry over one minute, hour or day bucket,
+    maintained at write time by RollupService. Means are sum / count.
+    """
+    __tablename__ = 'telemetry_rollups'
+    __table_args__ = (
+        db.Index('ix_telemetry_rollups_granularity_bucket', 'granularity', 'bucket'),
+    )
+
+    granularity = db.Column(
+        db.String(6), 
+        primary_key=True
+    ) # minute, hour ou day
+
+    device_id = db.Column(
+        db.String(64), 
+        primary_key=True
+    )
+
+    bucket = db.Column(
+        db.DateTime, 
+        primary_key=True
+    ) # início do intervalo (UTC)
+
+    count = db.Column(
+        db.Integer, 
+        default=0, 
+        nullable=False
+    )
+
+    cpu_min = db.Column(
+        db.Float, 
+        nullable=False
+    )
+
+    cpu_max = db.Column(
+        db.Float, 
+        nullable=False
+    )
+
+    cpu_sum = db.Column(
+        db.Float, 
+        nullable=False
+    )
+
+    mem_min = db.Column(
+        db.Float, 
+        nullable=False
+    )
+
+    mem_max = db.Column(
+        db.Float, 
+        nullable=False
+    )
+
+    mem_sum = db.Column(
+        db.Float, 
+        nullable=False
+    )
+
+    # Veredictos por status (0-Normal, 1-Warning, 2-Critical, sem veredito)
+    status_normal = db.Column(
+        db.Integer, 
+        default=0, 
+        nullable=False
+    )
+
+    status_warning = db.Column(
+        db.Integer, 
+        default=0, 
+        nullable=False
+    )
+
+    status_critical = db.Column(
+        db.Integer, 
+        default=0, 
+        nullable=False
+    )
+
+    status_unknown = db.Column(
+        db.Integer, 
+        default=0, 
+        nullable=False
+    )
@@ -2,9 +2,27 @@ from app.extensions import db
 import uuid
 from datetime import datetime
 from flask import Flask
+from app.models.attachment import Attachment  # registers the mapper behind Ticket.attachments
+
+# Board ordering: High > Middle > Low (unknown priorities sort last)
+PRIORITY_RANK = {
+    'high': 2,
+    'middle': 1,
+    'low': 0
+}
+
+def rank_of(priority) -> int:
+    return PRIORITY_RANK.get((priority or '').lower(), -1)
 
 class Ticket(db.Model):
     __tablename__ = 'tickets'
+    __table_args__ = (
+        # Board order (priority_rank, created_at, id DESC), with and without a status filter
+        db.Index('ix_tickets_status_rank_created', 'status', 'priority_rank', 'created_at', 'id'),
+        db.Index('ix_tickets_rank_created', 'priority_rank', 'created_at', 'id'),
+        db.Index('ix_tickets_assignee_status', 'assignee_id', 'status'),
+        db.Index('ix_tickets_updated_at', 'updated_at'),
+    )
     id = db.Column(
         db.String(36), 
         primary_key=True, 
@@ -29,6 +47,12 @@ class Ticket(db.Model):
         default='high', 
         nullable=False
     )
+    # PRIORITY_RANK of `priority`, stored so the board order is an index scan
+    priority_rank = db.Column(
+        db.Integer, 
+        default=lambda context: rank_of(context.get_current_parameters().get('priority')), 
+        nullable=True
+    ) # nullable only so ALTER TABLE can add it to older databases (filled in at startup)
     created_at = db.Column(
         db.DateTime, 
         default=datetime.utcnow
@@ -54,7 +78,9 @@ class Ticket(db.Model):
         db.ForeignKey('users.id')
     ) 
     
-    attachments = db.Column(
+    # Legacy free-text column; files live in the attachments table (Ticket.attachments)
+    attachments_info = db.Column(
+        'attachments',
         db.String(300), 
         default='...', 
         nullable=True
@@ -70,6 +96,11 @@ class Ticket(db.Model):
         foreign_keys=[assignee_id], 
         back_populates='tickets_assigned'
     )
+    attachments = db.relationship(
+        'Attachment', 
+        back_populates='ticket', 
+        cascade='all, delete-orphan'
+    )
 
     def to_json(self):
         return {
@@ -83,5 +114,5 @@ class Ticket(db.Model):
             'priority': self.priority,
             'assignee_id': self.assignee_id,
             'comments': self.comments,
-            'attachments': [attachment.to_json() for attachment in self.attachments] if self.attachments else []
+            'attachments': [attachment.to_json() for attachment in self.attachments]
         }
\ No newline at end of file
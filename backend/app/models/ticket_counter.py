@@ -0,0 +1,26 @@
+from app.extensions import db
+
+class TicketCounter(db.Model):
+    """Number of tickets per (status, priority), maintained at write time by TicketService."""
+    __tablename__ = 'ticket_counters'
+
+    status = db.Column(
+        db.String(20), 
+        primary_key=True
+    )
+    priority = db.Column(
+        db.String(20), 
+        primary_key=True
+    )
+    count = db.Column(
+        db.Integer, 
+        default=0, 
+        nullable=False
+    )
+
+    def to_json(self):
+        return {
+            "status": self.status,
+            "priority": self.priority,
+            "count": self.count
+        }
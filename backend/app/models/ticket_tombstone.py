@@ -0,0 +1,23 @@
+from app.extensions import db
+from datetime import datetime
+
+class TicketTombstone(db.Model):
+    """Marker left by a hard delete so /api/sync can tell clients which tickets disappeared."""
+    __tablename__ = 'ticket_tombstones'
+
+    ticket_id = db.Column(
+        db.String(36), 
+        primary_key=True
+    )
+    deleted_at = db.Column(
+        db.DateTime, 
+        default=datetime.utcnow, 
+        nullable=False, 
+        index=True
+    )
+
+    def to_json(self):
+        return {
+            "ticket_id": self.ticket_id,
+            "deleted_at": self.deleted_at.isoformat()
+        }
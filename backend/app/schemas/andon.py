@@ -52,6 +52,13 @@ class AndonAnalysisSchema(Schema):
         }
     )
 
+    model_version = fields.Str(
+        dump_only=True, 
+        metadata={
+            "description": "Versão do modelo que gerou o veredito"
+        }
+    )
+
     class Meta:
         ordered = True
         unknown = EXCLUDE
@@ -1,14 +1,29 @@
+from datetime import datetime
 from app.extensions import db
-from app.models.log import Log
-from app.ml_logic.predictor import AndonPredictor
+from app.models.telemetry import Telemetry
+from app.utils.pagination import encode_cursor, decode_cursor, parse_datetime
+from sqlalchemy import desc, tuple_
+from app.ml_logic.registry import predictor_registry
+from app.services.events import event_hub
+from app.services.device_store import device_store
+from app.services.shadow import shadow_evaluator
+from app.services.rollups import RollupService
+from app.utils.deadline import check_deadline
 
-ai_engine = AndonPredictor()
+FEATURE_FIELDS = (
+    'cpu_usage_pct',
+    'mem_available_gb',
+    'active_threats',
+    'untrusted_processes'
+)
 
 class AndonService:
     @staticmethod
-    def analyze_telemetry(data: dict) -> Log:
+    def analyze_telemetry(data: dict) -> Telemetry:
         try:
-            prediction = ai_engine.predict(
+            # One predictor per call: a concurrent model swap cannot mix versions
+            predictor = predictor_registry.get()
+            prediction = predictor.predict(
                 cpu=float(
                     data['cpu_usage_pct']
                 ),
@@ -22,21 +37,120 @@ class AndonService:
                     data['untrusted_processes']
                 )
             )
+            check_deadline()
 
-            new_entry = Log(
-                action="AI_ANDON_ANALYSIS",
-                details=f"Device: {data.get('device_id')}",
-                cpu_usage=data['cpu_usage_pct'],
-                ram_usage=data['mem_available_gb'],
-                active_threats=data['active_threats'],
-                untrusted_processes=data['untrusted_processes'],
-                andon_status=prediction
-            )
+            new_entry = _build_entry(data, prediction, model_version=predictor.version)
 
             db.session.add(new_entry)
+            RollupService.record([new_entry])
             db.session.commit()
+            device_store.record([new_entry])
+            shadow_evaluator.submit([[data[field] for field in FEATURE_FIELDS]], [prediction], predictor.version)
+            event_hub.publish("andon.analysis", _analysis_event(new_entry))
             return new_entry
 
         except Exception as e:
             db.session.rollback()
-            raise e
\ No newline at end of file
+            raise e
+
+    @staticmethod
+    def analyze_batch(samples: list[dict], ids: list[str] = None, user_ids: list[str] = None) -> list[Telemetry]:
+        """
+        Scores every sample in one model call and persists all rows in a single
+        transaction. `ids` and `user_ids` (the submitter of each sample) are optional.
+        """
+        if not samples:
+            return []
+
+        ids = ids or [None] * len(samples)
+        user_ids = user_ids or [None] * len(samples)
+
+        try:
+            rows = [[sample[field] for field in FEATURE_FIELDS] for sample in samples]
+            predictor = predictor_registry.get()
+            predictions = predictor.predict_batch(rows)
+            check_deadline()
+
+            entries = [
+                _build_entry(sample, prediction, entry_id, predictor.version, user_id)
+                for sample, prediction, entry_id, user_id in zip(samples, predictions, ids, user_ids)
+            ]
+
+            db.session.add_all(entries)
+            RollupService.record(entries)
+            db.session.commit()
+            device_store.record(entries)
+            shadow_evaluator.submit(rows, predictions, predictor.version)
+            event_hub.publish("andon.batch", {
+                "count": len(entries),
+                "alerts": [
+                    _analysis_event(entry)
+                    for entry in entries
+                    if entry.andon_status
+                ]
+            })
+            return entries
+
+        except Exception as e:
+            db.session.rollback()
+            raise e
+
+    @staticmethod
+    def history(
+        limit: int,
+        cursor: str = None,
+        device_id: str = None,
+        andon_status: int = None,
+        since=None,
+        until=None
+    ) -> tuple[list[Telemetry], str]:
+        """Newest-first telemetry, keyset paginated on (timestamp, id)."""
+        query = Telemetry.query
+
+        if device_id:
+            query = query.filter(Telemetry.device_id == device_id)
+        if andon_status is not None:
+            query = query.filter(Telemetry.andon_status == andon_status)
+        if since:
+            query = query.filter(Telemetry.timestamp >= since)
+        if until:
+            query = query.filter(Telemetry.timestamp < until)
+
+        if cursor:
+            last_timestamp, last_id = decode_cursor(cursor, 2)
+            query = query.filter(
+                tuple_(Telemetry.timestamp, Telemetry.id) < (parse_datetime(last_timestamp, 'cursor'), last_id)
+            )
+
+        rows = query.order_by(desc(Telemetry.timestamp), desc(Telemetry.id)).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].timestamp, rows[-1].id)
+        return rows, next_cursor
+
+def _build_entry(sample: dict, prediction, entry_id: str = None, model_version: str = None, user_id: str = None) -> Telemetry:
+    entry = Telemetry(
+        device_id=str(sample['device_id']),
+        cpu_usage_pct=float(sample['cpu_usage_pct']),
+        mem_available_gb=float(sample['mem_available_gb']),
+        active_threats=int(sample['active_threats']),
+        untrusted_processes=int(sample['untrusted_processes']),
+        andon_status=prediction,
+        model_version=model_version,
+        user_id=user_id,
+        timestamp=datetime.utcnow()
+    )
+    if entry_id:
+        entry.id = entry_id
+    return entry
+
+def _analysis_event(entry: Telemetry) -> dict:
+    return {
+        "id": entry.id,
+        "device_id": entry.device_id,
+        "andon_status": entry.andon_status,
+        "model_version": entry.model_version,
+        "timestamp": entry.timestamp.isoformat()
+    }
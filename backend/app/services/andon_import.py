@@ -0,0 +1,103 @@
+import time
+import uuid
+from datetime import datetime
+from itertools import islice
+
+from app.extensions import db
+from app.models.telemetry import Telemetry
+from app.ml_logic.registry import predictor_registry
+from app.services.andon import FEATURE_FIELDS
+from app.services.rollups import RollupService
+from app.utils.pagination import parse_datetime
+from app.config import ANDON_IMPORT_CHUNK_SIZE
+
+class ImportReport:
+    """Running totals of one bulk import."""
+
+    def __init__(self):
+        self.imported = 0
+        self.rejected = 0
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+        return self.imported / self.elapsed if self.elapsed else 0.0
+
+    def to_json(self):
+        return {
+            "imported": self.imported,
+            "rejected": self.rejected,
+            "seconds": round(self.elapsed, 3),
+            "records_per_second": round(self.rate, 1)
+        }
+
+def import_telemetry(records, chunk_size: int = ANDON_IMPORT_CHUNK_SIZE, on_chunk=None) -> ImportReport:
+    """
+    Scores and stores an iterable of telemetry records, `chunk_size` at a
+    time: one model call and one multi-row INSERT per chunk, each chunk in
+    its own transaction. Records are either API-shaped (flat features) or
+    exports with a nested `metrics` object; an ISO `timestamp` is kept.
+    Invalid records are counted and skipped. Needs an app context.
+    """
+    records = iter(records)
+    predictor = predictor_registry.get()
+    report = ImportReport()
+
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return report
+
+        rows = []
+        for record in chunk:
+            row = _normalize(record)
+            if row is None:
+                report.rejected += 1
+            else:
+                rows.append(row)
+
+        if rows:
+            verdicts = predictor.predict_batch([[row[field] for field in FEATURE_FIELDS] for row in rows])
+            for row, verdict in zip(rows, verdicts):
+                row["andon_status"] = verdict
+                row["model_version"] = predictor.version
+
+            try:
+                db.session.execute(Telemetry.__table__.insert(), rows)
+                RollupService.record(rows)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                raise e
+            report.imported += len(rows)
+
+        if on_chunk:
+            on_chunk(report)
+
+def _normalize(record):
+    """Row dict for the telemetry table, or None when the record is unusable."""
+    if not isinstance(record, dict):
+        return None
+    metrics = record.get('metrics') if isinstance(record.get('metrics'), dict) else record
+
+    try:
+        return {
+            "id": str(uuid.uuid4()),
+            "device_id": str(record['device_id']),
+            "timestamp": parse_datetime(record.get('timestamp'), 'timestamp') or datetime.utcnow(),
+            "cpu_usage_pct": float(metrics['cpu_usage_pct']),
+            "mem_available_gb": float(metrics['mem_available_gb']),
+            "active_threats": int(metrics['active_threats']),
+            "untrusted_processes": int(metrics['untrusted_processes'])
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+
+__all__ = [
+    "ImportReport",
+    "import_telemetry",
+]
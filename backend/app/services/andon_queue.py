@@ -0,0 +1,173 @@
+import atexit
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from app.config import (
+    ANDON_ASYNC_QUEUE_SIZE,
+    ANDON_ASYNC_WORKERS,
+    ANDON_ASYNC_BATCH_SIZE,
+    ANDON_ASYNC_LINGER_MS,
+    ANDON_ASYNC_RESULTS_SIZE
+)
+
+class AndonIngestQueue:
+    """
+    Bounded in-process queue for asynchronous Andon analysis.
+
+    Requests only validate and enqueue; a small pool of worker threads drains
+    the queue, scores samples in micro-batches and persists each batch in one
+    transaction through AndonService.analyze_batch.
+    """
+
+    def __init__(
+        self,
+        maxsize=ANDON_ASYNC_QUEUE_SIZE,
+        workers=ANDON_ASYNC_WORKERS,
+        batch_size=ANDON_ASYNC_BATCH_SIZE,
+        linger_ms=ANDON_ASYNC_LINGER_MS,
+        results_size=ANDON_ASYNC_RESULTS_SIZE
+    ):
+        self.app = None
+        self.workers = workers
+        self.batch_size = batch_size
+        self.linger = linger_ms / 1000.0
+        self.results_size = results_size
+
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._results = OrderedDict()
+        self._results_lock = threading.Lock()
+        self._threads = []
+        self._pid = None
+        self._start_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._atexit_registered = False
+
+    def init_app(self, app):
+        self.app = app
+        # One registration per queue, however many apps the factory builds
+        if not self._atexit_registered:
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+    def submit(self, sample: dict, user_id: str = None) -> str:
+        """Enqueues a validated sample. Raises queue.Full when the queue is saturated."""
+        self._ensure_started()
+
+        tracking_id = str(uuid.uuid4())
+        self._set_result(tracking_id, user_id, {"status": "queued"})
+        try:
+            self._queue.put_nowait((tracking_id, sample, user_id))
+        except queue.Full:
+            with self._results_lock:
+                self._results.pop(tracking_id, None)
+            raise
+        return tracking_id
+
+    def status(self, tracking_id: str, user_id: str = None):
+        """Result of a tracking id, or None when it is unknown here or was submitted by another user."""
+        with self._results_lock:
+            owner, result = self._results.get(tracking_id, (None, None))
+            return dict(result) if result and owner == user_id else None
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stop(self, timeout: float = 5.0):
+        """Drains what is already queued, then stops the workers."""
+        self._stopping.set()
+        if self._pid == os.getpid():
+            for thread in self._threads:
+                thread.join(timeout)
+        self._threads = []
+        self._pid = None
+
+    def _ensure_started(self):
+        # Workers are (re)started per process: threads do not survive fork
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            if self.app is None:
+                raise RuntimeError("AndonIngestQueue.init_app() must be called before submit().")
+            self._stopping.clear()
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._run,
+                    name=f"andon-ingest-{index}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+            self._pid = os.getpid()
+
+    def _run(self):
+        while not (self._stopping.is_set() and self._queue.empty()):
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.linger
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self._process(batch)
+
+    def _process(self, batch):
+        # Imported here to avoid a circular import with the service layer
+        from app.services.andon import AndonService
+        from app.services.log import LogService
+
+        ids = [item[0] for item in batch]
+        samples = [item[1] for item in batch]
+        user_ids = [item[2] for item in batch]
+        # Audit entries stay attributed to whoever submitted each sample
+        submitted_by = OrderedDict()
+        for _, _, user_id in batch:
+            submitted_by[user_id] = submitted_by.get(user_id, 0) + 1
+
+        with self.app.app_context():
+            try:
+                entries = AndonService.analyze_batch(samples, ids=ids, user_ids=user_ids)
+                for tracking_id, user_id, entry in zip(ids, user_ids, entries):
+                    self._set_result(tracking_id, user_id, {
+                        "status": "done",
+                        "andon_status": entry.andon_status,
+                        "timestamp": entry.timestamp.isoformat()
+                    })
+
+                for user_id, count in submitted_by.items():
+                    LogService.create_log(
+                        "AI_ANDON_ASYNC_ANALYSIS",
+                        f"Async batch analysis: {count} samples",
+                        user_id=user_id
+                    )
+            except Exception as e:
+                for tracking_id, user_id in zip(ids, user_ids):
+                    self._set_result(tracking_id, user_id, {"status": "failed", "error": str(e)})
+                for user_id in submitted_by:
+                    LogService.create_log("AI_ANALYSIS_ERROR", str(e), user_id=user_id)
+
+    def _set_result(self, tracking_id, user_id, result):
+        with self._results_lock:
+            self._results[tracking_id] = (user_id, result)
+            self._results.move_to_end(tracking_id)
+            while len(self._results) > self.results_size:
+                self._results.popitem(last=False)
+
+ingest_queue = AndonIngestQueue()
+
+__all__ = [
+    "AndonIngestQueue",
+    "ingest_queue",
+]
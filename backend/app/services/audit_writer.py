@@ -0,0 +1,174 @@
+import atexit
+import os
+import threading
+import uuid
+from datetime import datetime
+
+from app.extensions import db
+from app.models.log import Log
+from app.services.response_cache import response_cache, LOGS
+from app.config import (
+    AUDIT_LOG_MODE,
+    AUDIT_LOG_BATCH_SIZE,
+    AUDIT_LOG_FLUSH_INTERVAL_MS,
+    AUDIT_LOG_MAX_BUFFER,
+    AUDIT_LOG_MAX_RETRIES
+)
+
+class AuditLogWriter:
+    """
+    Audit-log pipeline behind LogService.create_log.
+
+    In 'buffered' mode events are kept in memory and a background thread
+    writes them to `logs` with one multi-row INSERT whenever the batch size
+    or the flush interval is reached. In 'sync' mode (tests, scripts) each
+    event is inserted immediately. Both modes use their own connection, so
+    audit writes never commit or roll back the request's session.
+
+    Rows keep the time the event was written. A failed batch is retried on
+    the next `max_retries` flushes, then inserted row by row so one bad row
+    (too long, foreign key) is dropped and reported instead of blocking the
+    log; delta sync re-reads the resulting commit lag (SYNC_LOG_LAG_SECONDS).
+    """
+
+    def __init__(
+        self,
+        mode=AUDIT_LOG_MODE,
+        batch_size=AUDIT_LOG_BATCH_SIZE,
+        flush_interval_ms=AUDIT_LOG_FLUSH_INTERVAL_MS,
+        max_buffer=AUDIT_LOG_MAX_BUFFER,
+        max_retries=AUDIT_LOG_MAX_RETRIES
+    ):
+        self.app = None
+        self.mode = mode
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.max_buffer = max_buffer
+        self.max_retries = max_retries
+        self.dropped = 0
+
+        self._buffer = []
+        # Failed batch waiting for its next attempt (only touched under _flush_lock)
+        self._retry = []
+        self._attempts = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._pid = None
+        self._atexit_registered = False
+
+    def init_app(self, app, mode: str = None):
+        self.app = app
+        if mode:
+            self.mode = mode
+        # One registration per writer, however many apps the factory builds
+        if not self._atexit_registered:
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+    def write(self, action: str, details: str, user_id: str = None):
+        row = {
+            "id": str(uuid.uuid4()),
+            "timestamp": datetime.utcnow(),
+            "action": action,
+            "details": details,
+            "user_id": user_id
+        }
+
+        if self.mode != 'buffered' or self.app is None:
+            self._insert([row])
+            return
+
+        self._ensure_started()
+
+        with self._lock:
+            self._buffer.append(row)
+            overflow = len(self._buffer) - self.max_buffer
+            if overflow > 0:
+                del self._buffer[:overflow]
+                self.dropped += overflow
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self._wakeup.set()
+
+    def flush(self):
+        """Writes everything buffered so far, after the batch that failed last time (if any)."""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._buffer = self._retry + self._buffer, []
+            self._retry = []
+            if not rows:
+                return
+            overflow = len(rows) - self.max_buffer
+            if overflow > 0:
+                del rows[:overflow]
+                self.dropped += overflow
+
+            try:
+                self._insert(rows)
+                self._attempts = 0
+            except Exception as e:
+                self._attempts += 1
+                if self._attempts <= self.max_retries:
+                    print(f"CRITICAL: Error flushing {len(rows)} audit logs (attempt {self._attempts}): {e}")
+                    self._retry = rows
+                else:
+                    self._attempts = 0
+                    self._insert_each(rows)
+
+    def stop(self):
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout=5)
+        self._thread = None
+        self._pid = None
+        self.flush()
+
+    def _ensure_started(self):
+        # Started on first use and again in every forked worker (threads do not survive fork)
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._buffer = []
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def _insert_each(self, rows):
+        # Last resort for a batch that keeps failing: keep every row that can be written
+        for row in rows:
+            try:
+                self._insert([row])
+            except Exception as e:
+                self.dropped += 1
+                print(f"CRITICAL: Dropping audit log {row['id']} ({row['action']}): {e}")
+
+    def _insert(self, rows):
+        if self.app is not None:
+            with self.app.app_context():
+                with db.engine.begin() as connection:
+                    connection.execute(Log.__table__.insert(), rows)
+        else:
+            with db.engine.begin() as connection:
+                connection.execute(Log.__table__.insert(), rows)
+        # Cached /api/logs pages are stale once the rows are visible
+        response_cache.invalidate(LOGS)
+
+audit_writer = AuditLogWriter()
+
+__all__ = [
+    "AuditLogWriter",
+    "audit_writer",
+]
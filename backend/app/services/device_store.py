@@ -0,0 +1,163 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import func, select
+
+from app.config import DEVICE_STORE_SAMPLES, DEVICE_STORE_MAX_DEVICES
+
+EPOCH = datetime(1970, 1, 1)
+
+# Column layout of every ring buffer row
+COLUMNS = (
+    'timestamp',
+    'cpu_usage_pct',
+    'mem_available_gb',
+    'active_threats',
+    'untrusted_processes',
+    'andon_status'
+)
+INTEGER_COLUMNS = {'active_threats', 'untrusted_processes', 'andon_status'}
+
+class DeviceRing:
+    """Fixed-size NumPy ring buffer holding the last `capacity` samples of one device."""
+    __slots__ = ('data', 'head', 'size')
+
+    def __init__(self, capacity: int):
+        self.data = np.full((capacity, len(COLUMNS)), np.nan)
+        self.head = 0
+        self.size = 0
+
+    def append(self, row):
+        capacity = self.data.shape[0]
+        self.data[self.head] = row
+        self.head = (self.head + 1) % capacity
+        self.size = min(self.size + 1, capacity)
+
+    def recent(self, limit: int = None) -> np.ndarray:
+        """Rows newest first."""
+        count = self.size if limit is None else min(limit, self.size)
+        capacity = self.data.shape[0]
+        positions = (self.head - 1 - np.arange(count)) % capacity
+        return self.data[positions]
+
+class DeviceStore:
+    """
+    In-process hot store of recent telemetry per device_id.
+
+    Memory is bounded to `max_devices` rings of `capacity` rows; the device
+    that has gone the longest without a sample is evicted first. Each worker
+    process keeps its own copy, rebuilt from the telemetry table on startup.
+    """
+
+    def __init__(self, capacity=DEVICE_STORE_SAMPLES, max_devices=DEVICE_STORE_MAX_DEVICES):
+        self.capacity = capacity
+        self.max_devices = max_devices
+        self._rings = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, entries):
+        """Adds Telemetry rows (in chronological order) to their devices' rings."""
+        with self._lock:
+            for entry in entries:
+                ring = self._rings.get(entry.device_id)
+                if ring is None:
+                    ring = self._rings[entry.device_id] = DeviceRing(self.capacity)
+                self._rings.move_to_end(entry.device_id)
+                ring.append(_to_row(entry))
+
+            while len(self._rings) > self.max_devices:
+                self._rings.popitem(last=False)
+
+    def devices(self) -> list[dict]:
+        """Latest sample of every device in memory, most recently seen first."""
+        with self._lock:
+            latest = [(device_id, ring.recent(1)[0], ring.size) for device_id, ring in self._rings.items()]
+
+        return [
+            {"device_id": device_id, **_to_dict(row), "samples": size}
+            for device_id, row, size in reversed(latest)
+        ]
+
+    def recent(self, device_id: str, limit: int = None):
+        """Samples of one device newest first, or None when the device is not in memory."""
+        with self._lock:
+            ring = self._rings.get(device_id)
+            if ring is None:
+                return None
+            rows = ring.recent(limit)
+
+        return [_to_dict(row) for row in rows]
+
+    def clear(self):
+        with self._lock:
+            self._rings.clear()
+
+    def rebuild(self):
+        """
+        Reloads the most recently active devices from the telemetry table in
+        one query: ROW_NUMBER() per device keeps each device's newest
+        `capacity` rows (needs an app context).
+        """
+        from app.extensions import db
+        from app.models.telemetry import Telemetry
+
+        active = select(
+            Telemetry.device_id, func.max(Telemetry.timestamp).label('last_seen')
+        ).group_by(Telemetry.device_id).order_by(
+            func.max(Telemetry.timestamp).desc()
+        ).limit(self.max_devices).subquery()
+
+        ranked = select(
+            Telemetry.id,
+            Telemetry.device_id,
+            *[getattr(Telemetry, name) for name in COLUMNS],
+            active.c.last_seen,
+            func.row_number().over(
+                partition_by=Telemetry.device_id,
+                order_by=(Telemetry.timestamp.desc(), Telemetry.id.desc())
+            ).label('position')
+        ).join(active, active.c.device_id == Telemetry.device_id).subquery()
+
+        # Oldest device first (so the LRU order matches last_seen), each device's rows in chronological order
+        rows = db.session.execute(
+            select(ranked).where(ranked.c.position <= self.capacity).order_by(
+                ranked.c.last_seen, ranked.c.device_id, ranked.c.timestamp, ranked.c.id
+            )
+        ).all()
+
+        self.clear()
+        self.record(rows)
+
+def _to_row(entry):
+    status = entry.andon_status if entry.andon_status is not None else np.nan
+    return (
+        (entry.timestamp - EPOCH).total_seconds(),
+        entry.cpu_usage_pct,
+        entry.mem_available_gb,
+        entry.active_threats,
+        entry.untrusted_processes,
+        status
+    )
+
+def _to_dict(row) -> dict:
+    result = {}
+    for name, value in zip(COLUMNS, row.tolist()):
+        if value != value:  # NaN: unknown verdict
+            result[name] = None
+        elif name == 'timestamp':
+            result[name] = (EPOCH + timedelta(seconds=value)).isoformat()
+        elif name in INTEGER_COLUMNS:
+            result[name] = int(value)
+        else:
+            result[name] = value
+    return result
+
+device_store = DeviceStore()
+
+__all__ = [
+    "DeviceRing",
+    "DeviceStore",
+    "device_store",
+]
@@ -0,0 +1,95 @@
+import itertools
+import json
+import queue
+import threading
+
+from app.config import EVENTS_CLIENT_BUFFER, EVENTS_HEARTBEAT_SECONDS, EVENTS_MAX_SUBSCRIBERS
+
+class Subscription:
+    """One connected client: a bounded buffer of already-encoded SSE frames."""
+
+    def __init__(self, maxsize: int):
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def offer(self, frame: str):
+        # A slow client loses its oldest frames instead of blocking publishers
+        while True:
+            try:
+                self.queue.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+class EventHub:
+    """
+    In-process pub/sub feeding GET /api/stream.
+
+    publish() never blocks: every frame is encoded once and offered to each
+    subscriber's bounded buffer. Subscribers only see events published by
+    the same process.
+    """
+
+    def __init__(
+        self,
+        buffer_size=EVENTS_CLIENT_BUFFER,
+        heartbeat=EVENTS_HEARTBEAT_SECONDS,
+        max_subscribers=EVENTS_MAX_SUBSCRIBERS
+    ):
+        self.buffer_size = buffer_size
+        self.heartbeat = heartbeat
+        self.max_subscribers = max_subscribers
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def subscribe(self):
+        """Returns a new Subscription, or None when the subscriber limit is reached."""
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                return None
+            subscription = Subscription(self.buffer_size)
+            self._subscribers.add(subscription)
+            return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, event: str, data: dict):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        if not subscribers:
+            return
+
+        frame = f"id: {next(self._ids)}\nevent: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+        for subscription in subscribers:
+            subscription.offer(frame)
+
+    def stream(self, subscription: Subscription):
+        """Generator of SSE frames for one client; sends a comment line as heartbeat when idle."""
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    yield subscription.queue.get(timeout=self.heartbeat)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+event_hub = EventHub()
+
+__all__ = [
+    "EventHub",
+    "Subscription",
+    "event_hub",
+]
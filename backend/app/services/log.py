@@ -1,6 +1,8 @@
 from app.extensions import db
 from app.models.log import Log
-from sqlalchemy import desc
+from sqlalchemy import desc, select, tuple_
+from app.utils.pagination import encode_cursor, decode_cursor, parse_datetime
+from app.services.audit_writer import audit_writer
 
 class LogService:
     
@@ -12,17 +14,88 @@ class LogService:
             print(f"Error getting all logs: {e}")
             raise e
 
+    @staticmethod
+    def get_page(
+        limit: int,
+        cursor: str = None,
+        action: str = None,
+        user_id: str = None,
+        since=None,
+        until=None
+    ) -> tuple[list[Log], str]:
+        """
+        Newest-first page of logs using keyset pagination on (timestamp, id).
+        Returns the rows and the cursor of the next page (None on the last page).
+        """
+        query = _filter_page(Log.query, cursor, action, user_id, since, until)
+        rows = query.order_by(desc(Log.timestamp), desc(Log.id)).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].timestamp, rows[-1].id)
+        return rows, next_cursor
+
+    @staticmethod
+    def get_page_rows(
+        limit: int,
+        cursor: str = None,
+        action: str = None,
+        user_id: str = None,
+        since=None,
+        until=None
+    ) -> tuple[list[dict], str]:
+        """
+        Read-only variant of get_page for the list endpoint: selects only the
+        columns LogSchema dumps, with SQLAlchemy Core, and returns plain dicts
+        equal to LogSchema(many=True).dump(...).
+        """
+        query = _filter_page(
+            select(Log.id, Log.timestamp, Log.action, Log.details),
+            cursor, action, user_id, since, until
+        )
+        rows = db.session.execute(query.order_by(desc(Log.timestamp), desc(Log.id)).limit(limit + 1)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].timestamp, rows[-1].id)
+        return [
+            {
+                "id": log_id,
+                "timestamp": timestamp.isoformat(),
+                "action": action,
+                "details": details
+            }
+            for log_id, timestamp, action, details in rows
+        ], next_cursor
+
     @staticmethod
     def create_log(action: str, details: str, user_id: str = None):
+        """
+        Hands the event to the audit writer; it never touches the caller's
+        session. The writer invalidates cached log pages once the row is
+        committed (immediately in 'sync' mode, at the next flush when buffered).
+        """
         try:
-            new_log = Log(
-                action=action, 
-                details=details,
-                user_id=user_id 
-            )
-            db.session.add(new_log)
-            db.session.commit()
-            
+            audit_writer.write(action, details, user_id=user_id)
         except Exception as e:
-            db.session.rollback()
-            print(f"CRITICAL: Error in LogService.create_log: {e}")
\ No newline at end of file
+            print(f"CRITICAL: Error in LogService.create_log: {e}")
+
+def _filter_page(query, cursor, action, user_id, since, until):
+    """List filters and keyset condition, for both ORM queries and Core selects."""
+    if action:
+        query = query.filter(Log.action == action)
+    if user_id:
+        query = query.filter(Log.user_id == user_id)
+    if since:
+        query = query.filter(Log.timestamp >= since)
+    if until:
+        query = query.filter(Log.timestamp < until)
+
+    if cursor:
+        last_timestamp, last_id = decode_cursor(cursor, 2)
+        query = query.filter(
+            tuple_(Log.timestamp, Log.id) < (parse_datetime(last_timestamp, 'cursor'), last_id)
+        )
+    return query
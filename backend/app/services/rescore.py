@@ -0,0 +1,177 @@
+import json
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import bindparam, select, update
+
+from app.extensions import db
+from app.models.telemetry import Telemetry
+from app.ml_logic.predictor import AndonPredictor
+from app.ml_logic.registry import predictor_registry
+from app.services.rollups import RollupService
+from app.config import ANDON_RESCORE_CHUNK_SIZE, ANDON_RESCORE_WORKERS
+
+DIFF_SAMPLE_SIZE = 20
+
+# Set in each pool process by _init_worker
+_worker_predictor = None
+
+class RescoreReport:
+    """Progress and diff of one re-scoring run."""
+
+    def __init__(self, version: str, dry_run: bool, last_id: str = None, scanned: int = 0, changed: int = 0):
+        self.version = version
+        self.dry_run = dry_run
+        self.last_id = last_id
+        self.scanned = scanned
+        self.changed = changed
+        self.transitions = Counter()
+        self.sample = []
+        self.started = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def to_json(self):
+        return {
+            "version": self.version,
+            "dry_run": self.dry_run,
+            "scanned": self.scanned,
+            "changed": self.changed,
+            "last_id": self.last_id,
+            "transitions": {f"{old}->{new}": count for (old, new), count in sorted(self.transitions.items(), key=str)},
+            "sample": self.sample,
+            "seconds": round(self.elapsed, 3)
+        }
+
+def rescore_telemetry(
+    version: str = None,
+    workers: int = ANDON_RESCORE_WORKERS,
+    chunk_size: int = ANDON_RESCORE_CHUNK_SIZE,
+    dry_run: bool = False,
+    checkpoint: str = None,
+    on_chunk=None
+) -> RescoreReport:
+    """
+    Re-scores every telemetry row with `version` (the active one by default).
+
+    Rows are read in keyset chunks ordered by id and scored in a process
+    pool whose workers each load the model once. At most two chunks per
+    worker are in flight, so memory does not depend on the table size.
+    Changed rows are written back with one executemany UPDATE per chunk,
+    in the same transaction as the matching rollup status counters.
+    The id of the last applied chunk is saved to `checkpoint`; running
+    again with the same file resumes after it. With dry_run nothing is
+    written and the report only lists the verdict transitions.
+    Needs an app context.
+    """
+    version = version or predictor_registry.active_version()
+    model_path = predictor_registry.artifact_path(version)
+    report = _resume(checkpoint, version, dry_run)
+
+    columns = (
+        Telemetry.id,
+        Telemetry.cpu_usage_pct,
+        Telemetry.mem_available_gb,
+        Telemetry.active_threats,
+        Telemetry.untrusted_processes,
+        Telemetry.andon_status,
+        Telemetry.model_version,
+        Telemetry.device_id,
+        Telemetry.timestamp
+    )
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(model_path, version)) as pool:
+        in_flight = deque()
+        last_id = report.last_id
+
+        while True:
+            query = select(*columns).order_by(Telemetry.id).limit(chunk_size)
+            if last_id is not None:
+                query = query.where(Telemetry.id > last_id)
+            rows = db.session.execute(query).all()
+            # Nothing is written until the chunk's result comes back, so the read transaction can end here
+            db.session.rollback()
+
+            if rows:
+                last_id = rows[-1].id
+                in_flight.append((rows, pool.submit(_score_chunk, [tuple(row[1:5]) for row in rows])))
+
+            while in_flight and (len(in_flight) >= 2 * workers or not rows):
+                done_rows, future = in_flight.popleft()
+                _apply(report, done_rows, future.result())
+                _save_checkpoint(checkpoint, report)
+                if on_chunk:
+                    on_chunk(report)
+
+            if not rows:
+                return report
+
+def _init_worker(model_path: str, version: str):
+    global _worker_predictor
+    _worker_predictor = AndonPredictor(model_path, version=version)
+
+def _score_chunk(rows):
+    return _worker_predictor.predict_batch(rows)
+
+def _apply(report: RescoreReport, rows, verdicts):
+    updates = []
+    moves = []
+    for row, verdict in zip(rows, verdicts):
+        if row.andon_status != verdict:
+            report.changed += 1
+            report.transitions[(row.andon_status, verdict)] += 1
+            if len(report.sample) < DIFF_SAMPLE_SIZE:
+                report.sample.append({"id": row.id, "old": row.andon_status, "new": verdict})
+            moves.append((row.device_id, row.timestamp, row.andon_status, verdict))
+        if row.andon_status != verdict or row.model_version != report.version:
+            updates.append({"row_id": row.id, "new_status": verdict})
+
+    report.scanned += len(rows)
+    report.last_id = rows[-1].id
+    if report.dry_run or not updates:
+        return
+
+    try:
+        db.session.connection().execute(
+            update(Telemetry.__table__)
+            .where(Telemetry.__table__.c.id == bindparam('row_id'))
+            .values(andon_status=bindparam('new_status'), model_version=report.version),
+            updates
+        )
+        RollupService.move_status(moves)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        raise e
+
+def _resume(checkpoint: str, version: str, dry_run: bool) -> RescoreReport:
+    if dry_run or not checkpoint or not os.path.exists(checkpoint):
+        return RescoreReport(version, dry_run)
+
+    with open(checkpoint) as saved:
+        state = json.load(saved)
+    if state.get("version") != version:
+        raise ValueError(f"Checkpoint {checkpoint} belongs to model version '{state.get('version')}'")
+    return RescoreReport(version, dry_run, state["last_id"], state["scanned"], state["changed"])
+
+def _save_checkpoint(checkpoint: str, report: RescoreReport):
+    if report.dry_run or not checkpoint:
+        return
+    temporary = f"{checkpoint}.tmp"
+    with open(temporary, 'w') as saved:
+        json.dump({
+            "version": report.version,
+            "last_id": report.last_id,
+            "scanned": report.scanned,
+            "changed": report.changed
+        }, saved)
+    os.replace(temporary, checkpoint)
+
+__all__ = [
+    "RescoreReport",
+    "rescore_telemetry",
+]
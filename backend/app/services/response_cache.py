@@ -0,0 +1,170 @@
+import os
+import threading
+import uuid
+from collections import OrderedDict
+
+from app.config import RESPONSE_CACHE_SIZE
+
+# Version scopes: one per table behind a cached endpoint
+TICKETS = 'tickets'
+LOGS = 'logs'
+
+class LocalVersions:
+    """
+    Version markers held in this process. Tokens start with a per-process
+    nonce, so two workers never produce the same token, but a worker does
+    not see the others' writes: only for single-process deployments.
+    """
+
+    def __init__(self):
+        self._versions = {}
+        self._lock = threading.Lock()
+        self._nonce = None
+        self._pid = None
+
+    def current(self, scope: str) -> str:
+        return f"{self._process_nonce()}-{self._versions.get(scope, 0)}"
+
+    def bump(self, scope: str):
+        with self._lock:
+            self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    def _process_nonce(self) -> str:
+        # Renewed in every forked worker
+        if self._pid != os.getpid():
+            self._nonce = uuid.uuid4().hex[:12]
+            self._pid = os.getpid()
+        return self._nonce
+
+class FileVersions:
+    """
+    Version markers shared by every process on the host: each scope is an
+    append-only file and a write appends one byte, so the version is the
+    file size (O_APPEND writes are atomic) and reading it is one stat().
+    The inode is part of the token, so a deleted and recreated file does
+    not bring old versions back.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def current(self, scope: str) -> str:
+        try:
+            stat = os.stat(self._path(scope))
+        except FileNotFoundError:
+            return "0"
+        return f"{stat.st_ino:x}-{stat.st_size}"
+
+    def bump(self, scope: str):
+        descriptor = os.open(self._path(scope), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(descriptor, b".")
+        finally:
+            os.close(descriptor)
+
+    def _path(self, scope: str) -> str:
+        return os.path.join(self.directory, f"{scope}.version")
+
+class ResponseCache:
+    """
+    Bounded LRU of list payloads keyed by (scope, normalized parameters).
+
+    Every entry remembers the scope version it was computed under and is
+    only served while that version is current; the services bump the
+    version after each committed write, which invalidates exactly the
+    entries of that table in every worker sharing the version backend.
+    The version is read before computing, so a payload racing with a write
+    is stored under the old version and never served afterwards.
+    """
+
+    def __init__(self, capacity: int = RESPONSE_CACHE_SIZE):
+        self.capacity = capacity
+        self.versions = LocalVersions()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """Builds the version backend from the app config. Raises ValueError for an unknown backend."""
+        self.capacity = app.config['RESPONSE_CACHE_SIZE']
+        backend = app.config['RESPONSE_CACHE_BACKEND']
+        if backend == 'local':
+            self.versions = LocalVersions()
+        elif backend == 'file':
+            self.versions = FileVersions(app.config['RESPONSE_CACHE_DIR'] or os.path.join(app.instance_path, 'versions'))
+        else:
+            raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND '{backend}' (expected 'local' or 'file')")
+        self.clear()
+
+    def version(self, scope: str) -> str:
+        return self.versions.current(scope)
+
+    def invalidate(self, *scopes: str):
+        for scope in scopes:
+            self.versions.bump(scope)
+
+    def get_or_compute(self, scope: str, params: dict, compute):
+        """Cached payload for these parameters, or compute() stored under the current version."""
+        if self.capacity <= 0:
+            return compute()
+
+        key = (scope, normalize_params(params))
+        version = self.version(scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+            if entry is not None:
+                self.stale += 1
+
+        payload = compute()
+        with self._lock:
+            self._entries[key] = (version, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return payload
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.stale = self.evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": type(self.versions).__name__,
+                "size": len(self._entries),
+                "capacity": self.capacity,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "versions": {scope: self.version(scope) for scope in (TICKETS, LOGS)}
+            }
+
+def normalize_params(params: dict) -> tuple:
+    """Absent and empty parameters are equivalent; order does not matter."""
+    return tuple(sorted((name, value) for name, value in params.items() if value not in (None, '')))
+
+response_cache = ResponseCache()
+
+__all__ = [
+    "LOGS",
+    "TICKETS",
+    "FileVersions",
+    "LocalVersions",
+    "ResponseCache",
+    "normalize_params",
+    "response_cache",
+]
@@ -0,0 +1,298 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, delete, func, select, tuple_, update
+
+from app.extensions import db
+from app.models.telemetry import Telemetry
+from app.models.telemetry_rollup import TelemetryRollup
+from app.utils.db import upsert
+from app.config import ANDON_ROLLUP_CHUNK_SIZE, ANDON_TRENDS_MIN_POINTS, ANDON_TRENDS_MAX_POINTS
+
+# Coarsest first
+GRANULARITIES = {
+    'day': timedelta(days=1),
+    'hour': timedelta(hours=1),
+    'minute': timedelta(minutes=1),
+}
+
+STATUS_COLUMNS = {
+    0: 'status_normal',
+    1: 'status_warning',
+    2: 'status_critical',
+    None: 'status_unknown',
+}
+
+class RollupService:
+    @staticmethod
+    def record(samples):
+        """
+        Adds telemetry rows (Telemetry objects or row dicts) to their minute,
+        hour and day buckets inside the caller's transaction.
+        """
+        deltas = {}
+        for sample in samples:
+            values = _values(sample)
+            for granularity in GRANULARITIES:
+                key = (granularity, values['device_id'], bucket_start(values['timestamp'], granularity))
+                _merge(deltas, key, values)
+
+        _apply_deltas(deltas)
+
+    @staticmethod
+    def move_status(changes):
+        """Moves re-scored rows between status counters: `changes` holds (device_id, timestamp, old, new)."""
+        moves = {}
+        for device_id, timestamp, old, new in changes:
+            for granularity in GRANULARITIES:
+                key = (granularity, device_id, bucket_start(timestamp, granularity))
+                counters = moves.setdefault(key, {})
+                counters[STATUS_COLUMNS[old]] = counters.get(STATUS_COLUMNS[old], 0) - 1
+                counters[STATUS_COLUMNS[new]] = counters.get(STATUS_COLUMNS[new], 0) + 1
+
+        for (granularity, device_id, bucket), counters in moves.items():
+            counters = {column: delta for column, delta in counters.items() if delta}
+            if not counters:
+                continue
+            db.session.execute(
+                update(TelemetryRollup)
+                .where(
+                    TelemetryRollup.granularity == granularity,
+                    TelemetryRollup.device_id == device_id,
+                    TelemetryRollup.bucket == bucket
+                )
+                .values({column: getattr(TelemetryRollup, column) + delta for column, delta in counters.items()})
+            )
+
+    @staticmethod
+    def backfill(chunk_size: int = ANDON_ROLLUP_CHUNK_SIZE, on_chunk=None) -> int:
+        """
+        Rebuilds every rollup from the telemetry table, one transaction per
+        chunk. Rows are read from a snapshot taken while the old rollups are
+        deleted: rows ingested later are rolled up by the live write path
+        only, even when their timestamps are old. Returns the rows processed.
+        """
+        cutoff = datetime.utcnow()
+        columns = (
+            Telemetry.id,
+            Telemetry.device_id,
+            Telemetry.timestamp,
+            Telemetry.cpu_usage_pct,
+            Telemetry.mem_available_gb,
+            Telemetry.andon_status
+        )
+        with _snapshot_connection() as reader:
+            try:
+                # The DELETE holds the write lock while the snapshot is pinned, so no
+                # telemetry row can commit between the two
+                db.session.execute(delete(TelemetryRollup))
+                snapshot = _begin_snapshot(reader)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                raise e
+
+            processed = 0
+            last = None
+            while True:
+                query = select(*columns)
+                if not snapshot:
+                    # No read snapshot (SQLite without WAL): fall back to the start of the run
+                    query = query.where(Telemetry.timestamp < cutoff)
+                if last is not None:
+                    query = query.where(tuple_(Telemetry.timestamp, Telemetry.id) > last)
+                rows = reader.execute(
+                    query.order_by(Telemetry.timestamp, Telemetry.id).limit(chunk_size)
+                ).mappings().all()
+                if not rows:
+                    return processed
+
+                try:
+                    RollupService.record(rows)
+                    db.session.commit()
+                except Exception as e:
+                    db.session.rollback()
+                    raise e
+
+                processed += len(rows)
+                last = (rows[-1]['timestamp'], rows[-1]['id'])
+                if on_chunk:
+                    on_chunk(processed)
+
+    @staticmethod
+    def trends(
+        since: datetime,
+        until: datetime,
+        device_id: str = None,
+        granularity: str = None
+    ) -> dict:
+        """
+        Buckets covering [since, until) for one device or the whole fleet;
+        the bounds are widened to whole buckets. Without an explicit
+        granularity the coarsest one that still yields ANDON_TRENDS_MIN_POINTS
+        buckets is used. Raises ValueError for an unknown granularity or too
+        many buckets.
+        """
+        if granularity is None:
+            granularity = choose_granularity(since, until)
+        elif granularity not in GRANULARITIES:
+            raise ValueError(f"'granularity' must be one of {', '.join(GRANULARITIES)}")
+
+        start = bucket_start(since, granularity)
+        end = bucket_end(until, granularity)
+        points = (end - start) // GRANULARITIES[granularity]
+        if points > ANDON_TRENDS_MAX_POINTS:
+            raise ValueError(
+                f"{points} {granularity} buckets requested, the limit is {ANDON_TRENDS_MAX_POINTS}: "
+                "narrow the range or use a coarser granularity"
+            )
+
+        query = select(
+            TelemetryRollup.bucket,
+            func.sum(TelemetryRollup.count).label('count'),
+            func.min(TelemetryRollup.cpu_min).label('cpu_min'),
+            func.max(TelemetryRollup.cpu_max).label('cpu_max'),
+            func.sum(TelemetryRollup.cpu_sum).label('cpu_sum'),
+            func.min(TelemetryRollup.mem_min).label('mem_min'),
+            func.max(TelemetryRollup.mem_max).label('mem_max'),
+            func.sum(TelemetryRollup.mem_sum).label('mem_sum'),
+            *[func.sum(getattr(TelemetryRollup, column)).label(column) for column in STATUS_COLUMNS.values()]
+        ).where(
+            TelemetryRollup.granularity == granularity,
+            TelemetryRollup.bucket >= start,
+            TelemetryRollup.bucket < end
+        )
+        if device_id:
+            query = query.where(TelemetryRollup.device_id == device_id)
+
+        rows = db.session.execute(query.group_by(TelemetryRollup.bucket).order_by(TelemetryRollup.bucket)).all()
+        return {
+            "granularity": granularity,
+            "since": start.isoformat(),
+            "until": end.isoformat(),
+            "device_id": device_id,
+            "data": [_point(row) for row in rows]
+        }
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    if granularity == 'minute':
+        return timestamp.replace(second=0, microsecond=0)
+    if granularity == 'hour':
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+def bucket_end(timestamp: datetime, granularity: str) -> datetime:
+    """Start of the first bucket at or after `timestamp` (exclusive upper bound)."""
+    start = bucket_start(timestamp, granularity)
+    return start if start == timestamp else start + GRANULARITIES[granularity]
+
+def choose_granularity(since: datetime, until: datetime) -> str:
+    for granularity, size in GRANULARITIES.items():
+        if (bucket_end(until, granularity) - bucket_start(since, granularity)) / size >= ANDON_TRENDS_MIN_POINTS:
+            return granularity
+    return 'minute'
+
+def _values(sample) -> dict:
+    if hasattr(sample, 'keys'):
+        return {
+            "device_id": sample['device_id'],
+            "timestamp": sample['timestamp'],
+            "cpu": sample['cpu_usage_pct'],
+            "mem": sample['mem_available_gb'],
+            "status": sample['andon_status']
+        }
+    return {
+        "device_id": sample.device_id,
+        "timestamp": sample.timestamp,
+        "cpu": sample.cpu_usage_pct,
+        "mem": sample.mem_available_gb,
+        "status": sample.andon_status
+    }
+
+def _merge(deltas, key, values):
+    delta = deltas.get(key)
+    if delta is None:
+        delta = deltas[key] = {
+            "count": 0,
+            "cpu_min": values['cpu'], "cpu_max": values['cpu'], "cpu_sum": 0.0,
+            "mem_min": values['mem'], "mem_max": values['mem'], "mem_sum": 0.0,
+            **{column: 0 for column in STATUS_COLUMNS.values()}
+        }
+    delta['count'] += 1
+    delta['cpu_min'] = min(delta['cpu_min'], values['cpu'])
+    delta['cpu_max'] = max(delta['cpu_max'], values['cpu'])
+    delta['cpu_sum'] += values['cpu']
+    delta['mem_min'] = min(delta['mem_min'], values['mem'])
+    delta['mem_max'] = max(delta['mem_max'], values['mem'])
+    delta['mem_sum'] += values['mem']
+    delta[STATUS_COLUMNS.get(values['status'], 'status_unknown')] += 1
+
+def _apply_deltas(deltas):
+    """Adds the deltas to their rows with one executemany INSERT ... ON CONFLICT DO UPDATE."""
+    if deltas:
+        db.session.execute(_upsert_statement(), [
+            {"granularity": granularity, "device_id": device_id, "bucket": bucket, **delta}
+            for (granularity, device_id, bucket), delta in deltas.items()
+        ])
+
+def _upsert_statement():
+    c = TelemetryRollup.__table__.c
+
+    def merge(new):
+        return dict(
+            count=c.count + new.count,
+            cpu_min=case((c.cpu_min > new.cpu_min, new.cpu_min), else_=c.cpu_min),
+            cpu_max=case((c.cpu_max < new.cpu_max, new.cpu_max), else_=c.cpu_max),
+            cpu_sum=c.cpu_sum + new.cpu_sum,
+            mem_min=case((c.mem_min > new.mem_min, new.mem_min), else_=c.mem_min),
+            mem_max=case((c.mem_max < new.mem_max, new.mem_max), else_=c.mem_max),
+            mem_sum=c.mem_sum + new.mem_sum,
+            **{column: c[column] + new[column] for column in STATUS_COLUMNS.values()}
+        )
+
+    return upsert(TelemetryRollup.__table__, ['granularity', 'device_id', 'bucket'], merge)
+
+def _snapshot_connection():
+    connection = db.engine.connect()
+    if connection.dialect.name != 'sqlite':
+        connection = connection.execution_options(isolation_level="REPEATABLE READ")
+    return connection
+
+def _begin_snapshot(connection) -> bool:
+    """Pins a read snapshot on `connection`; False when the engine cannot keep one next to a writer."""
+    if connection.dialect.name == 'sqlite':
+        if connection.exec_driver_sql("PRAGMA journal_mode").scalar() != 'wal':
+            return False
+        # pysqlite only opens transactions before writes; WAL pins the snapshot at the first read
+        connection.exec_driver_sql("BEGIN")
+    connection.execute(select(Telemetry.id).limit(1)).all()
+    return True
+
+def _point(row) -> dict:
+    count = row.count or 0
+    return {
+        "bucket": row.bucket.isoformat(),
+        "count": count,
+        "cpu_usage_pct": {
+            "min": row.cpu_min,
+            "max": row.cpu_max,
+            "mean": row.cpu_sum / count if count else None
+        },
+        "mem_available_gb": {
+            "min": row.mem_min,
+            "max": row.mem_max,
+            "mean": row.mem_sum / count if count else None
+        },
+        "status_counts": {
+            "0": row.status_normal,
+            "1": row.status_warning,
+            "2": row.status_critical,
+            "unknown": row.status_unknown
+        }
+    }
+
+__all__ = [
+    "GRANULARITIES",
+    "RollupService",
+    "bucket_start",
+    "choose_granularity",
+]
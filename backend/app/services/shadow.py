@@ -0,0 +1,261 @@
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import g, has_request_context
+from sqlalchemy import case
+
+from app.extensions import db
+from app.models.shadow_comparison import ShadowComparison
+from app.ml_logic.registry import predictor_registry
+from app.utils.db import upsert
+from app.config import (
+    ANDON_SHADOW_VERSION,
+    ANDON_SHADOW_WORKERS,
+    ANDON_SHADOW_MAX_PENDING,
+    ANDON_SHADOW_FLUSH_SECONDS
+)
+
+ANDON_LABELS = (0, 1, 2)
+
+class ShadowEvaluator:
+    """
+    Scores the feature vectors already scored by the primary model with a
+    candidate version, for comparison only.
+
+    Work submitted during a request is handed to the pool when the response
+    is closed, so it never adds to request latency. At most `max_pending`
+    jobs wait or run; further jobs are shed and counted. Comparison counts
+    are aggregated in memory and added to `shadow_comparisons` every
+    `flush_seconds`, so the statistics cover every worker.
+    """
+
+    def __init__(
+        self,
+        version=ANDON_SHADOW_VERSION,
+        workers=ANDON_SHADOW_WORKERS,
+        max_pending=ANDON_SHADOW_MAX_PENDING,
+        flush_seconds=ANDON_SHADOW_FLUSH_SECONDS
+    ):
+        self.app = None
+        self.version = version or None
+        self.workers = workers
+        self.max_pending = max_pending
+        self.flush_seconds = flush_seconds
+        self.shed = 0
+        self.errors = 0
+
+        self._predictor = None
+        self._executor = None
+        self._pid = None
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._atexit_registered = False
+
+    def init_app(self, app):
+        self.app = app
+        version = app.config['ANDON_SHADOW_VERSION'] or None
+        if version != self.version:
+            self.version = version
+            self._predictor = None
+        # One hook per app and one exit handler per evaluator, however often init_app runs
+        if self._dispatch_after_response not in app.after_request_funcs.get(None, []):
+            app.after_request(self._dispatch_after_response)
+        if not self._atexit_registered:
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+    def submit(self, rows, predictions, primary_version):
+        """Queues rows already scored by `primary_version` for shadow scoring (no-op when disabled)."""
+        if not self.version or not rows or self.app is None:
+            return
+        job = (rows, predictions, primary_version)
+        if has_request_context():
+            g.setdefault('shadow_jobs', []).append(job)
+        else:
+            self._enqueue(job)
+
+    def stats(self) -> dict:
+        if not self.version:
+            return {"enabled": False}
+        self.flush()
+
+        rows = ShadowComparison.query.filter(ShadowComparison.shadow_version == self.version).all()
+        labels = sorted(set(ANDON_LABELS) | {row.primary_status for row in rows} | {row.shadow_status for row in rows})
+        position = {label: index for index, label in enumerate(labels)}
+        matrix = [[0] * len(labels) for _ in labels]
+        latency = {}
+        compared = agreed = 0
+
+        for row in rows:
+            matrix[position[row.primary_status]][position[row.shadow_status]] += row.count
+            compared += row.count
+            if row.primary_status == row.shadow_status:
+                agreed += row.count
+            cell = latency.setdefault(row.shadow_status, {"count": 0, "total": 0.0, "max": 0.0})
+            cell["count"] += row.count
+            cell["total"] += row.latency_ms_total
+            cell["max"] = max(cell["max"], row.latency_ms_max)
+
+        return {
+            "enabled": True,
+            "shadow_version": self.version,
+            "primary_versions": sorted({row.primary_version for row in rows}),
+            "compared": compared,
+            "agreement_rate": agreed / compared if compared else None,
+            # Rows: primary verdict, columns: shadow verdict
+            "confusion_matrix": {"labels": labels, "matrix": matrix},
+            "latency_ms": {
+                str(label): {
+                    "count": cell["count"],
+                    "mean": cell["total"] / cell["count"],
+                    "max": cell["max"]
+                }
+                for label, cell in sorted(latency.items())
+            },
+            "worker": {**self._worker_counters(), "max_pending": self.max_pending}
+        }
+
+    def flush(self):
+        """Adds the counts aggregated so far to `shadow_comparisons`."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._last_flush = time.monotonic()
+            if not pending:
+                return
+
+            with self.app.app_context():
+                try:
+                    for key, cell in pending.items():
+                        _add_comparison(key, *cell)
+                    db.session.commit()
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"CRITICAL: Error storing shadow comparisons: {e}")
+                    with self._lock:
+                        for key, cell in pending.items():
+                            _merge(self._pending, key, *cell)
+
+    def drain(self, timeout: float = 5.0):
+        """Waits until every queued job has been evaluated (tests, shutdown)."""
+        acquired = 0
+        deadline = time.monotonic() + timeout
+        while acquired < self.max_pending and self._slots.acquire(timeout=max(deadline - time.monotonic(), 0)):
+            acquired += 1
+        for _ in range(acquired):
+            self._slots.release()
+
+    def stop(self):
+        if self._executor is not None and self._pid == os.getpid():
+            self._executor.shutdown(wait=True)
+        self._executor = None
+        self._pid = None
+        if self.app is not None:
+            self.flush()
+
+    def _worker_counters(self) -> dict:
+        with self._lock:
+            return {"shed": self.shed, "errors": self.errors}
+
+    def _dispatch_after_response(self, response):
+        jobs = g.pop('shadow_jobs', None)
+        if jobs:
+            response.call_on_close(lambda: [self._enqueue(job) for job in jobs])
+        return response
+
+    def _enqueue(self, job):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.shed += 1
+            return
+        try:
+            self._ensure_started().submit(self._evaluate, *job).add_done_callback(lambda _: self._slots.release())
+        except RuntimeError:
+            # Pool shut down (interpreter exiting)
+            self._slots.release()
+            with self._lock:
+                self.shed += 1
+
+    def _ensure_started(self) -> ThreadPoolExecutor:
+        # One pool per process: threads do not survive fork
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="andon-shadow")
+                    self._pending = {}
+                    self._pid = os.getpid()
+        return self._executor
+
+    def _evaluate(self, rows, predictions, primary_version):
+        try:
+            predictor = self._shadow_predictor()
+            start = time.perf_counter()
+            shadow = predictor.predict_batch(rows)
+            per_sample_ms = (time.perf_counter() - start) * 1000 / len(rows)
+
+            with self._lock:
+                for primary_status, shadow_status in zip(predictions, shadow):
+                    if primary_status is None or shadow_status is None:
+                        continue
+                    key = (primary_version, predictor.version, primary_status, shadow_status)
+                    _merge(self._pending, key, 1, per_sample_ms, per_sample_ms)
+                due = time.monotonic() - self._last_flush >= self.flush_seconds
+
+            if due:
+                self.flush()
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            print(f"⚠️ Shadow evaluation failed: {e}")
+
+    def _shadow_predictor(self):
+        predictor = self._predictor
+        if predictor is None or predictor.version != self.version:
+            predictor = self._predictor = predictor_registry.load(self.version)
+        return predictor
+
+def _merge(pending, key, count, latency_total, latency_max):
+    cell = pending.get(key)
+    if cell is None:
+        pending[key] = [count, latency_total, latency_max]
+    else:
+        cell[0] += count
+        cell[1] += latency_total
+        cell[2] = max(cell[2], latency_max)
+
+def _add_comparison(key, count, latency_total, latency_max):
+    """Adds one aggregated cell inside the caller's transaction (upsert: workers flush concurrently)."""
+    primary_version, shadow_version, primary_status, shadow_status = key
+    c = ShadowComparison.__table__.c
+    db.session.execute(
+        upsert(
+            ShadowComparison.__table__,
+            ['primary_version', 'shadow_version', 'primary_status', 'shadow_status'],
+            lambda new: {
+                'count': c.count + new.count,
+                'latency_ms_total': c.latency_ms_total + new.latency_ms_total,
+                'latency_ms_max': case((c.latency_ms_max < new.latency_ms_max, new.latency_ms_max), else_=c.latency_ms_max)
+            }
+        ).values(
+            primary_version=primary_version,
+            shadow_version=shadow_version,
+            primary_status=primary_status,
+            shadow_status=shadow_status,
+            count=count,
+            latency_ms_total=latency_total,
+            latency_ms_max=latency_max
+        )
+    )
+
+shadow_evaluator = ShadowEvaluator()
+
+__all__ = [
+    "ShadowEvaluator",
+    "shadow_evaluator",
+]
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+from sqlalchemy import tuple_
+from app.extensions import db
+from app.models.log import Log
+from app.models.ticket import Ticket
+from app.models.ticket_tombstone import TicketTombstone
+from app.services.ticket import TicketService, SCHEMA_LOAD_OPTIONS
+from app.utils.pagination import encode_cursor, decode_cursor, parse_datetime
+from app.utils.deadline import check_deadline
+from app.config import SYNC_LOG_LIMIT, SYNC_TOMBSTONE_RETENTION_HOURS, SYNC_CLOCK_SKEW_SECONDS, SYNC_LOG_LAG_SECONDS
+
+class SyncService:
+
+    @staticmethod
+    def changes(cursor: str = None) -> dict:
+        """
+        Tickets created/updated/deleted and logs appended since `cursor`.
+
+        The cursor packs (ticket watermark, log position, log id). The
+        watermark trails the clock by SYNC_CLOCK_SKEW_SECONDS so slow commits
+        are not skipped. The log position trails it by SYNC_LOG_LAG_SECONDS,
+        which also covers the audit writer's flush and retries: a log stamped
+        when its event happened but committed later is still delivered. Rows inside that window can be sent twice, so clients must
+        apply tickets as upserts and deduplicate logs by id.
+        Without a cursor, or when it predates the tombstone retention window,
+        a full snapshot is returned with reset=True.
+        """
+        horizon = datetime.utcnow() - timedelta(hours=SYNC_TOMBSTONE_RETENTION_HOURS)
+
+        since = last_log = None
+        if cursor:
+            raw_since, raw_log_ts, log_id = decode_cursor(cursor, 3)
+            since = parse_datetime(raw_since, 'cursor')
+            if raw_log_ts is not None:
+                last_log = (parse_datetime(raw_log_ts, 'cursor'), log_id)
+
+        if since is None or since < horizon:
+            return SyncService._snapshot()
+
+        watermark = max(since, _watermark())
+        log_watermark = _log_watermark()
+        tickets = Ticket.query.options(*SCHEMA_LOAD_OPTIONS).filter(
+            Ticket.updated_at > since
+        ).order_by(Ticket.updated_at).all()
+        tombstones = TicketTombstone.query.filter(
+            TicketTombstone.deleted_at > since
+        ).order_by(TicketTombstone.deleted_at).all()
+        check_deadline()
+
+        log_query = Log.query
+        if last_log:
+            log_query = log_query.filter(tuple_(Log.timestamp, Log.id) > last_log)
+        logs = log_query.order_by(Log.timestamp, Log.id).limit(SYNC_LOG_LIMIT + 1).all()
+
+        has_more = len(logs) > SYNC_LOG_LIMIT
+        logs = logs[:SYNC_LOG_LIMIT]
+
+        if logs:
+            last_log = _trail((logs[-1].timestamp, logs[-1].id), log_watermark, last_log)
+
+        return {
+            "reset": False,
+            "tickets": tickets,
+            "deleted": [t.ticket_id for t in tombstones],
+            "logs": logs,
+            "has_more": has_more,
+            "cursor": _cursor(watermark, last_log)
+        }
+
+    @staticmethod
+    def _snapshot() -> dict:
+        # Taken before reading so that changes racing with the snapshot are re-sent next time
+        watermark = _watermark()
+        log_watermark = _log_watermark()
+        tickets = TicketService.getAll()
+
+        logs = Log.query.order_by(db.desc(Log.timestamp), db.desc(Log.id)).limit(SYNC_LOG_LIMIT).all()
+        logs.reverse()
+        last_log = _trail((logs[-1].timestamp, logs[-1].id), log_watermark, None) if logs else None
+
+        return {
+            "reset": True,
+            "tickets": tickets,
+            "deleted": [],
+            "logs": logs,
+            "has_more": False,
+            "cursor": _cursor(watermark, last_log)
+        }
+
+def _watermark():
+    return datetime.utcnow() - timedelta(seconds=SYNC_CLOCK_SKEW_SECONDS)
+
+def _log_watermark():
+    return datetime.utcnow() - timedelta(seconds=SYNC_LOG_LAG_SECONDS)
+
+def _trail(newest, watermark, previous):
+    """
+    Log position for the next cursor: held back at the log watermark so logs
+    committed late inside the lag window are read again, unless that would
+    not move past the previous position (a full page inside the window).
+    """
+    trailing = (watermark, '')
+    if newest > trailing and (previous is None or trailing > previous):
+        return trailing
+    return newest
+
+def _cursor(watermark, last_log):
+    if last_log is None:
+        return encode_cursor(watermark, None, None)
+    return encode_cursor(watermark, last_log[0], last_log[1])
+
+__all__ = [
+    "SyncService",
+]
@@ -1,6 +1,25 @@
 from app.extensions import db
-from app.models.ticket import Ticket
+from app.models.ticket import Ticket, PRIORITY_RANK
+from app.models.ticket_counter import TicketCounter
+from app.models.ticket_tombstone import TicketTombstone
+from app.config import SYNC_TOMBSTONE_RETENTION_HOURS, STATUS_MOVE_ATTEMPTS
+from datetime import datetime, timedelta
 from app.models.user import User 
+from app.services.events import event_hub
+from app.services.response_cache import response_cache, TICKETS
+from sqlalchemy import func, select, tuple_, update, delete
+from sqlalchemy.orm import aliased
+from app.utils.db import upsert
+from app.utils.pagination import encode_cursor, decode_cursor, parse_datetime
+
+# Board order and keyset of the ticket list, served by ix_tickets_(status_)rank_created
+PAGE_ORDER = (Ticket.priority_rank.desc(), Ticket.created_at.desc(), Ticket.id.desc())
+
+# Relationships TicketSchema dumps, loaded with the tickets instead of one SELECT per row
+SCHEMA_LOAD_OPTIONS = (db.joinedload(Ticket.creator), db.joinedload(Ticket.assignee))
+
+_creator = aliased(User)
+_assignee = aliased(User)
 
 class TicketService:
     @staticmethod 
@@ -22,7 +41,10 @@ class TicketService:
             )
             
             db.session.add(new_t)
+            _bump_counter(new_t.status, new_t.priority, 1)
             db.session.commit()
+            response_cache.invalidate(TICKETS)
+            event_hub.publish("ticket.created", _ticket_event(new_t))
             return new_t
         except Exception as e:
             db.session.rollback()
@@ -30,34 +52,238 @@ class TicketService:
 
     @staticmethod
     def update_status(ticket_id, new_status):
+        """
+        Moves a ticket with UPDATE ... WHERE id = ? AND status = <status read>,
+        so the counters are only bumped by the writer whose UPDATE matched;
+        a concurrent move re-reads the ticket and tries again.
+        """
         try:
-            ticket = Ticket.query.get(ticket_id)
-            if ticket:
-                ticket.status = new_status
-                db.session.commit()
-                return ticket
-            return None
+            for _ in range(STATUS_MOVE_ATTEMPTS):
+                ticket = Ticket.query.get(ticket_id)
+                if not ticket:
+                    return None
+                if ticket.status == new_status:
+                    break
+                old_status = ticket.status
+                moved = db.session.execute(
+                    update(Ticket)
+                    .where(Ticket.id == ticket_id, Ticket.status == old_status)
+                    .values(status=new_status)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                if moved == 1:
+                    _bump_counter(old_status, ticket.priority, -1)
+                    _bump_counter(new_status, ticket.priority, 1)
+                    break
+                db.session.rollback()
+            else:
+                raise RuntimeError(f"Ticket {ticket_id} kept changing status, move to {new_status} abandoned")
+
+            db.session.commit()
+            db.session.refresh(ticket)
+            response_cache.invalidate(TICKETS)
+            event_hub.publish("ticket.updated", _ticket_event(ticket))
+            return ticket
         except Exception as e:
             db.session.rollback()
             raise e
     
     @staticmethod
     def getAll():
-        return Ticket.query.options(db.joinedload(Ticket.creator)).order_by(Ticket.priority.desc()).all()
+        return Ticket.query.options(*SCHEMA_LOAD_OPTIONS).order_by(*PAGE_ORDER).all()
+
+    @staticmethod
+    def get_page(
+        limit: int,
+        cursor: str = None,
+        status: str = None,
+        priority: str = None,
+        assignee_id: str = None,
+        creator: str = None
+    ):
+        """
+        Page of tickets ordered High > Middle > Low, newest first inside each
+        priority, using keyset pagination on (priority rank, created_at, id).
+        Returns the rows and the cursor of the next page (None on the last page).
+        """
+        query = _filter_page(
+            Ticket.query.options(*SCHEMA_LOAD_OPTIONS),
+            cursor, status, priority, assignee_id, creator
+        )
+        rows = query.order_by(*PAGE_ORDER).limit(limit + 1).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.priority_rank, last.created_at, last.id)
+        return rows, next_cursor
+
+    @staticmethod
+    def get_page_rows(
+        limit: int,
+        cursor: str = None,
+        status: str = None,
+        priority: str = None,
+        assignee_id: str = None,
+        creator: str = None
+    ):
+        """
+        Read-only variant of get_page for the list endpoint: selects only the
+        columns TicketSchema dumps, with SQLAlchemy Core, and returns plain
+        dicts equal to TicketSchema(many=True).dump(...) (same keys, same
+        order, ISO datetimes) without building ORM objects.
+        """
+        query = _filter_page(
+            select(
+                Ticket.title,
+                Ticket.description,
+                Ticket.status,
+                Ticket.priority,
+                Ticket.id,
+                Ticket.user_id,
+                Ticket.assignee_id,
+                Ticket.created_at,
+                Ticket.updated_at,
+                _creator.username,
+                _assignee.username,
+                Ticket.priority_rank
+            )
+            .outerjoin(_creator, _creator.id == Ticket.user_id)
+            .outerjoin(_assignee, _assignee.id == Ticket.assignee_id),
+            cursor, status, priority, assignee_id, creator
+        )
+        rows = db.session.execute(query.order_by(*PAGE_ORDER).limit(limit + 1)).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last.priority_rank, last.created_at, last.id)
+        return [_ticket_row(row) for row in rows], next_cursor
 
     @staticmethod
     def deleteFisical(tid):
-        t = Ticket.query.get(tid)
-        if t: 
-            db.session.delete(t)
-            db.session.commit()
-            return True
-        return False
+        try:
+            t = Ticket.query.get(tid)
+            if t: 
+                db.session.delete(t)
+                _bump_counter(t.status, t.priority, -1)
+                db.session.merge(TicketTombstone(ticket_id=t.id, deleted_at=datetime.utcnow()))
+                db.session.execute(
+                    delete(TicketTombstone).where(
+                        TicketTombstone.deleted_at < datetime.utcnow() - timedelta(hours=SYNC_TOMBSTONE_RETENTION_HOURS)
+                    )
+                )
+                db.session.commit()
+                response_cache.invalidate(TICKETS)
+                event_hub.publish("ticket.deleted", {"id": tid})
+                return True
+            return False
+        except Exception as e:
+            db.session.rollback()
+            raise e
 
     @staticmethod
     def getById(tid):
         return Ticket.query.get(tid)
 
+    @staticmethod
+    def summary() -> dict:
+        """Board header (column counts and Andon light) read from the ticket_counters table."""
+        counts = {"open": 0, "in_progress": 0, "closed": 0}
+        highest_rank = -1
+
+        for counter in TicketCounter.query.filter(TicketCounter.count > 0).all():
+            key = counter.status.lower().replace(' ', '_')
+            counts[key] = counts.get(key, 0) + counter.count
+            if key != 'closed':
+                highest_rank = max(highest_rank, PRIORITY_RANK.get(counter.priority.lower(), -1))
+
+        labels = {rank: label.capitalize() for label, rank in PRIORITY_RANK.items()}
+        return {
+            **counts,
+            "highest_open_priority": labels.get(highest_rank),
+            "andon_status": max(highest_rank, 0)
+        }
+
+    @staticmethod
+    def rebuild_counters():
+        """Recomputes ticket_counters from the tickets table (run at startup to self-heal drift)."""
+        try:
+            grouped = db.session.query(
+                Ticket.status, Ticket.priority, func.count(Ticket.id)
+            ).group_by(Ticket.status, Ticket.priority).all()
+
+            db.session.execute(delete(TicketCounter))
+            db.session.add_all([
+                TicketCounter(status=status, priority=priority, count=count)
+                for status, priority, count in grouped
+            ])
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise e
+
+def _filter_page(query, cursor, status, priority, assignee_id, creator):
+    """List filters and keyset condition, for both ORM queries and Core selects."""
+    if status:
+        query = query.filter(Ticket.status == status)
+    if priority:
+        query = query.filter(Ticket.priority == priority)
+    if assignee_id:
+        query = query.filter(Ticket.assignee_id == assignee_id)
+    if creator:
+        query = query.filter(Ticket.user_id == creator)
+
+    if cursor:
+        last_rank, last_created_at, last_id = decode_cursor(cursor, 3)
+        if not isinstance(last_rank, int):
+            raise ValueError("Invalid cursor")
+        query = query.filter(
+            tuple_(Ticket.priority_rank, Ticket.created_at, Ticket.id)
+            < (last_rank, parse_datetime(last_created_at, 'cursor'), last_id)
+        )
+    return query
+
+def _ticket_row(row) -> dict:
+    """TicketSchema layout of one get_page_rows result row."""
+    (title, description, status, priority, ticket_id, user_id, assignee_id,
+     created_at, updated_at, creator_name, assignee_name, _rank) = row
+    return {
+        "title": title,
+        "description": description,
+        "status": status,
+        "priority": priority,
+        "id": ticket_id,
+        "user_id": user_id,
+        "assignee_id": assignee_id,
+        "created_at": created_at.isoformat() if created_at is not None else None,
+        "updated_at": updated_at.isoformat() if updated_at is not None else None,
+        "creator": {"id": user_id, "username": creator_name} if creator_name is not None else None,
+        "assignee": {"id": assignee_id, "username": assignee_name} if assignee_name is not None else None
+    }
+
+def _ticket_event(ticket):
+    return {
+        "id": ticket.id,
+        "title": ticket.title,
+        "status": ticket.status,
+        "priority": ticket.priority,
+        "updated_at": ticket.updated_at.isoformat() if ticket.updated_at else None
+    }
+
+def _bump_counter(status, priority, delta):
+    """Adjusts one (status, priority) counter inside the caller's transaction (upsert, no read)."""
+    db.session.execute(
+        upsert(
+            TicketCounter.__table__,
+            ['status', 'priority'],
+            lambda excluded: {'count': TicketCounter.__table__.c.count + delta},
+        ).values(status=status, priority=priority, count=max(delta, 0))
+    )
+
 __all__ = [
+    "SCHEMA_LOAD_OPTIONS",
     "TicketService",
 ]
\ No newline at end of file
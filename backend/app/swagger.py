@@ -51,6 +51,10 @@ def build_swagger_template() -> Dict[str, Any]:
             }
         },
         'definitions': definitions,
+        # Request bodies may also be gzip/deflate-compressed (Content-Encoding);
+        # large responses are compressed when the client sends Accept-Encoding
+        'consumes': ['application/json', 'application/msgpack'],
+        'produces': ['application/json', 'application/msgpack'],
         'paths': {
             # --- AUTHENTICATION ---
             '/api/auth/register': {
@@ -91,9 +95,22 @@ def build_swagger_template() -> Dict[str, Any]:
             '/api/tickets': {
                 'get': {
                     'tags': ['Ticket Management'],
-                    'summary': 'List all Kanban tickets',
+                    'summary': 'List Kanban tickets (High > Middle > Low, newest first, keyset paginated)',
                     'security': [{'bearerAuth': []}],
-                    'responses': {'200': {'schema': {'type': 'array', 'items': {'$ref': '#/definitions/Ticket'}}}}
+                    'parameters': [
+                        {'in': 'query', 'name': 'limit', 'type': 'integer', 'description': 'Page size (default 100, capped at 500)'},
+                        {'in': 'query', 'name': 'cursor', 'type': 'string', 'description': 'Value of next_cursor from the previous page'},
+                        {'in': 'query', 'name': 'status', 'type': 'string', 'description': 'Open, In Progress or Closed'},
+                        {'in': 'query', 'name': 'priority', 'type': 'string', 'description': 'Low, Middle or High'},
+                        {'in': 'query', 'name': 'assignee_id', 'type': 'string'},
+                        {'in': 'query', 'name': 'creator', 'type': 'string', 'description': 'User ID of the ticket creator'},
+                        {'in': 'header', 'name': 'If-None-Match', 'type': 'string', 'description': 'ETag of a previous response; 304 while it is still current'}
+                    ],
+                    'responses': {
+                        '200': {'description': "Page of tickets in 'data' and the cursor of the next page in 'next_cursor' (null on the last page); ETag header"},
+                        '304': {'description': 'Not modified since the ETag in If-None-Match (no body)'},
+                        '400': {'description': 'Invalid limit or cursor'}
+                    }
                 },
                 'post': {
                     'tags': ['Ticket Management'],
@@ -105,7 +122,35 @@ def build_swagger_template() -> Dict[str, Any]:
                     'responses': {'201': {'schema': {'$ref': '#/definitions/Ticket'}}}
                 }
             },
+            '/api/tickets/summary': {
+                'get': {
+                    'tags': ['Ticket Management'],
+                    'summary': 'Board header: ticket counts per column and highest open priority',
+                    'security': [{'bearerAuth': []}],
+                    'parameters': [
+                        {'in': 'header', 'name': 'If-None-Match', 'type': 'string', 'description': 'ETag of a previous response; 304 while it is still current'}
+                    ],
+                    'responses': {
+                        '200': {'description': 'open, in_progress and closed counts, highest_open_priority (High, Middle, Low or null) and andon_status (0-2); ETag header'},
+                        '304': {'description': 'Not modified since the ETag in If-None-Match (no body)'}
+                    }
+                }
+            },
             '/api/tickets/<int:id>': {
+                'get': {
+                    'tags': ['Ticket Management'],
+                    'summary': 'Read one ticket',
+                    'security': [{'bearerAuth': []}],
+                    'parameters': [
+                        {'in': 'path', 'name': 'id', 'required': True, 'type': 'string', 'description': 'Ticket ID'},
+                        {'in': 'header', 'name': 'If-None-Match', 'type': 'string', 'description': 'ETag of a previous response; 304 while it is still current'}
+                    ],
+                    'responses': {
+                        '200': {'schema': {'$ref': '#/definitions/Ticket'}, 'description': 'Ticket fields; ETag header'},
+                        '304': {'description': 'Not modified since the ETag in If-None-Match (no body)'},
+                        '404': {'description': 'Ticket not found'}
+                    }
+                },
                 'put': {
                     'tags': ['Ticket Management'],
                     'summary': 'Update ticket status (Closed-Loop Workflow)',
@@ -130,16 +175,211 @@ def build_swagger_template() -> Dict[str, Any]:
                         '201': {
                             'description': 'ML analysis completed. Andon updated.',
                             'schema': {'$ref': '#/definitions/AndonAnalysis'}
-                        }
+                        },
+                        '202': {'description': 'Queued for asynchronous analysis (request sent with "Prefer: respond-async")'},
+                        '400': {'description': 'Missing fields or malformed body'},
+                        '413': {'description': 'Compressed body larger than REQUEST_MAX_COMPRESSED_BYTES or inflating past REQUEST_MAX_DECOMPRESSED_BYTES'},
+                        '429': {'description': 'Asynchronous ingestion queue is full'}
+                    }
+                }
+            },
+            '/api/andon/analyze/<tracking_id>': {
+                'get': {
+                    'tags': ['Andon AI Intelligence'],
+                    'summary': 'Status of an asynchronous analysis (sent with "Prefer: respond-async")',
+                    'security': [{'bearerAuth': []}],
+                    'parameters': [
+                        {'in': 'path', 'name': 'tracking_id', 'required': True, 'type': 'string', 'description': 'Tracking ID returned with the 202 response'}
+                    ],
+                    'responses': {
+                        '200': {'description': 'Current status: queued, done (with andon_status) or failed'},
+                        '404': {'description': 'Unknown tracking id, or one submitted by another user'}
+                    }
+                }
+            },
+            '/api/andon/analyze/batch': {
+                'post': {
+                    'tags': ['Andon AI Intelligence'],
+                    'summary': 'Analyze an array of telemetry samples in a single model call',
+                    'security': [{'bearerAuth': []}],
+                    'parameters': [
+                        {'in': 'body', 'name': 'telemetry_batch', 'schema': {'type': 'array', 'items': {'$ref': '#/definitions/AndonAnalysis'}}}
+                    ],
+                    'responses': {
+                        '201': {'description': 'Per-item results (with their index in the request) and per-item validation errors.'},
+                        '400': {'description': 'Payload is not an array, exceeds the batch limit or has no valid samples.'},
+                        '413': {'description': 'Compressed body larger than REQUEST_MAX_COMPRESSED_BYTES or inflating past REQUEST_MAX_DECOMPRESSED_BYTES'}
+                    }
+                }
+            },
+            '/api/andon/telemetry': {
+                'get': {
+                    'tags': ['Telemetry'],
+                    'summary': 'Scored telemetry history per device or verdict (newest first, keyset paginated)',
+                    'security': [{'bearerAuth': []}],
+                    'parameters': [
+                        {'in': 'query', 'name': 'device_id', 'type': 'string'},
+                        {'in': 'query', 'name': 'andon_status', 'type': 'integer', 'description': '0-Normal, 1-Warning, 2-Critical'},
+                        {'in': 'query', 'name': 'since', 'type': 'string', 'format': 'date-time'},
+                        {'in': 'query', 'name': 'until', 'type': 'string', 'format': 'date-time'},
+                        {'in': 'query', 'name': 'limit', 'type': 'integer', 'description': 'Page size (default 100, capped at 1000)'},
+                        {'in': 'query', 'name': 'cursor', 'type': 'string', 'description': 'Value of next_cursor from the previous page'}
+                    ],
+                    'responses': {
+                        '200': {'schema': {'type': 'object', 'properties': {
+                            'data': {'type': 'array', 'items': {'$ref': '#/definitions/AndonAnalysis'}},
+                            'next_cursor': {'type': 'string'}
+                        }}},
+                        '400': {'description': 'Invalid filter, limit or cursor'}
+                    }
+                }
+            },
+            '/api/andon/trends': {
+                'get': {
+                    'tags': ['Telemetry'],
+                    'summary': 'CPU/RAM min, max, mean and verdict counts per minute, hour or day bucket (from rollups)',
+                    'security': [{'bearerAuth': []}],
+                    'parameters': [
+                        {'in': 'query', 'name': 'since', 'type': 'string', 'format': 'date-time', 'description': 'Default: 24 hours before until'},
+                        {'in': 'query', 'name': 'until', 'type': 'string', 'format': 'date-time', 'description': 'Default: now'},
+                        {'in': 'query', 'name': 'device_id', 'type': 'string', 'description': 'One device; the whole fleet when omitted'},
+                        {'in': 'query', 'name': 'granularity', 'type': 'string', 'enum': ['minute', 'hour', 'day'], 'description': 'Default: the coarsest giving at least 24 points'}
+                    ],
+                    'responses': {
+                        '200': {'description': "Buckets in 'data', with the granularity and the bucket-aligned range used"},
+                        '400': {'description': 'Invalid range or granularity, or too many buckets'}
+                    }
+                }
+            },
+            '/api/andon/devices': {
+                'get': {
+                    'tags': ['Telemetry'],
+                    'summary': 'Latest sample and verdict of every recently active device (served from memory)',
+                    'security': [{'bearerAuth': []}],
+                    'responses': {'200': {'description': "List in 'data', most recently seen device first"}}
+                }
+            },
+            '/api/andon/devices/<device_id>/recent': {
+                'get': {
+                    'tags': ['Telemetry'],
+                    'summary': 'Last N samples of one device, newest first (served from memory)',
+                    'security': [{'bearerAuth': []}],
+                    'parameters': [
+                        {'in': 'path', 'name': 'device_id', 'required': True, 'type': 'string'},
+                        {'in': 'query', 'name': 'limit', 'type': 'integer', 'description': 'Number of samples (capped at the ring size)'}
+                    ],
+                    'responses': {
+                        '200': {'description': "Samples in 'data'"},
+                        '404': {'description': 'Device not in the hot store'}
+                    }
+                }
+            },
+            '/api/andon/models': {
+                'get': {
+                    'tags': ['Andon AI Intelligence'],
+                    'summary': 'Model versions in the registry directory and the one serving predictions',
+                    'security': [{'bearerAuth': []}],
+                    'responses': {'200': {'description': "Versions in 'data'; active, loading, previous and last_error in 'model'"}}
+                }
+            },
+            '/api/andon/models/active': {
+                'put': {
+                    'tags': ['Andon AI Intelligence'],
+                    'summary': 'Load a model version in the background and swap it in (model administrators only)',
+                    'security': [{'bearerAuth': []}],
+                    'parameters': [
+                        {'in': 'body', 'name': 'body', 'schema': {'type': 'object', 'properties': {
+                            'version': {'type': 'string', 'description': 'Artifact name without .pkl'},
+                            'wait': {'type': 'boolean', 'description': 'Block until the new version is active'}
+                        }}}
+                    ],
+                    'responses': {
+                        '200': {'description': 'Version active (wait=true)'},
+                        '202': {'description': 'Version loading; poll /api/andon/models'},
+                        '403': {'description': 'User is not in ANDON_MODEL_ADMINS'},
+                        '404': {'description': 'Unknown model version'},
+                        '409': {'description': 'Another version is still loading'}
+                    }
+                }
+            },
+            '/api/andon/models/rollback': {
+                'post': {
+                    'tags': ['Andon AI Intelligence'],
+                    'summary': 'Switch back to the previously active model version (model administrators only)',
+                    'security': [{'bearerAuth': []}],
+                    'responses': {
+                        '200': {'description': 'Previous version active (wait=true)'},
+                        '202': {'description': 'Previous version loading'},
+                        '403': {'description': 'User is not in ANDON_MODEL_ADMINS'},
+                        '409': {'description': 'No previous version, or another version is still loading'}
+                    }
+                }
+            },
+            '/api/andon/shadow': {
+                'get': {
+                    'tags': ['Andon AI Intelligence'],
+                    'summary': 'Shadow model (ANDON_SHADOW_VERSION) compared with the primary model on live traffic',
+                    'security': [{'bearerAuth': []}],
+                    'responses': {'200': {'description': "Agreement rate, confusion matrix (rows: primary, columns: shadow) and per-class latency in 'shadow'"}}
+                }
+            },
+            '/api/cache': {
+                'get': {
+                    'tags': ['Ticket Management'],
+                    'summary': 'Hit/miss metrics of the /api/tickets and /api/logs response cache',
+                    'security': [{'bearerAuth': []}],
+                    'responses': {'200': {'description': "Size, capacity, hits, misses, stale entries, evictions and current table versions in 'cache'"}}
+                }
+            },
+            '/api/sync': {
+                'get': {
+                    'tags': ['Ticket Management'],
+                    'summary': 'Tickets and logs changed since a cursor (delta sync for dashboards)',
+                    'security': [{'bearerAuth': []}],
+                    'parameters': [
+                        {'in': 'query', 'name': 'since', 'type': 'string', 'description': 'Cursor returned by the previous call; omit for a full snapshot'},
+                        {'in': 'header', 'name': 'If-None-Match', 'type': 'string', 'description': 'ETag of a previous response; 304 while no ticket or log changed'}
+                    ],
+                    'responses': {
+                        '200': {'description': "Changed 'tickets' (apply as upserts), 'deleted' ticket ids, new 'logs' (oldest first; may repeat, deduplicate by id), 'has_more', 'reset' (true on a full snapshot) and the next 'cursor'; ETag header"},
+                        '304': {'description': 'Nothing changed since the response with this ETag: keep using the same cursor (no body)'},
+                        '400': {'description': 'Invalid cursor'}
+                    }
+                }
+            },
+            '/api/stream': {
+                'get': {
+                    'tags': ['Ticket Management'],
+                    'summary': 'Server-Sent Events stream of ticket and Andon changes',
+                    'description': 'Events: ticket.created, ticket.updated, ticket.deleted, andon.analysis, andon.batch. '
+                                   'Idle connections receive a keep-alive comment. Browsers may pass the token as ?jwt=<token>.',
+                    'produces': ['text/event-stream'],
+                    'security': [{'bearerAuth': []}],
+                    'responses': {
+                        '200': {'description': 'text/event-stream'},
+                        '503': {'description': 'Subscriber limit reached'}
                     }
                 }
             },
             '/api/logs': {
                 'get': {
                     'tags': ['Telemetry'],
-                    'summary': 'Consult history of logs processed by AI',
+                    'summary': 'Consult the audit log (newest first, keyset paginated); Andon results and their andon_status filter live in /api/andon/telemetry',
                     'security': [{'bearerAuth': []}],
-                    'responses': {'200': {'schema': {'type': 'array', 'items': {'$ref': '#/definitions/Log'}}}}
+                    'parameters': [
+                        {'in': 'query', 'name': 'limit', 'type': 'integer', 'description': 'Page size (default 50, capped at 200)'},
+                        {'in': 'query', 'name': 'cursor', 'type': 'string', 'description': 'Value of next_cursor from the previous page'},
+                        {'in': 'query', 'name': 'action', 'type': 'string'},
+                        {'in': 'query', 'name': 'user_id', 'type': 'string'},
+                        {'in': 'query', 'name': 'since', 'type': 'string', 'format': 'date-time', 'description': 'Inclusive lower bound on timestamp'},
+                        {'in': 'query', 'name': 'until', 'type': 'string', 'format': 'date-time', 'description': 'Exclusive upper bound on timestamp'},
+                        {'in': 'header', 'name': 'If-None-Match', 'type': 'string', 'description': 'ETag of a previous response; 304 while it is still current'}
+                    ],
+                    'responses': {
+                        '200': {'description': "Page of logs in 'data' and the cursor of the next page in 'next_cursor' (null on the last page); ETag header"},
+                        '304': {'description': 'Not modified since the ETag in If-None-Match (no body)'},
+                        '400': {'description': 'Invalid filter, limit or cursor'}
+                    }
                 }
             }
         }
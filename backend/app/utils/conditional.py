@@ -0,0 +1,48 @@
+import hashlib
+from flask import Response, request
+from werkzeug.http import quote_etag
+from app.services.response_cache import response_cache, normalize_params
+from app.utils.wire import CODINGS, response_mediatype
+
+def etag_for(scope: str, params: dict) -> str:
+    """
+    Strong ETag of a read derived from the table version (see response_cache),
+    the normalized parameters and the negotiated media type, without
+    touching the rows. Local version tokens carry a per-process nonce, so
+    ETags from different workers never match each other.
+    """
+    variant = (normalize_params(params), response_mediatype())
+    digest = hashlib.blake2b(repr(variant).encode('utf-8'), digest_size=8).hexdigest()
+    return f"{scope}.{response_cache.version(scope)}.{digest}"
+
+def not_modified(etag: str):
+    """
+    A 304 response when the request's If-None-Match still matches `etag`
+    (or its compressed variant, see app.utils.wire), otherwise None.
+    """
+    for candidate in (etag, *(f"{etag}-{coding}" for coding in CODINGS)):
+        if request.if_none_match.contains_weak(candidate):
+            response = Response(status=304)
+            response.headers.update(validator_headers(candidate))
+            return response
+    return None
+
+def validator_headers(etag: str) -> dict:
+    # no-cache: clients may keep the body but must revalidate it on every poll
+    return {
+        "ETag": quote_etag(etag),
+        "Cache-Control": "private, no-cache",
+        "Vary": "Accept, Accept-Encoding"
+    }
+
+def with_etag(result: tuple, etag: str) -> tuple:
+    """Adds the validator headers to a (body, status) pair from app.utils.httpResponses."""
+    body, status = result
+    return body, status, validator_headers(etag)
+
+__all__ = [
+    "etag_for",
+    "not_modified",
+    "validator_headers",
+    "with_etag",
+]
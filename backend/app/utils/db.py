@@ -1,11 +1,142 @@
 import os
+import weakref
+from flask import Flask
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import make_url
 from app.models.user import User
 from app.extensions import db
+from app.config import (
+    SQLALCHEMY_DATABASE_URI,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE
+)
 
 DB_PATH = 'database.db'
 
+# Engines disposed in forked children; the fork hook itself is registered once per process
+_fork_engines = weakref.WeakSet()
+_fork_hook_registered = False
+
 def resetAndCreateDb(app, create_default_user=True):
     with app.app_context():
         db.create_all()
         if create_default_user:
-            pass
\ No newline at end of file
+            pass
+
+def configure_database(app: Flask):
+    """
+    Sets the database URL and engine options before db.init_app(app).
+    A URL already present in app.config (e.g. from tests) is kept.
+    """
+    uri = app.config.setdefault('SQLALCHEMY_DATABASE_URI', SQLALCHEMY_DATABASE_URI)
+    url = make_url(uri)
+
+    options = {'pool_pre_ping': True}
+    if not _is_memory_sqlite(url):
+        options.update({
+            'pool_size': DB_POOL_SIZE,
+            'max_overflow': DB_MAX_OVERFLOW,
+            'pool_timeout': DB_POOL_TIMEOUT,
+            'pool_recycle': DB_POOL_RECYCLE
+        })
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', options)
+
+def configure_sqlite_pragmas(app: Flask):
+    """
+    Applies the SQLITE_* settings of app.config to every new connection of
+    the app's engines (call after db.init_app(app), before the first query).
+    """
+    pragmas = [
+        ("journal_mode", app.config['SQLITE_JOURNAL_MODE']),
+        ("synchronous", app.config['SQLITE_SYNCHRONOUS']),
+        ("cache_size", -int(app.config['SQLITE_CACHE_SIZE_KB'])),
+        ("mmap_size", int(app.config['SQLITE_MMAP_SIZE'])),
+        ("busy_timeout", int(app.config['SQLITE_BUSY_TIMEOUT_MS'])),
+        ("temp_store", "MEMORY"),
+    ]
+
+    def set_pragmas(dbapi_connection, connection_record):
+        if type(dbapi_connection).__module__.split('.')[0] not in ('sqlite3', 'pysqlite2'):
+            return
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+        # Restored by the request deadline once a connection leaves a request
+        connection_record.info['busy_timeout_ms'] = app.config['SQLITE_BUSY_TIMEOUT_MS']
+
+    with app.app_context():
+        for engine in db.engines.values():
+            event.listen(engine, "connect", set_pragmas)
+
+def ensure_indexes(app):
+    """
+    db.create_all() only creates missing tables, so indexes declared later on
+    existing tables are created here (CREATE INDEX only when absent).
+    """
+    with app.app_context():
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=db.engine, checkfirst=True)
+
+def ensure_columns(app):
+    """
+    db.create_all() does not alter existing tables, so nullable columns
+    added to a model later are created here with ALTER TABLE ... ADD COLUMN.
+    """
+    with app.app_context():
+        inspector = inspect(db.engine)
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                with db.engine.begin() as connection:
+                    connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+
+def upsert(table, index_elements, update):
+    """
+    INSERT ... ON CONFLICT (index_elements) DO UPDATE for the session's
+    engine (SQLite, PostgreSQL; MySQL via ON DUPLICATE KEY UPDATE).
+    `update(excluded)` returns the SET clause as a dict; `excluded` holds
+    the values of the row that failed to insert.
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect in ('mysql', 'mariadb'):
+        from sqlalchemy.dialects.mysql import insert
+        statement = insert(table)
+        return statement.on_duplicate_key_update(update(statement.inserted))
+    else:
+        raise NotImplementedError(f"No upsert for the {dialect} dialect")
+
+    statement = insert(table)
+    return statement.on_conflict_do_update(index_elements=index_elements, set_=update(statement.excluded))
+
+def dispose_engine_after_fork(app):
+    """Forked workers start with an empty pool instead of inheriting the parent's SQLite connections."""
+    global _fork_hook_registered
+    if not hasattr(os, 'register_at_fork'):
+        return
+    with app.app_context():
+        _fork_engines.add(db.engine)
+    if not _fork_hook_registered:
+        os.register_at_fork(after_in_child=_dispose_fork_engines)
+        _fork_hook_registered = True
+
+def _dispose_fork_engines():
+    for engine in list(_fork_engines):
+        engine.dispose(close=False)
+
+def _is_memory_sqlite(url) -> bool:
+    return url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')
@@ -0,0 +1,107 @@
+import sqlite3
+import time
+from flask import Flask, g, has_request_context, jsonify, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.config import REQUEST_TIMEOUT, ROUTE_TIMEOUTS, SQLITE_BUSY_TIMEOUT_MS
+from app.utils.httpResponses import error_504
+
+# The progress handler runs every N SQLite VM instructions
+PROGRESS_HANDLER_STEPS = 1000
+
+class RequestTimeoutError(Exception):
+    pass
+
+def budget_for(path: str):
+    """Deadline budget (seconds) for a path, or None when the route is exempt."""
+    matches = [prefix for prefix in ROUTE_TIMEOUTS if path.startswith(prefix)]
+    if not matches:
+        return REQUEST_TIMEOUT
+    return ROUTE_TIMEOUTS[max(matches, key=len)]
+
+def current_deadline():
+    """Monotonic deadline of the current request, or None (no request, or exempt route)."""
+    if not has_request_context():
+        return None
+    return g.get('deadline')
+
+def remaining():
+    deadline = current_deadline()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+def check_deadline():
+    """Cooperative checkpoint for services: raises RequestTimeoutError once the budget is spent."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise RequestTimeoutError(f"Request exceeded its {g.deadline_budget} second budget.")
+
+def init_app(app: Flask):
+    """
+    Per-request deadlines that work with threaded and multi-process servers.
+
+    The deadline lives in flask.g, services call check_deadline() between
+    steps, and every SQLite statement is bounded by a busy timeout and a
+    progress handler derived from the time left.
+    """
+
+    @app.before_request
+    def start_deadline():
+        budget = budget_for(request.path)
+        if budget is not None:
+            g.deadline_budget = budget
+            g.deadline = time.monotonic() + budget
+
+    @app.after_request
+    def enforce_deadline(response):
+        # Controllers turn most exceptions into 500s; report those as timeouts when the budget ran out
+        left = remaining()
+        if left is not None and left <= 0 and response.status_code >= 500:
+            body, status = error_504(f"Request timed out after {g.deadline_budget} seconds.")
+            response = jsonify(body)
+            response.status_code = status
+        return response
+
+    @app.errorhandler(RequestTimeoutError)
+    def handle_timeout_error(e):
+        body, status = error_504(str(e))
+        return jsonify(body), status
+
+    if not event.contains(Engine, "before_cursor_execute", _apply_deadline):
+        event.listen(Engine, "before_cursor_execute", _apply_deadline)
+
+def _apply_deadline(conn, cursor, statement, parameters, context, executemany):
+    deadline = current_deadline()
+    if deadline is not None and time.monotonic() >= deadline:
+        raise RequestTimeoutError(f"Request exceeded its {g.deadline_budget} second budget.")
+
+    dbapi_connection = conn.connection.dbapi_connection
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    if conn.info.get('deadline') == deadline:
+        return
+
+    if deadline is None:
+        # Pooled connection reused outside a request (e.g. a background worker)
+        dbapi_connection.set_progress_handler(None, 0)
+        dbapi_connection.execute(f"PRAGMA busy_timeout = {conn.info.get('busy_timeout_ms', SQLITE_BUSY_TIMEOUT_MS)}")
+        conn.info.pop('deadline', None)
+        return
+
+    left_ms = max(int((deadline - time.monotonic()) * 1000), 1)
+    dbapi_connection.set_progress_handler(
+        lambda: 1 if time.monotonic() >= deadline else 0,
+        PROGRESS_HANDLER_STEPS
+    )
+    dbapi_connection.execute(f"PRAGMA busy_timeout = {left_ms}")
+    conn.info['deadline'] = deadline
+
+__all__ = [
+    "RequestTimeoutError",
+    "budget_for",
+    "check_deadline",
+    "current_deadline",
+    "remaining",
+    "init_app",
+]
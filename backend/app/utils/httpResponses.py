@@ -37,12 +37,24 @@ def success_201(data, message="Resource created successfully"):
         "data": data 
     }, 201
 
-def error_400(details="Missing required fields"):
+def success_202(data, message="Accepted for processing"):
     return {
+        "success": True,
+        "message": message,
+        "data": data
+    }, 202
+
+def error_400(details="Missing required fields", errors=None):
+    response = {
         "success": False,
         "error": "Bad Request",
         "message": details
-    }, 400
+    }
+
+    if errors is not None:
+        response["errors"] = errors
+
+    return response, 400
     
 def error_401(message="Unauthorized access"):
     return {
@@ -51,6 +63,13 @@ def error_401(message="Unauthorized access"):
         "message": message
     }, 401    
 
+def error_403(message="Forbidden"):
+    return {
+        "success": False,
+        "error": "Forbidden",
+        "message": message
+    }, 403
+
 def error_404(message="Resource not found"):
     return {
         "success": False,
@@ -65,6 +84,20 @@ def error_409(message="Resource already exists"):
         "message": message
     }, 409
 
+def error_413(message="Payload too large"):
+    return {
+        "success": False,
+        "error": "Payload Too Large",
+        "message": message
+    }, 413
+
+def error_429(message="Too many requests"):
+    return {
+        "success": False,
+        "error": "Too Many Requests",
+        "message": message
+    }, 429
+
 def error_500(message="An error occurred while processing your request."):
     return {
         "success": False,
@@ -72,6 +105,13 @@ def error_500(message="An error occurred while processing your request."):
         "message": message
     }, 500
 
+def error_503(message="Service temporarily unavailable"):
+    return {
+        "success": False,
+        "error": "Service Unavailable",
+        "message": message
+    }, 503
+
 def error_504(message="The request timed out."):
     return {
         "success": False,
@@ -0,0 +1,39 @@
+from flask import current_app, make_response
+from flask_restful.representations.json import output_json as stdlib_output_json
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib encoder is used instead
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE) if orjson else 0
+
+def output_json(data, code, headers=None):
+    """
+    Flask-RESTful representation for application/json.
+
+    Uses Flask-RESTful's stdlib encoder unless RESPONSE_JSON_ENCODER is
+    'orjson'. The orjson document is the same (same keys in the same order,
+    same values) but not the same bytes: insignificant whitespace differs
+    and non-ASCII text is sent as UTF-8 instead of \\u escapes. The stdlib
+    encoder is still used when orjson is not installed, when RESTFUL_JSON
+    options are configured, in debug mode (indented output) and for values
+    orjson cannot encode.
+    """
+    config = current_app.config
+    if (config.get('RESPONSE_JSON_ENCODER') != 'orjson' or orjson is None
+            or current_app.debug or config.get('RESTFUL_JSON')):
+        return stdlib_output_json(data, code, headers)
+
+    try:
+        dumped = orjson.dumps(data, option=ORJSON_OPTIONS)
+    except TypeError:
+        return stdlib_output_json(data, code, headers)
+
+    response = make_response(dumped, code)
+    response.headers.extend(headers or {})
+    return response
+
+__all__ = [
+    "output_json",
+]
@@ -0,0 +1,89 @@
+import json
+
+CHUNK_SIZE = 1 << 16
+# A value still incomplete after this many characters is treated as malformed
+MAX_RECORD_SIZE = 1 << 20
+
+def iter_json_records(stream, chunk_size: int = CHUNK_SIZE):
+    """
+    Yields the values of a top-level JSON array (or of a JSON Lines file)
+    one at a time, reading `stream` in chunks of `chunk_size` characters.
+
+    Only the current chunk and the value being decoded are held in memory,
+    so files larger than RAM can be processed. Raises ValueError on
+    malformed input, including empty elements ('[1,,2]') and anything but
+    whitespace after the closing ']'.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+    started = False
+    in_array = False
+    closed = False
+    # Inside the array: 'first' (after '['), 'value' (after ',') or 'separator' (after a value)
+    expecting = None
+
+    while True:
+        # Skip whitespace and the array punctuation between values
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n':
+                position += 1
+            if position == len(buffer):
+                if eof:
+                    if in_array:
+                        raise ValueError("Unexpected end of file: JSON array is not closed")
+                    return
+                buffer, position = stream.read(chunk_size), 0
+                eof = not buffer
+                continue
+
+            char = buffer[position]
+            if not started:
+                started = True
+                if char == '[':
+                    in_array = True
+                    expecting = 'first'
+                    position += 1
+                    continue
+            if closed:
+                raise ValueError("Unexpected data after the end of the JSON array")
+            if in_array and char == ',':
+                if expecting != 'separator':
+                    raise ValueError("Empty element in JSON array")
+                expecting = 'value'
+                position += 1
+                continue
+            if in_array and char == ']':
+                if expecting == 'value':
+                    raise ValueError("Trailing comma in JSON array")
+                in_array = False
+                closed = True
+                position += 1
+                continue
+            if in_array and expecting == 'separator':
+                raise ValueError("Missing ',' between JSON array elements")
+            break
+
+        value, position, buffer, eof = _decode_next(decoder, stream, chunk_size, buffer, position, eof)
+        expecting = 'separator'
+        yield value
+
+def _decode_next(decoder, stream, chunk_size, buffer, position, eof):
+    while True:
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+            # A bare number or literal may continue in the next chunk
+            if end < len(buffer) or eof or isinstance(value, (dict, list, str)):
+                return value, end, buffer, eof
+        except json.JSONDecodeError as e:
+            if eof or len(buffer) - position > MAX_RECORD_SIZE:
+                raise ValueError(f"Malformed JSON record: {e.msg}") from e
+
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buffer, position = buffer[position:] + chunk, 0
+
+__all__ = [
+    "iter_json_records",
+]
@@ -0,0 +1,77 @@
+from sqlalchemy import case, delete, func, update
+from app.extensions import db
+from app.models.log import Log
+from app.models.telemetry import Telemetry
+from app.models.ticket import Ticket, PRIORITY_RANK
+
+DEVICE_PREFIX = "Device: "
+
+def migrate_logs_to_telemetry(batch_size: int = 1000) -> int:
+    """
+    One-off move of Andon analyses stored in `logs` (before the telemetry
+    table existed) into `telemetry`, one transaction per chunk. Rows keep
+    their id and timestamp. Idempotent: returns 0 once nothing is left.
+    """
+    moved = 0
+    legacy = Log.query.filter(
+        Log.action == "AI_ANDON_ANALYSIS",
+        Log.cpu_usage.isnot(None)
+    ).order_by(Log.timestamp, Log.id)
+
+    while True:
+        rows = legacy.limit(batch_size).all()
+        if not rows:
+            return moved
+
+        try:
+            db.session.execute(Telemetry.__table__.insert(), [
+                {
+                    "id": row.id,
+                    "device_id": _device_from_details(row.details),
+                    "timestamp": row.timestamp,
+                    "cpu_usage_pct": row.cpu_usage,
+                    "mem_available_gb": row.ram_usage or 0.0,
+                    "active_threats": row.active_threats or 0,
+                    "untrusted_processes": row.untrusted_processes or 0,
+                    "andon_status": row.andon_status
+                }
+                for row in rows
+            ])
+            db.session.execute(
+                delete(Log).where(Log.id.in_([row.id for row in rows])),
+                execution_options={"synchronize_session": False}
+            )
+            db.session.commit()
+            db.session.expunge_all()
+            moved += len(rows)
+        except Exception as e:
+            db.session.rollback()
+            raise e
+
+def fill_priority_rank() -> int:
+    """
+    Sets tickets.priority_rank on rows created before the column existed.
+    Idempotent: returns 0 once every ticket has a rank.
+    """
+    try:
+        result = db.session.execute(
+            update(Ticket)
+            .where(Ticket.priority_rank.is_(None))
+            .values(priority_rank=case(PRIORITY_RANK, value=func.lower(Ticket.priority), else_=-1))
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return result.rowcount
+    except Exception as e:
+        db.session.rollback()
+        raise e
+
+def _device_from_details(details) -> str:
+    if details and details.startswith(DEVICE_PREFIX):
+        return details[len(DEVICE_PREFIX):].strip() or "UNKNOWN"
+    return "UNKNOWN"
+
+__all__ = [
+    "fill_priority_rank",
+    "migrate_logs_to_telemetry",
+]
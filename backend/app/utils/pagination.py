@@ -0,0 +1,53 @@
+import base64
+import json
+from datetime import datetime, timezone
+
+def encode_cursor(*values) -> str:
+    """Packs the keyset of the last returned row into an opaque, URL-safe cursor."""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """Unpacks a cursor created by encode_cursor. Raises ValueError when it is malformed."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+def parse_limit(raw, default: int, maximum: int) -> int:
+    """Validates the 'limit' query parameter and clamps it to the server-side maximum."""
+    if raw is None or raw == '':
+        return default
+    try:
+        limit = int(raw)
+    except (TypeError, ValueError):
+        raise ValueError("'limit' must be an integer")
+    if limit < 1:
+        raise ValueError("'limit' must be greater than zero")
+    return min(limit, maximum)
+
+def parse_datetime(raw, name: str):
+    if raw is None or raw == '':
+        return None
+    try:
+        value = datetime.fromisoformat(raw)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{name}' must be an ISO 8601 datetime")
+
+    # Timestamps are stored as naive UTC
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+__all__ = [
+    "encode_cursor",
+    "decode_cursor",
+    "parse_limit",
+    "parse_datetime",
+]
@@ -0,0 +1,38 @@
+from flask import Flask, g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+HEADER = 'X-SQL-Statements'
+
+def statement_count() -> int:
+    """SQL statements executed so far by the current request (0 outside a request)."""
+    if not has_request_context():
+        return 0
+    return g.get('sql_statements', 0)
+
+def init_app(app: Flask):
+    """
+    Counts the SQL statements each request executes, in flask.g. With
+    SQL_STATEMENT_HEADER the count is sent back in the X-SQL-Statements
+    header, so tests can check that an endpoint's query count does not grow
+    with the number of rows it returns. Statements run by background
+    threads (audit writer, shadow evaluator) are not attributed to requests.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _count_statement):
+        event.listen(Engine, "before_cursor_execute", _count_statement)
+
+    if app.config['SQL_STATEMENT_HEADER']:
+        @app.after_request
+        def report_statements(response):
+            response.headers[HEADER] = str(statement_count())
+            return response
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        g.sql_statements = g.get('sql_statements', 0) + 1
+
+__all__ = [
+    "HEADER",
+    "statement_count",
+    "init_app",
+]
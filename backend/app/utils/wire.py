@@ -0,0 +1,191 @@
+import json
+import zlib
+from datetime import datetime
+
+import msgpack
+from flask import Flask, current_app, make_response, request
+from werkzeug.exceptions import RequestEntityTooLarge
+
+JSON = 'application/json'
+MSGPACK = 'application/msgpack'
+# Response media types offered for MessagePack, in Api.representations order
+MSGPACK_TYPES = (MSGPACK, 'application/x-msgpack')
+# Request media types read as MessagePack
+MSGPACK_REQUEST_TYPES = (*MSGPACK_TYPES, 'application/vnd.msgpack')
+
+# Response codings, in server preference order
+CODINGS = ('gzip', 'deflate')
+_WBITS = {
+    'gzip': 16 + zlib.MAX_WBITS,
+    'x-gzip': 16 + zlib.MAX_WBITS,
+    'deflate': zlib.MAX_WBITS,
+}
+
+class PayloadTooLarge(ValueError):
+    pass
+
+def request_body(silent: bool = False):
+    """
+    Decoded request body, read from JSON or MessagePack (Content-Type) and
+    undoing any gzip/deflate Content-Encoding first, so controllers validate
+    the same Python structure whatever the wire format.
+
+    Raises PayloadTooLarge when a compressed body is larger than
+    REQUEST_MAX_COMPRESSED_BYTES (checked before it is read) or inflates
+    past REQUEST_MAX_DECOMPRESSED_BYTES, and ValueError when the body is missing
+    or malformed; with silent=True the latter returns None instead, like
+    request.get_json(silent=True).
+    """
+    codings = [coding.strip().lower() for coding in request.headers.get('Content-Encoding', '').split(',') if coding.strip()]
+    limit = current_app.config['REQUEST_MAX_DECOMPRESSED_BYTES']
+    body = _read_body(current_app.config['REQUEST_MAX_COMPRESSED_BYTES'] if codings else None)
+
+    try:
+        # Codings are listed in the order they were applied
+        for coding in reversed(codings):
+            body = _decompress(body, coding, limit)
+        if not body:
+            raise ValueError("Request body is empty")
+        if request.mimetype in MSGPACK_REQUEST_TYPES:
+            return _unpack(body)
+        return json.loads(body)
+    except PayloadTooLarge:
+        raise
+    except ValueError:
+        if silent:
+            return None
+        raise
+
+def response_mediatype() -> str:
+    """Media type Flask-RESTful will pick for this request's Accept header."""
+    return request.accept_mimetypes.best_match((JSON, *MSGPACK_TYPES), default=JSON)
+
+def output_msgpack(data, code, headers=None):
+    """Flask-RESTful representation for MessagePack clients (Accept: application/msgpack)."""
+    response = make_response(msgpack.packb(data, default=_encode_default, use_bin_type=True), code)
+    response.headers.extend(headers or {})
+    return response
+
+def init_app(app: Flask):
+    """
+    Compresses JSON and MessagePack responses of at least
+    RESPONSE_COMPRESS_MIN_BYTES with the client's preferred coding. A
+    compressed response's ETag gets a '-<coding>' suffix, so the encoded
+    and identity bodies never share a strong validator.
+    """
+
+    @app.after_request
+    def compress_response(response):
+        threshold = app.config['RESPONSE_COMPRESS_MIN_BYTES']
+        if (
+            threshold <= 0
+            or response.mimetype not in (JSON, *MSGPACK_TYPES)
+            or response.direct_passthrough
+            or response.is_streamed
+        ):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        coding = _accepted_coding()
+        if (
+            coding is None
+            or response.status_code < 200
+            or response.status_code in (204, 206, 304)
+            or 'Content-Encoding' in response.headers
+            or response.content_length is not None and response.content_length < threshold
+        ):
+            return response
+
+        body = response.get_data()
+        if len(body) < threshold:
+            return response
+
+        level = app.config['RESPONSE_COMPRESS_LEVEL']
+        if coding == 'gzip':
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        else:
+            compressor = zlib.compressobj(level)
+        response.set_data(compressor.compress(body) + compressor.flush())
+        response.headers['Content-Encoding'] = coding
+
+        etag, weak = response.get_etag()
+        if etag:
+            response.set_etag(f"{etag}-{coding}", weak)
+        return response
+
+def _accepted_coding():
+    accepted = request.accept_encodings
+    best = max(CODINGS, key=lambda coding: accepted[coding])
+    return best if accepted[best] > 0 else None
+
+def _read_body(limit):
+    if limit is None:
+        return request.get_data()
+    if request.content_length is not None and request.content_length > limit:
+        raise PayloadTooLarge(f"Compressed body exceeds {limit} bytes")
+    # Also bounds chunked bodies, which carry no Content-Length
+    request.max_content_length = limit
+    try:
+        return request.get_data()
+    except RequestEntityTooLarge:
+        raise PayloadTooLarge(f"Compressed body exceeds {limit} bytes")
+
+def _decompress(body: bytes, coding: str, limit: int) -> bytes:
+    if coding == 'identity':
+        return body
+    if coding not in _WBITS:
+        raise ValueError(f"Unsupported Content-Encoding '{coding}'")
+    try:
+        # A gzip body may hold several members back to back (RFC 1952)
+        return _inflate(body, _WBITS[coding], limit, members=coding != 'deflate')
+    except zlib.error:
+        # 'deflate' is zlib-wrapped by the spec, but some clients send raw deflate
+        if coding != 'deflate':
+            raise ValueError(f"Malformed {coding} body")
+    try:
+        return _inflate(body, -zlib.MAX_WBITS, limit)
+    except zlib.error:
+        raise ValueError(f"Malformed {coding} body")
+
+def _inflate(body: bytes, wbits: int, limit: int, members: bool = False) -> bytes:
+    parts = []
+    size = 0
+    while True:
+        inflater = zlib.decompressobj(wbits)
+        # Never inflates more than one byte past the limit
+        part = inflater.decompress(body, limit - size + 1)
+        size += len(part)
+        if size > limit:
+            raise PayloadTooLarge(f"Decompressed body exceeds {limit} bytes")
+        if not inflater.eof:
+            raise ValueError("Truncated compressed body")
+        parts.append(part)
+
+        body = inflater.unused_data
+        if not body:
+            return b''.join(parts)
+        if not members:
+            raise ValueError("Unexpected data after the compressed body")
+
+def _unpack(body: bytes):
+    try:
+        return msgpack.unpackb(body, raw=False)
+    except Exception:
+        raise ValueError("Malformed MessagePack body")
+
+def _encode_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__} as MessagePack")
+
+__all__ = [
+    "CODINGS",
+    "JSON",
+    "MSGPACK",
+    "MSGPACK_TYPES",
+    "PayloadTooLarge",
+    "init_app",
+    "output_msgpack",
+    "request_body",
+    "response_mediatype",
+]
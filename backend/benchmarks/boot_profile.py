@@ -0,0 +1,79 @@
+"""
+Worker boot time and memory for the Andon model loading strategies.
+
+Each scenario runs in a fresh interpreter: it builds the app with create_app(),
+then forks a worker that scores one sample, as a pre-fork server would.
+
+    cd backend && python benchmarks/boot_profile.py
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+SCENARIOS = {
+    "lazy": {"ANDON_MODEL_PRELOAD": "0"},
+    "preload": {"ANDON_MODEL_PRELOAD": "1", "ANDON_MODEL_MMAP": "0"},
+    "preload+mmap": {"ANDON_MODEL_PRELOAD": "1", "ANDON_MODEL_MMAP": "1"},
+}
+
+CHILD = r"""
+import json, os, resource, sys, time, warnings
+warnings.simplefilter("ignore")
+sys.path.insert(0, os.getcwd())
+
+def memory():
+    values = {}
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            name, _, rest = line.partition(":")
+            if name in ("Rss", "Private_Clean", "Private_Dirty"):
+                values[name] = int(rest.split()[0])
+    return values
+
+start = time.perf_counter()
+from app import create_app
+app = create_app()
+boot = time.perf_counter() - start
+master = memory()
+
+read_fd, write_fd = os.pipe()
+if os.fork() == 0:
+    from app.ml_logic.registry import predictor_registry
+    start = time.perf_counter()
+    predictor_registry.get().predict(12.0, 14.5, 0, 0)
+    first = time.perf_counter() - start
+    worker = memory()
+    os.write(write_fd, json.dumps({"first_prediction_s": first, **{"worker_" + k: v for k, v in worker.items()}}).encode())
+    os._exit(0)
+os.wait()
+result = json.loads(os.read(read_fd, 65536))
+result.update({
+    "boot_s": boot,
+    "master_rss_kb": master["Rss"],
+    "sklearn_in_master": "sklearn" in sys.modules,
+})
+print(json.dumps(result))
+"""
+
+def run(env_overrides):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{tmp}/boot.db", AUDIT_LOG_MODE="sync", **env_overrides)
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD], env=env, capture_output=True, text=True, check=True
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    print(f"{'scenario':<14}{'boot s':>8}{'master RSS MB':>15}{'1st predict ms':>16}{'worker private MB':>19}")
+    for name, overrides in SCENARIOS.items():
+        r = run(overrides)
+        private = (r["worker_Private_Clean"] + r["worker_Private_Dirty"]) / 1024
+        print(
+            f"{name:<14}{r['boot_s']:>8.2f}{r['master_rss_kb'] / 1024:>15.1f}"
+            f"{r['first_prediction_s'] * 1000:>16.1f}{private:>19.1f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+CPU time and allocations of the ticket and log list responses per 10k rows:
+ORM objects + marshmallow schema + stdlib json (the old path) against the
+Core read path (get_page_rows) with stdlib json (the default, same bytes)
+and with orjson (RESPONSE_JSON_ENCODER=orjson).
+
+    cd backend && python benchmarks/list_encoding.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+import warnings
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+warnings.simplefilter("ignore")
+
+import orjson
+
+from app import create_app
+from app.controllers.log import LogSchema
+from app.extensions import db
+from app.models.log import Log
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.schemas.ticket import TicketSchema
+from app.services.log import LogService
+from app.services.ticket import TicketService
+
+ROWS = 10_000
+
+def seed():
+    users = [{"id": str(uuid.uuid4()), "username": f"user{index}"} for index in range(50)]
+    db.session.execute(User.__table__.insert(), users)
+    start = datetime(2026, 1, 1)
+    db.session.execute(Ticket.__table__.insert(), [
+        {
+            "id": str(uuid.uuid4()), "title": f"Ticket {index}", "description": "Servidor sem resposta " * 4,
+            "status": "Open", "priority": ("High", "Middle", "Low")[index % 3],
+            "created_at": start + timedelta(seconds=index), "updated_at": start + timedelta(seconds=index),
+            "user_id": users[index % 50]["id"], "assignee_id": users[(index + 7) % 50]["id"] if index % 2 else None,
+            "comments": "...", "attachments": "..."
+        }
+        for index in range(ROWS)
+    ])
+    db.session.execute(Log.__table__.insert(), [
+        {"id": str(uuid.uuid4()), "timestamp": start + timedelta(seconds=index), "action": "TICKET_MOVE", "details": f"Ticket {index} -> Closed"}
+        for index in range(ROWS)
+    ])
+    db.session.commit()
+
+def measure(fn, runs=3):
+    """Best CPU seconds and peak traced bytes of fn()."""
+    cpu = []
+    for _ in range(runs):
+        db.session.expunge_all()
+        start = time.process_time()
+        fn()
+        cpu.append(time.process_time() - start)
+    db.session.expunge_all()
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(cpu), peak
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{os.path.join(directory, 'bench.db')}",
+            'AUDIT_LOG_MODE': 'sync'
+        })
+        with app.app_context():
+            seed()
+            scenarios = {
+                "tickets: ORM + schema + json": lambda: json.dumps({"data": TicketSchema(many=True).dump(TicketService.get_page(ROWS)[0])}),
+                "tickets: Core rows + json": lambda: json.dumps({"data": TicketService.get_page_rows(ROWS)[0]}),
+                "tickets: Core rows + orjson": lambda: orjson.dumps({"data": TicketService.get_page_rows(ROWS)[0]}),
+                "logs: ORM + schema + json": lambda: json.dumps({"data": LogSchema(many=True).dump(LogService.get_page(ROWS)[0])}),
+                "logs: Core rows + json": lambda: json.dumps({"data": LogService.get_page_rows(ROWS)[0]}),
+                "logs: Core rows + orjson": lambda: orjson.dumps({"data": LogService.get_page_rows(ROWS)[0]}),
+            }
+            print(f"{'path (10k rows)':<31}{'CPU ms':>9}{'peak alloc MB':>15}")
+            for name, fn in scenarios.items():
+                cpu, peak = measure(fn)
+                print(f"{name:<31}{cpu * 1000:>9.0f}{peak / 2 ** 20:>15.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Per-sample latency and batch throughput of the Andon SVM: scikit-learn
+Pipeline.predict against the NumPy engine (app.ml_logic.native).
+
+    cd backend && python benchmarks/svm_inference.py
+"""
+import json
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+warnings.simplefilter("ignore")
+
+from app.ml_logic.predictor import AndonPredictor
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'data_logs.json')
+FEATURES = ('cpu_usage_pct', 'mem_available_gb', 'active_threats', 'untrusted_processes')
+
+def best_of(runs, fn):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main():
+    with open(DATA_PATH) as data:
+        rows = [[sample['metrics'][name] for name in FEATURES] for sample in json.load(data)]
+    singles = rows[:1000]
+
+    print(f"{'backend':<9}{'single us/sample':>18}{'batch rows/s':>16}")
+    for backend in ('sklearn', 'native'):
+        predictor = AndonPredictor(backend=backend)
+        single = best_of(5, lambda: [predictor.predict(*row) for row in singles]) / len(singles)
+        batch = best_of(20, lambda: predictor.predict_batch(rows))
+        print(f"{backend:<9}{single * 1e6:>18.1f}{len(rows) / batch:>16,.0f}")
+
+if __name__ == "__main__":
+    main()
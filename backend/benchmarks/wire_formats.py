@@ -0,0 +1,54 @@
+"""
+Payload size and server-side parse time of the telemetry export
+(data/data_logs.json) in each accepted wire format: JSON and MessagePack,
+plain or gzip-compressed, decoded the way app.utils.wire does it.
+
+    cd backend && python benchmarks/wire_formats.py
+"""
+import gzip
+import json
+import os
+import sys
+import time
+import zlib
+
+import msgpack
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'data_logs.json')
+
+def best_of(runs, fn):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def gunzip(body):
+    return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(body)
+
+def main():
+    with open(DATA_PATH) as data:
+        records = json.load(data)
+
+    as_json = json.dumps(records).encode('utf-8')
+    as_msgpack = msgpack.packb(records, use_bin_type=True)
+    formats = {
+        "json": (as_json, lambda body: json.loads(body)),
+        "msgpack": (as_msgpack, lambda body: msgpack.unpackb(body, raw=False)),
+        "json+gzip": (gzip.compress(as_json, 6), lambda body: json.loads(gunzip(body))),
+        "msgpack+gzip": (gzip.compress(as_msgpack, 6), lambda body: msgpack.unpackb(gunzip(body), raw=False)),
+    }
+
+    print(f"{len(records)} records")
+    print(f"{'format':<14}{'bytes':>10}{'vs json':>9}{'parse ms':>10}{'vs json':>9}")
+    baseline_size = len(as_json)
+    baseline_time = None
+    for name, (body, parse) in formats.items():
+        assert parse(body) == records
+        seconds = best_of(50, lambda: parse(body))
+        baseline_time = baseline_time or seconds
+        print(f"{name:<14}{len(body):>10,}{len(body) / baseline_size:>9.2f}{seconds * 1000:>10.2f}{seconds / baseline_time:>9.2f}")
+
+if __name__ == '__main__':
+    sys.exit(main())
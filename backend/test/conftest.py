@@ -0,0 +1,25 @@
+import pytest
+from app import create_app
+
+@pytest.fixture
+def app(tmp_path):
+    """Application bound to a throwaway SQLite file; audit logs are written synchronously and responses report their SQL statement count."""
+    return create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'AUDIT_LOG_MODE': 'sync',
+        'ANDON_MODEL_PRELOAD': False,
+        'ANDON_MODEL_WATCH_SECONDS': 0,
+        'SQL_STATEMENT_HEADER': True,
+        'RESPONSE_CACHE_DIR': str(tmp_path / 'versions')
+    })
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def auth_headers(client):
+    client.post('/api/auth/register', json={'username': 'tester', 'password': 'secret'})
+    response = client.post('/api/auth/login', json={'username': 'tester', 'password': 'secret'})
+    return {'Authorization': f"Bearer {response.get_json()['access_token']}"}
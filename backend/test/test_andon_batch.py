@@ -0,0 +1,59 @@
+from app.config import ANDON_BATCH_MAX_SIZE
+from app.models.log import Log
+from app.models.telemetry import Telemetry
+
+CRITICAL = {"device_id": "WS-1", "cpu_usage_pct": 98.5, "mem_available_gb": 0.2, "active_threats": 5, "untrusted_processes": 8}
+IDLE = {"device_id": "WS-2", "cpu_usage_pct": 10.0, "mem_available_gb": 8.0, "active_threats": 0, "untrusted_processes": 0}
+BATCH = '/api/andon/analyze/batch'
+
+def test_a_mixed_batch_scores_the_valid_samples_and_reports_the_rest(app, client, auth_headers):
+    batch = [CRITICAL, {**CRITICAL, "cpu_usage_pct": "n/a"}, IDLE, {"device_id": "WS-4"}]
+    response = client.post(BATCH, json=batch, headers=auth_headers)
+    assert response.status_code == 201
+    body = response.get_json()['data']
+
+    assert [error['index'] for error in body['errors']] == [1, 3]
+    assert 'cpu_usage_pct' in body['errors'][0]['errors']
+    assert set(body['errors'][1]['errors']) == {'cpu_usage_pct', 'mem_available_gb', 'active_threats', 'untrusted_processes'}
+
+    assert [result['index'] for result in body['results']] == [0, 2]
+    assert [result['device_id'] for result in body['results']] == ['WS-1', 'WS-2']
+    # Same verdicts as the single-sample endpoint
+    for sample, result in zip((CRITICAL, IDLE), body['results']):
+        single = client.post('/api/andon/analyze', json=sample, headers=auth_headers).get_json()['data']
+        assert result['andon_status'] == single['andon_status']
+    assert body['results'][0]['andon_status'] == 2
+
+    with app.app_context():
+        assert Telemetry.query.count() == 4
+        audit = Log.query.filter_by(action='AI_ANDON_BATCH_ANALYSIS').one()
+        assert audit.details == 'Batch analysis: 2 scored, 2 rejected'
+
+def test_an_empty_or_non_array_body_answers_400(client, auth_headers):
+    for body in ([], CRITICAL, "samples", None):
+        response = client.post(BATCH, json=body, headers=auth_headers)
+        assert response.status_code == 400, body
+        assert response.get_json()['message'] == "Expected a non-empty array of telemetry samples"
+
+    response = client.post(BATCH, data='not json', headers={**auth_headers, 'Content-Type': 'application/json'})
+    assert response.status_code == 400
+
+def test_a_batch_over_the_limit_answers_400_before_scoring(app, client, auth_headers):
+    response = client.post(BATCH, json=[CRITICAL] * (ANDON_BATCH_MAX_SIZE + 1), headers=auth_headers)
+    assert response.status_code == 400
+    assert str(ANDON_BATCH_MAX_SIZE) in response.get_json()['message']
+
+    assert client.post(BATCH, json=[IDLE] * ANDON_BATCH_MAX_SIZE, headers=auth_headers).status_code == 201
+    with app.app_context():
+        assert Telemetry.query.count() == ANDON_BATCH_MAX_SIZE
+
+def test_a_batch_without_valid_samples_answers_400_with_the_errors(app, client, auth_headers):
+    response = client.post(BATCH, json=[{"device_id": "WS-1"}, {**IDLE, "active_threats": "many"}], headers=auth_headers)
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body['message'] == "No valid telemetry samples in batch"
+    assert [error['index'] for error in body['errors']] == [0, 1]
+    assert list(body['errors'][1]['errors']) == ['active_threats']
+
+    with app.app_context():
+        assert Telemetry.query.count() == 0
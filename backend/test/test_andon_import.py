@@ -0,0 +1,54 @@
+import io
+import json
+import os
+import pytest
+from app.models.telemetry import Telemetry
+from app.utils.json_stream import iter_json_records
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'data_logs.json')
+
+def test_stream_matches_json_load_for_any_chunk_size():
+    with open(DATA_PATH) as data:
+        expected = json.load(data)
+    for chunk_size in (1, 13, 4096):
+        with open(DATA_PATH) as data:
+            assert list(iter_json_records(data, chunk_size)) == expected
+
+def test_stream_reads_json_lines_and_rejects_truncated_arrays():
+    assert list(iter_json_records(io.StringIO('{"a": 1}\n{"a": 2}\n'), 4)) == [{"a": 1}, {"a": 2}]
+    with pytest.raises(ValueError):
+        list(iter_json_records(io.StringIO('[{"a": 1}, {"a": '), 4))
+
+@pytest.mark.parametrize('text', ['[1,,2]', '[,1]', '[1,]', '[1 2]', '[1, 2] 3', '[{"a": 1}]]', '[1]\n[2]'])
+def test_stream_rejects_empty_elements_and_trailing_data(text):
+    for chunk_size in (1, 4096):
+        with pytest.raises(ValueError):
+            list(iter_json_records(io.StringIO(text), chunk_size))
+    assert list(iter_json_records(io.StringIO(' [1, [2], {"b": 3}] \n'), 2)) == [1, [2], {"b": 3}]
+    assert list(iter_json_records(io.StringIO('[]'), 1)) == []
+
+def test_import_command_reports_malformed_files(app, tmp_path):
+    source = tmp_path / 'export.json'
+    source.write_text('[{"device_id": "WS-1"},, {"device_id": "WS-2"}]')
+    result = app.test_cli_runner().invoke(args=['andon', 'import', str(source)])
+    assert result.exit_code != 0
+    assert 'Empty element in JSON array' in result.output
+
+def test_import_command_scores_and_stores_every_record(app, tmp_path):
+    source = tmp_path / 'export.json'
+    source.write_text(json.dumps([
+        {"timestamp": "2026-03-22T00:32:06", "device_id": "WS-1",
+         "metrics": {"cpu_usage_pct": 98.5, "mem_available_gb": 0.2, "active_threats": 5, "untrusted_processes": 8}},
+        {"device_id": "WS-2", "cpu_usage_pct": 12.0, "mem_available_gb": 14.5, "active_threats": 0, "untrusted_processes": 0},
+        {"device_id": "WS-3", "metrics": {"cpu_usage_pct": "n/a"}}
+    ]))
+
+    result = app.test_cli_runner().invoke(args=['andon', 'import', str(source), '--chunk-size', '2'])
+    assert result.exit_code == 0, result.output
+    assert 'Imported 2 records (1 rejected)' in result.output
+
+    with app.app_context():
+        rows = {row.device_id: row for row in Telemetry.query.all()}
+    assert rows['WS-1'].andon_status == 2
+    assert rows['WS-1'].timestamp.isoformat() == '2026-03-22T00:32:06'
+    assert rows['WS-2'].andon_status == 0
@@ -0,0 +1,107 @@
+import queue
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from app.extensions import db
+from app.models.log import Log
+from app.models.telemetry import Telemetry
+from app.models.user import User
+from app.services.andon_queue import AndonIngestQueue, ingest_queue
+
+SAMPLE = {"device_id": "WS-9", "cpu_usage_pct": 97.0, "mem_available_gb": 0.3,
+          "active_threats": 4, "untrusted_processes": 7}
+ASYNC = {'Prefer': 'respond-async'}
+
+def test_async_analysis_returns_202_and_a_status_url(app, client, auth_headers):
+    try:
+        response = client.post('/api/andon/analyze', headers={**auth_headers, **ASYNC}, json=SAMPLE)
+        assert response.status_code == 202
+        accepted = response.get_json()['data']
+        assert accepted['status'] == 'queued'
+        assert accepted['status_url'] == f"/api/andon/analyze/{accepted['tracking_id']}"
+
+        deadline = time.monotonic() + 10
+        while True:
+            status = client.get(accepted['status_url'], headers=auth_headers).get_json()
+            if status['status'] != 'queued' or time.monotonic() > deadline:
+                break
+            time.sleep(0.05)
+        assert status['status'] == 'done'
+        assert status['andon_status'] == 2
+    finally:
+        ingest_queue.stop()
+
+    with app.app_context():
+        assert db.session.get(Telemetry, accepted['tracking_id']).device_id == 'WS-9'
+
+def test_a_full_queue_answers_429(client, auth_headers, monkeypatch):
+    full = queue.Queue(maxsize=1)
+    full.put_nowait(None)
+    monkeypatch.setattr(ingest_queue, '_queue', full)
+    monkeypatch.setattr(ingest_queue, '_ensure_started', lambda: None)
+
+    response = client.post('/api/andon/analyze', headers={**auth_headers, **ASYNC}, json=SAMPLE)
+    assert response.status_code == 429
+
+def _user_id(app, username):
+    with app.app_context():
+        return User.query.filter_by(username=username).one().id
+
+def _other_user_headers(client):
+    client.post('/api/auth/register', json={'username': 'intruder', 'password': 'secret'})
+    response = client.post('/api/auth/login', json={'username': 'intruder', 'password': 'secret'})
+    return {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+
+def test_status_falls_back_to_the_stored_telemetry_row(app, client, auth_headers):
+    tracking_id = str(uuid.uuid4())
+    with app.app_context():
+        db.session.add(Telemetry(id=tracking_id, device_id='WS-9', timestamp=datetime(2026, 3, 1),
+                                 cpu_usage_pct=10.0, mem_available_gb=8.0, active_threats=0,
+                                 untrusted_processes=0, andon_status=0, user_id=_user_id(app, 'tester')))
+        db.session.commit()
+
+    response = client.get(f'/api/andon/analyze/{tracking_id}', headers=auth_headers)
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'done'
+    assert response.get_json()['timestamp'] == '2026-03-01T00:00:00'
+
+    assert client.get(f'/api/andon/analyze/{uuid.uuid4()}', headers=auth_headers).status_code == 404
+    assert client.get(f'/api/andon/analyze/{tracking_id}', headers=_other_user_headers(client)).status_code == 404
+
+def test_only_the_submitter_can_read_a_tracking_id(app, client, auth_headers, monkeypatch):
+    monkeypatch.setattr(ingest_queue, '_ensure_started', lambda: None)
+    monkeypatch.setattr(ingest_queue, '_queue', queue.Queue())
+    accepted = client.post('/api/andon/analyze', headers={**auth_headers, **ASYNC}, json=SAMPLE).get_json()['data']
+    intruder = _other_user_headers(client)
+
+    # Queued: only the in-memory result exists
+    assert client.get(accepted['status_url'], headers=auth_headers).get_json()['status'] == 'queued'
+    assert client.get(accepted['status_url'], headers=intruder).status_code == 404
+
+    ingest_queue._process([ingest_queue._queue.get_nowait()])
+    assert client.get(accepted['status_url'], headers=auth_headers).get_json()['status'] == 'done'
+    assert client.get(accepted['status_url'], headers=intruder).status_code == 404
+
+    # Evicted from memory: the stored row keeps the submitter
+    monkeypatch.setattr(ingest_queue, '_results', OrderedDict())
+    with app.app_context():
+        assert db.session.get(Telemetry, accepted['tracking_id']).user_id == _user_id(app, 'tester')
+    assert client.get(accepted['status_url'], headers=auth_headers).get_json()['status'] == 'done'
+    assert client.get(accepted['status_url'], headers=intruder).status_code == 404
+
+def test_a_mixed_batch_is_audited_per_submitting_user(app):
+    worker = AndonIngestQueue(workers=1)
+    worker.init_app(app)
+    worker._process([
+        (str(uuid.uuid4()), dict(SAMPLE), 'alice'),
+        (str(uuid.uuid4()), dict(SAMPLE), 'bob'),
+        (str(uuid.uuid4()), dict(SAMPLE), 'alice'),
+    ])
+
+    with app.app_context():
+        entries = Log.query.filter_by(action='AI_ANDON_ASYNC_ANALYSIS').all()
+    assert {(entry.user_id, entry.details) for entry in entries} == {
+        ('alice', 'Async batch analysis: 2 samples'),
+        ('bob', 'Async batch analysis: 1 samples'),
+    }
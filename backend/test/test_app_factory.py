@@ -0,0 +1,67 @@
+from sqlalchemy import text
+from app import create_app
+from app.extensions import db
+from app.ml_logic.registry import PredictorRegistry
+from app.utils import db as db_utils
+
+def test_registry_loads_model_once_on_first_use():
+    """The predictor is only built when first requested and then reused."""
+    registry = PredictorRegistry()
+    assert not registry.is_loaded()
+
+    predictor = registry.get()
+    assert predictor.model is not None
+    assert registry.get() is predictor
+
+def test_memory_mapped_model_predicts_like_regular_load():
+    mapped = PredictorRegistry(mmap=True).get()
+    loaded = PredictorRegistry(mmap=False).get()
+    rows = [(98.5, 0.2, 5, 8), (12.0, 14.5, 0, 0), (85.0, 1.5, 0, 1)]
+    assert mapped.predict_batch(rows) == loaded.predict_batch(rows)
+
+def test_create_app_serves_requests(client, auth_headers):
+    response = client.post('/api/andon/analyze', headers=auth_headers, json={
+        'device_id': 'WS-01',
+        'cpu_usage_pct': 12.0,
+        'mem_available_gb': 14.5,
+        'active_threats': 0,
+        'untrusted_processes': 0
+    })
+    assert response.status_code == 201
+    assert response.get_json()['data']['andon_status'] == 0
+
+
+def _pragmas(app):
+    with app.app_context(), db.engine.connect() as connection:
+        return (connection.execute(text("PRAGMA journal_mode")).scalar(),
+                connection.execute(text("PRAGMA busy_timeout")).scalar())
+
+def test_new_connections_use_the_sqlite_pragmas_from_app_config(app, tmp_path):
+    assert _pragmas(app) == ('wal', app.config['SQLITE_BUSY_TIMEOUT_MS'])
+
+    tuned = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'tuned.db'}",
+        'AUDIT_LOG_MODE': 'sync',
+        'ANDON_MODEL_PRELOAD': False,
+        'ANDON_MODEL_WATCH_SECONDS': 0,
+        'RESPONSE_CACHE_DIR': str(tmp_path / 'tuned-versions'),
+        'SQLITE_BUSY_TIMEOUT_MS': 1234
+    })
+    assert _pragmas(tuned) == ('wal', 1234)
+
+def test_the_fork_hook_is_registered_once(tmp_path, monkeypatch):
+    registered = []
+    monkeypatch.setattr(db_utils.os, 'register_at_fork', lambda **hooks: registered.append(hooks))
+    monkeypatch.setattr(db_utils, '_fork_hook_registered', False)
+    for name in ('one', 'two'):
+        create_app({
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / name}.db",
+            'AUDIT_LOG_MODE': 'sync',
+            'ANDON_MODEL_PRELOAD': False,
+            'ANDON_MODEL_WATCH_SECONDS': 0,
+            'RESPONSE_CACHE_DIR': str(tmp_path / f'{name}-versions')
+        })
+    assert len(registered) == 1
+    assert len(db_utils._fork_engines) >= 2
@@ -0,0 +1,114 @@
+import time
+from datetime import datetime
+from app.models.log import Log
+from app.services.audit_writer import AuditLogWriter
+from app.services.response_cache import response_cache, LOGS
+
+def _writer(app, **options):
+    writer = AuditLogWriter(mode='buffered', flush_interval_ms=60000, **options)
+    writer.init_app(app)
+    return writer
+
+def _count(app):
+    with app.app_context():
+        return Log.query.filter(Log.action.like('TEST_%')).count()
+
+def test_events_are_written_in_batches_and_flushed_on_stop(app):
+    writer = _writer(app, batch_size=3)
+    try:
+        writer.write("TEST_EVENT", "one")
+        writer.write("TEST_EVENT", "two")
+        assert _count(app) == 0
+
+        # A full batch wakes the writer thread long before the flush interval
+        writer.write("TEST_EVENT", "three")
+        deadline = time.monotonic() + 5
+        while _count(app) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert _count(app) == 3
+
+        writer.write("TEST_EVENT", "four")
+    finally:
+        writer.stop()
+    assert _count(app) == 4
+
+def test_failed_batches_are_retried_and_keep_their_event_time(app, monkeypatch):
+    writer = _writer(app, batch_size=100)
+    insert = writer._insert
+    calls = []
+
+    def flaky(rows):
+        calls.append(len(rows))
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        insert(rows)
+
+    monkeypatch.setattr(writer, '_insert', flaky)
+    try:
+        before = datetime.utcnow()
+        writer.write("TEST_EVENT", "first")
+        writer.write("TEST_EVENT", "second")
+        written = datetime.utcnow()
+        writer.flush()
+        assert _count(app) == 0
+
+        time.sleep(0.05)
+        writer.flush()
+        assert calls == [2, 2]
+        with app.app_context():
+            rows = Log.query.filter(Log.action == "TEST_EVENT").order_by(Log.timestamp).all()
+        assert [row.details for row in rows] == ["first", "second"]
+        assert all(before <= row.timestamp <= written for row in rows)
+    finally:
+        writer.stop()
+
+def test_a_bad_row_is_dropped_after_the_retries_without_blocking_the_rest(app, monkeypatch):
+    writer = _writer(app, batch_size=100, max_retries=2)
+    insert = writer._insert
+
+    def reject_bad_rows(rows):
+        if any(row['details'] == 'bad' for row in rows):
+            raise RuntimeError("value too long for type character varying(255)")
+        insert(rows)
+
+    monkeypatch.setattr(writer, '_insert', reject_bad_rows)
+    try:
+        writer.write("TEST_EVENT", "before")
+        writer.write("TEST_EVENT", "bad")
+        writer.flush()
+        writer.write("TEST_EVENT", "after")
+        writer.flush()
+        assert _count(app) == 0
+
+        # Third failure: written row by row, only the bad row is lost
+        writer.flush()
+        with app.app_context():
+            details = [row.details for row in Log.query.filter(Log.action == "TEST_EVENT").order_by(Log.timestamp)]
+        assert details == ["before", "after"]
+        assert writer.dropped == 1
+
+        writer.write("TEST_EVENT", "later")
+        writer.flush()
+        assert _count(app) == 3
+    finally:
+        writer.stop()
+
+def test_flush_invalidates_cached_log_pages(app):
+    writer = _writer(app, batch_size=100)
+    try:
+        with app.app_context():
+            before = response_cache.version(LOGS)
+            writer.write("TEST_EVENT", "cached")
+            assert response_cache.version(LOGS) == before
+            writer.flush()
+            assert response_cache.version(LOGS) != before
+    finally:
+        writer.stop()
+
+def test_init_app_registers_the_exit_hook_once(app, monkeypatch):
+    registered = []
+    monkeypatch.setattr('app.services.audit_writer.atexit.register', registered.append)
+    writer = AuditLogWriter()
+    writer.init_app(app)
+    writer.init_app(app)
+    assert registered == [writer.stop]
@@ -0,0 +1,69 @@
+from app.services.log import LogService
+from app.utils.query_counter import HEADER
+
+TICKET = {"title": "Disk full", "description": "...", "priority": "High"}
+
+def _revalidate(client, path, etag, headers):
+    return client.get(path, headers={**headers, 'If-None-Match': etag})
+
+def test_lists_answer_304_without_querying_until_a_write(client, auth_headers):
+    client.post('/api/tickets', json=TICKET, headers=auth_headers)
+
+    for path in ('/api/tickets', '/api/logs?limit=10'):
+        first = client.get(path, headers=auth_headers)
+        assert first.status_code == 200 and first.headers['ETag']
+
+        unchanged = _revalidate(client, path, first.headers['ETag'], auth_headers)
+        assert unchanged.status_code == 304
+        assert unchanged.data == b''
+        assert unchanged.headers[HEADER] == '0'
+        assert unchanged.headers['ETag'] == first.headers['ETag']
+
+    tickets = client.get('/api/tickets', headers=auth_headers)
+    assert client.get('/api/tickets?status=Open', headers=auth_headers).headers['ETag'] != tickets.headers['ETag']
+
+    client.post('/api/tickets', json=TICKET, headers=auth_headers)
+    changed = _revalidate(client, '/api/tickets', tickets.headers['ETag'], auth_headers)
+    assert changed.status_code == 200
+    assert len(changed.get_json()['data']) == 2
+
+def test_single_ticket_read_is_conditional(client, auth_headers):
+    created = client.post('/api/tickets', json=TICKET, headers=auth_headers).get_json()['data']
+    path = f"/api/tickets/{created['id']}"
+
+    first = client.get(path, headers=auth_headers)
+    assert first.status_code == 200
+    assert first.get_json()['title'] == TICKET['title']
+    assert _revalidate(client, path, first.headers['ETag'], auth_headers).status_code == 304
+
+    client.put(path, json={"status": "Closed"}, headers=auth_headers)
+    moved = _revalidate(client, path, first.headers['ETag'], auth_headers)
+    assert moved.status_code == 200
+    assert moved.get_json()['status'] == "Closed"
+
+    assert client.get('/api/tickets/missing', headers=auth_headers).status_code == 404
+
+def test_polled_sync_and_summary_are_conditional(app, client, auth_headers):
+    client.post('/api/tickets', json=TICKET, headers=auth_headers)
+    cursor = client.get('/api/sync', headers=auth_headers).get_json()['cursor']
+
+    for path in (f'/api/sync?since={cursor}', '/api/tickets/summary'):
+        first = client.get(path, headers=auth_headers)
+        assert first.status_code == 200 and first.headers['ETag']
+        unchanged = _revalidate(client, path, first.headers['ETag'], auth_headers)
+        assert unchanged.status_code == 304
+        assert unchanged.headers[HEADER] == '0'
+
+    sync = client.get(f'/api/sync?since={cursor}', headers=auth_headers)
+    summary = client.get('/api/tickets/summary', headers=auth_headers)
+    client.post('/api/tickets', json=TICKET, headers=auth_headers)
+    assert _revalidate(client, f'/api/sync?since={cursor}', sync.headers['ETag'], auth_headers).status_code == 200
+    changed = _revalidate(client, '/api/tickets/summary', summary.headers['ETag'], auth_headers)
+    assert changed.status_code == 200
+    assert changed.get_json()['open'] == 2
+
+    # An audit entry alone is a change for the sync feed
+    sync = client.get(f'/api/sync?since={cursor}', headers=auth_headers)
+    with app.app_context():
+        LogService.create_log("USER_LOGIN", "tester")
+    assert _revalidate(client, f'/api/sync?since={cursor}', sync.headers['ETag'], auth_headers).status_code == 200
@@ -0,0 +1,43 @@
+import time
+from sqlalchemy import text
+from app.extensions import db
+from app.config import REQUEST_TIMEOUT
+from app.utils import deadline
+from app.utils.deadline import budget_for
+from app.utils.httpResponses import success_200, error_500
+
+# Counts to 50 million inside SQLite: far longer than the budget below
+ENDLESS_QUERY = text(
+    "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 50000000) "
+    "SELECT count(*) FROM n"
+)
+
+def test_the_longest_matching_prefix_wins(monkeypatch):
+    assert budget_for('/api/andon/analyze/batch') == 30
+    assert budget_for('/api/andon/analyze') == REQUEST_TIMEOUT
+    assert budget_for('/api/auth/login') is None
+
+    monkeypatch.setattr(deadline, 'ROUTE_TIMEOUTS', {'/api': 1, '/api/andon': 2, '/api/andon/devices': None})
+    assert budget_for('/api/tickets') == 1
+    assert budget_for('/api/andon/trends') == 2
+    assert budget_for('/api/andon/devices/WS-1/recent') is None
+    assert budget_for('/health') == REQUEST_TIMEOUT
+
+def test_a_query_running_past_the_budget_is_aborted_with_504(app, monkeypatch):
+    monkeypatch.setattr(deadline, 'ROUTE_TIMEOUTS', {'/api/slow': 0.2})
+
+    @app.route('/api/slow')
+    def slow():
+        # Same shape as the controllers: failures become a 500, the deadline hook rewrites it
+        try:
+            return success_200({"count": db.session.execute(ENDLESS_QUERY).scalar()})
+        except Exception as e:
+            db.session.rollback()
+            return error_500(str(e))
+
+    started = time.monotonic()
+    response = app.test_client().get('/api/slow')
+    assert response.status_code == 504
+    assert 'timed out' in response.get_json()['message']
+    # The progress handler interrupted SQLite instead of letting the query finish
+    assert time.monotonic() - started < 3
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from app.services.device_store import DeviceStore
+
+def _sample(device_id, second, cpu, status=0):
+    return SimpleNamespace(
+        device_id=device_id,
+        timestamp=datetime(2026, 3, 22) + timedelta(seconds=second),
+        cpu_usage_pct=cpu,
+        mem_available_gb=4.0,
+        active_threats=0,
+        untrusted_processes=1,
+        andon_status=status
+    )
+
+def test_ring_keeps_last_samples_newest_first():
+    """A device ring only holds its last `capacity` samples."""
+    store = DeviceStore(capacity=3, max_devices=10)
+    store.record([_sample("WS-1", i, float(i)) for i in range(5)])
+
+    recent = store.recent("WS-1")
+    assert [row["cpu_usage_pct"] for row in recent] == [4.0, 3.0, 2.0]
+    assert recent[0]["timestamp"] == "2026-03-22T00:00:04"
+    assert store.recent("WS-1", 1)[0]["andon_status"] == 0
+
+def test_idle_devices_are_evicted_first():
+    """Memory stays bounded: the device without samples for the longest time is dropped."""
+    store = DeviceStore(capacity=2, max_devices=2)
+    store.record([_sample("A", 0, 1.0), _sample("B", 1, 1.0)])
+    store.record([_sample("A", 2, 2.0), _sample("C", 3, 1.0)])
+
+    assert store.recent("B") is None
+    assert [device["device_id"] for device in store.devices()] == ["C", "A"]
+
+def test_rebuild_loads_the_newest_rows_of_the_active_devices_in_one_query(app):
+    from sqlalchemy import event
+    from app.extensions import db
+    from app.models.telemetry import Telemetry
+
+    with app.app_context():
+        for index, (device_id, second) in enumerate([("A", 0), ("A", 5), ("A", 9), ("B", 1), ("C", 7), ("C", 2)]):
+            sample = _sample(device_id, second, float(second))
+            db.session.add(Telemetry(id=f"t-{index}", **vars(sample)))
+        db.session.commit()
+
+        statements = []
+        count = lambda *args: statements.append(args[2])
+        event.listen(db.engine, "before_cursor_execute", count)
+        try:
+            store = DeviceStore(capacity=2, max_devices=2)
+            store.rebuild()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count)
+
+    assert len(statements) == 1
+    # B is the least recently active device and is left out
+    assert [device["device_id"] for device in store.devices()] == ["A", "C"]
+    assert [row["cpu_usage_pct"] for row in store.recent("A")] == [9.0, 5.0]
+    assert [row["cpu_usage_pct"] for row in store.recent("C")] == [7.0, 2.0]
+    assert store.recent("B") is None
@@ -40,4 +40,22 @@ def test_model_performance_threshold(predictor):
     
     # 5. Threshold (Aceptable performance level) defined at 80%
     THRESHOLD = 0.80
-    assert acc >= THRESHOLD, f"CI/CD Failure:  Model accuracy ({acc*100}%) is below the acceptable threshold of {THRESHOLD*100}%"
\ No newline at end of file
+    assert acc >= THRESHOLD, f"CI/CD Failure:  Model accuracy ({acc*100}%) is below the acceptable threshold of {THRESHOLD*100}%"
+
+def test_batch_prediction_matches_single(predictor):
+    """The vectorized batch path must return the same verdicts as one-by-one scoring."""
+    rows = [
+        (98.5, 0.2, 5, 8),
+        (12.0, 14.5, 0, 0),
+        (85.0, 1.5, 0, 1),
+        (37.6, 6.5, 0, 0),
+        (54.6, 1.6, 3, 9)
+    ]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        single = [predictor.predict(cpu=r[0], ram=r[1], threats=r[2], untrusted=r[3]) for r in rows]
+        batch = predictor.predict_batch(rows)
+
+    assert batch == single
+    assert predictor.predict_batch([]) == []
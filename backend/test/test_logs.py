@@ -0,0 +1,72 @@
+from datetime import datetime
+from app.controllers import log as log_controller
+from app.extensions import db
+from app.models.log import Log
+from app.models.user import User
+
+# Every seeded entry is older than the ones written by register/login
+SEEDED = 'until=2026-03-21T00:00:00'
+
+def _seed(app):
+    with app.app_context():
+        db.session.add_all([User(id="u-alice", username="alice"), User(id="u-bob", username="bob")])
+        for index in range(10):
+            db.session.add(Log(
+                id=f"l-{index}", timestamp=datetime(2026, 3, 20, 10, index),
+                action="TICKET_MOVE" if index % 2 == 0 else "TICKET_CREATE",
+                details=f"Ticket t-{index}", user_id="u-alice" if index < 5 else "u-bob"
+            ))
+        # Same timestamp as l-9: the id breaks the tie
+        db.session.add(Log(id="l-9b", timestamp=datetime(2026, 3, 20, 10, 9),
+                           action="TICKET_CREATE", details="Ticket t-9b", user_id="u-bob"))
+        db.session.commit()
+
+def _page(client, headers, query):
+    response = client.get(f'/api/logs?{query}', headers=headers)
+    assert response.status_code == 200
+    body = response.get_json()
+    return [log['id'] for log in body['data']], body['next_cursor']
+
+def test_cursor_walks_every_log_once_newest_first(app, client, auth_headers):
+    _seed(app)
+    seen, cursor = [], None
+    while True:
+        ids, cursor = _page(client, auth_headers, f'{SEEDED}&limit=3' + (f'&cursor={cursor}' if cursor else ''))
+        seen += ids
+        if cursor is None:
+            break
+    assert seen == ['l-9b', 'l-9', 'l-8', 'l-7', 'l-6', 'l-5', 'l-4', 'l-3', 'l-2', 'l-1', 'l-0']
+
+    # A page ending exactly on the last row has no next cursor
+    assert _page(client, auth_headers, f'{SEEDED}&limit=11')[1] is None
+
+def test_each_filter_narrows_the_page(app, client, auth_headers):
+    _seed(app)
+    assert _page(client, auth_headers, f'{SEEDED}&action=TICKET_MOVE')[0] == ['l-8', 'l-6', 'l-4', 'l-2', 'l-0']
+    assert _page(client, auth_headers, 'user_id=u-alice')[0] == ['l-4', 'l-3', 'l-2', 'l-1', 'l-0']
+    # since is inclusive, until is exclusive
+    assert _page(client, auth_headers, 'since=2026-03-20T10:03:00&until=2026-03-20T10:06:00')[0] == ['l-5', 'l-4', 'l-3']
+    # Offsets are converted to the stored UTC
+    assert _page(client, auth_headers, 'since=2026-03-20T07:08:00-03:00&until=2026-03-20T07:09:00-03:00')[0] == ['l-8']
+    assert _page(client, auth_headers, 'action=TICKET_CREATE&user_id=u-bob&since=2026-03-20T10:07:00')[0] == ['l-9b', 'l-9', 'l-7']
+
+    ids, cursor = _page(client, auth_headers, 'user_id=u-bob&action=TICKET_CREATE&limit=2')
+    assert ids == ['l-9b', 'l-9']
+    assert _page(client, auth_headers, f'user_id=u-bob&action=TICKET_CREATE&limit=2&cursor={cursor}')[0] == ['l-7', 'l-5']
+
+def test_malformed_parameters_answer_400(app, client, auth_headers):
+    for query in ('cursor=not-a-cursor', 'cursor=WzFd', 'since=yesterday', 'until=2026-13-01',
+                  'limit=0', 'limit=-5', 'limit=ten'):
+        response = client.get(f'/api/logs?{query}', headers=auth_headers)
+        assert response.status_code == 400, query
+        assert response.get_json()['success'] is False
+
+def test_limit_defaults_and_is_capped_server_side(app, client, auth_headers, monkeypatch):
+    _seed(app)
+    monkeypatch.setattr(log_controller, 'LOGS_PAGE_DEFAULT', 2)
+    monkeypatch.setattr(log_controller, 'LOGS_PAGE_MAX', 4)
+
+    ids, cursor = _page(client, auth_headers, SEEDED)
+    assert ids == ['l-9b', 'l-9'] and cursor
+    ids, cursor = _page(client, auth_headers, f'{SEEDED}&limit=1000')
+    assert ids == ['l-9b', 'l-9', 'l-8', 'l-7'] and cursor
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+from app.extensions import db
+from app.models.log import Log
+from app.models.telemetry import Telemetry
+from app.utils.migrations import migrate_logs_to_telemetry
+
+def _seed_legacy_analyses(count):
+    start = datetime(2026, 1, 1)
+    for index in range(count):
+        db.session.add(Log(
+            id=f"legacy-{index}", timestamp=start + timedelta(minutes=index),
+            action="AI_ANDON_ANALYSIS", details=f"Device: WS-{index}",
+            cpu_usage=90.0 + index, ram_usage=0.5, active_threats=index,
+            untrusted_processes=1, andon_status=2
+        ))
+    # Audit entries that are not stored analyses stay in the logs table
+    db.session.add(Log(id="audit", action="AI_ANDON_ANALYSIS", details="Analysis for device: WS-0 - Status: 2"))
+    db.session.add(Log(id="login", action="USER_LOGIN", details="tester"))
+    db.session.commit()
+
+def test_legacy_analyses_are_copied_exactly_once(app):
+    with app.app_context():
+        _seed_legacy_analyses(5)
+
+        assert migrate_logs_to_telemetry(batch_size=2) == 5
+        rows = {row.id: row for row in Telemetry.query.all()}
+        assert sorted(rows) == [f"legacy-{index}" for index in range(5)]
+        assert rows["legacy-3"].device_id == "WS-3"
+        assert rows["legacy-3"].cpu_usage_pct == 93.0
+        assert rows["legacy-3"].timestamp == datetime(2026, 1, 1, 0, 3)
+        assert {log.id for log in Log.query.filter(Log.id.in_(["audit", "login"]))} == {"audit", "login"}
+        assert Log.query.filter(Log.id.like("legacy-%")).count() == 0
+
+        # A second run (every app start) is a no-op
+        assert migrate_logs_to_telemetry(batch_size=2) == 0
+        assert Telemetry.query.count() == 5
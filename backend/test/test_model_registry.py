@@ -0,0 +1,184 @@
+import shutil
+import pytest
+from app import create_app
+from app.ml_logic.predictor import DEFAULT_MODEL_PATH
+from app.ml_logic.registry import PredictorRegistry, UnknownModelVersion
+
+@pytest.fixture
+def model_dir(tmp_path):
+    directory = tmp_path / 'models'
+    directory.mkdir()
+    for version in ('v1', 'v2'):
+        shutil.copy(DEFAULT_MODEL_PATH, directory / f'{version}.pkl')
+    return directory
+
+def _registry(model_dir):
+    return PredictorRegistry(model_dir=str(model_dir), default_version='v1', watch_interval=0)
+
+def test_activate_swaps_and_rollback_restores(model_dir):
+    registry = _registry(model_dir)
+    first = registry.get()
+    assert first.version == 'v1'
+
+    registry.activate('v2', wait=True)
+    assert registry.get().version == 'v2'
+    assert (model_dir / 'ACTIVE').read_text() == 'v2'
+
+    # The previous version is still in memory, so rollback does not reload it
+    registry.rollback(wait=True)
+    assert registry.get() is first
+
+def test_broken_or_unknown_version_keeps_current_model(model_dir):
+    registry = _registry(model_dir)
+    (model_dir / 'broken.pkl').write_bytes(b'not a model')
+
+    with pytest.raises(UnknownModelVersion):
+        registry.activate('v9')
+    with pytest.raises(ValueError):
+        registry.activate('broken', wait=True)
+
+    assert registry.get().version == 'v1'
+    assert registry.status()['last_error'].startswith('broken')
+
+def test_other_workers_follow_the_active_file(model_dir):
+    worker_a, worker_b = _registry(model_dir), _registry(model_dir)
+    worker_a.get()
+    worker_b.get()
+
+    worker_a.activate('v2', wait=True)
+    worker_b.refresh().join()
+    assert worker_b.get().version == 'v2'
+
+def test_a_rejected_version_is_retried_once_its_artifact_is_repaired(model_dir):
+    worker = _registry(model_dir)
+    worker.get()
+    (model_dir / 'v3.pkl').write_bytes(b'not a model')
+    (model_dir / 'ACTIVE').write_text('v3')
+
+    worker.refresh().join()
+    assert worker.get().version == 'v1'
+    assert worker.refresh() is None
+
+    shutil.copy(DEFAULT_MODEL_PATH, model_dir / 'v3.pkl')
+    worker.refresh().join()
+    assert worker.get().version == 'v3'
+
+def test_a_busy_registry_retries_the_active_file_on_the_next_tick(model_dir):
+    worker = _registry(model_dir)
+    worker.get()
+    (model_dir / 'ACTIVE').write_text('v2')
+
+    # Another activation holds the swap between refresh's check and its own activate
+    worker._swap_lock.acquire()
+    try:
+        assert worker.refresh() is None
+    finally:
+        worker._swap_lock.release()
+    assert worker.status()['last_error'] is None
+
+    worker.refresh().join()
+    assert worker.get().version == 'v2'
+
+def test_the_active_file_can_live_outside_the_model_directory(model_dir, tmp_path):
+    state_dir = tmp_path / 'state'
+    worker_a, worker_b = (
+        PredictorRegistry(model_dir=str(model_dir), default_version='v1', state_dir=str(state_dir), watch_interval=0)
+        for _ in range(2)
+    )
+    worker_a.get()
+    worker_b.get()
+
+    worker_a.activate('v2', wait=True)
+    assert (state_dir / 'ACTIVE').read_text() == 'v2'
+    assert not (model_dir / 'ACTIVE').exists()
+    worker_b.refresh().join()
+    assert worker_b.get().version == 'v2'
+
+def test_scored_rows_record_model_version(model_dir, tmp_path):
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'AUDIT_LOG_MODE': 'sync',
+        'ANDON_MODEL_DIR': str(model_dir),
+        'ANDON_MODEL_VERSION': 'v1',
+        'ANDON_MODEL_WATCH_SECONDS': 0,
+        'ANDON_MODEL_ADMINS': ['admin']
+    })
+    client = app.test_client()
+    headers = {}
+    for username in ('admin', 'operator'):
+        client.post('/api/auth/register', json={'username': username, 'password': 'secret'})
+        token = client.post('/api/auth/login', json={'username': username, 'password': 'secret'}).get_json()['access_token']
+        headers[username] = {'Authorization': f'Bearer {token}'}
+    sample = {'device_id': 'WS-01', 'cpu_usage_pct': 12.0, 'mem_available_gb': 14.5, 'active_threats': 0, 'untrusted_processes': 0}
+
+    assert client.post('/api/andon/analyze', headers=headers['operator'], json=sample).get_json()['data']['model_version'] == 'v1'
+
+    denied = client.put('/api/andon/models/active', headers=headers['operator'], json={'version': 'v2'})
+    assert denied.status_code == 403
+
+    switched = client.put('/api/andon/models/active', headers=headers['admin'], json={'version': 'v2', 'wait': True})
+    assert switched.status_code == 200
+    assert client.post('/api/andon/analyze', headers=headers['operator'], json=sample).get_json()['data']['model_version'] == 'v2'
+
+def test_shadow_model_is_compared_after_the_response(model_dir, tmp_path):
+    from app.services.shadow import shadow_evaluator
+
+    app = create_app({
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'test.db'}",
+        'AUDIT_LOG_MODE': 'sync',
+        'ANDON_MODEL_DIR': str(model_dir),
+        'ANDON_MODEL_VERSION': 'v1',
+        'ANDON_MODEL_WATCH_SECONDS': 0,
+        'ANDON_SHADOW_VERSION': 'v2'
+    })
+    client = app.test_client()
+    client.post('/api/auth/register', json={'username': 'operator', 'password': 'secret'})
+    token = client.post('/api/auth/login', json={'username': 'operator', 'password': 'secret'}).get_json()['access_token']
+    headers = {'Authorization': f'Bearer {token}'}
+
+    samples = [
+        {'device_id': 'WS-01', 'cpu_usage_pct': 12.0, 'mem_available_gb': 14.5, 'active_threats': 0, 'untrusted_processes': 0},
+        {'device_id': 'WS-02', 'cpu_usage_pct': 98.5, 'mem_available_gb': 0.2, 'active_threats': 5, 'untrusted_processes': 8}
+    ]
+    # Shadow jobs are only handed to the pool once the server closes the response
+    batch = client.post('/api/andon/analyze/batch', headers=headers, json=samples)
+    single = client.post('/api/andon/analyze', headers=headers, json=samples[0])
+    with app.app_context():
+        assert shadow_evaluator.stats()['compared'] == 0
+    batch.close()
+    single.close()
+    shadow_evaluator.drain()
+
+    stats = client.get('/api/andon/shadow', headers=headers).get_json()['shadow']
+    assert stats['compared'] == 3
+    assert stats['agreement_rate'] == 1.0
+    assert stats['primary_versions'] == ['v1']
+    assert stats['confusion_matrix']['matrix'][0][0] == 2
+    assert stats['latency_ms']['2']['count'] == 1
+
+def test_shadow_hooks_are_registered_once_and_shed_jobs_all_counted(app, monkeypatch):
+    import threading
+    from app.services import shadow
+    from app.services.shadow import ShadowEvaluator
+
+    registered = []
+    monkeypatch.setattr(shadow.atexit, 'register', registered.append)
+    evaluator = ShadowEvaluator(version='v2', max_pending=1)
+    evaluator.init_app(app)
+    evaluator.init_app(app)
+    assert app.after_request_funcs[None].count(evaluator._dispatch_after_response) == 1
+    assert len(registered) == 1
+
+    # No free slot: every job is shed, from many threads at once
+    evaluator._slots.acquire()
+    threads = [
+        threading.Thread(target=lambda: [evaluator._enqueue(([(1.0, 1.0, 0, 0)], [0], 'v1')) for _ in range(500)])
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert evaluator._worker_counters() == {"shed": 4000, "errors": 0}
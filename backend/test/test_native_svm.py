@@ -0,0 +1,60 @@
+import json
+import os
+import numpy as np
+import pytest
+from app.ml_logic.native import NativeSVM
+from app.ml_logic.predictor import AndonPredictor
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'data_logs.json')
+FEATURES = ('cpu_usage_pct', 'mem_available_gb', 'active_threats', 'untrusted_processes')
+
+@pytest.fixture(scope='module')
+def fleet():
+    with open(DATA_PATH) as data:
+        samples = json.load(data)
+    return np.array([[sample['metrics'][name] for name in FEATURES] for sample in samples], dtype=float)
+
+@pytest.fixture(scope='module')
+def sklearn_predictor():
+    return AndonPredictor(backend='sklearn')
+
+def test_native_matches_sklearn_on_sample_dataset(fleet, sklearn_predictor):
+    """Same verdict as Pipeline.predict for every sample in data/data_logs.json."""
+    native = NativeSVM.from_model(sklearn_predictor.model)
+    expected = sklearn_predictor.model.predict(fleet)
+    assert np.array_equal(native.predict(fleet), expected)
+
+    scaler, svc = (step for _, step in sklearn_predictor.model.steps)
+    svc_ovo = svc.set_params(decision_function_shape='ovo')
+    reference = svc_ovo.decision_function(scaler.transform(fleet))
+    svc.set_params(decision_function_shape='ovr')
+    assert np.allclose(native.decision_function(fleet), reference)
+
+def test_native_predictor_single_and_batch(fleet, sklearn_predictor):
+    predictor = AndonPredictor(backend='native')
+    assert predictor.engine is not None
+
+    rows = fleet[:50].tolist()
+    assert predictor.predict_batch(rows) == sklearn_predictor.predict_batch(rows)
+    assert [predictor.predict(*row) for row in rows[:10]] == sklearn_predictor.predict_batch(rows[:10])
+
+def test_quantized_cache_keeps_verdicts_on_sample_dataset(fleet):
+    """CPU in 0.5% and RAM in 0.1GB buckets give the same verdicts as the raw features."""
+    plain = AndonPredictor(cache_size=0)
+    cached = AndonPredictor(cache_size=10000)
+    rows = fleet.tolist()
+
+    assert cached.predict_batch(rows) == plain.predict_batch(rows)
+    assert [cached.predict(*row) for row in rows[:200]] == plain.predict_batch(rows[:200])
+
+    stats = cached.cache.stats()
+    assert stats['hits'] > 0
+    assert stats['size'] <= stats['capacity']
+
+def test_cache_is_bounded_and_belongs_to_the_predictor():
+    predictor = AndonPredictor(cache_size=2)
+    for cpu in (10.0, 20.0, 30.0):
+        predictor.predict(cpu, 8.0, 0, 0)
+
+    assert predictor.cache.stats()['size'] == 2
+    assert AndonPredictor(cache_size=2).cache.stats()['size'] == 0
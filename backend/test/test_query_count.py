@@ -0,0 +1,48 @@
+import uuid
+from app.extensions import db
+from app.models.attachment import Attachment
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.services.response_cache import response_cache, TICKETS, LOGS
+from app.services.ticket import TicketService
+from app.utils.query_counter import HEADER
+
+def _add_tickets(count):
+    """Tickets with a distinct creator and assignee each, so lazy loads could not hit the identity map."""
+    for _ in range(count):
+        creator = User(id=str(uuid.uuid4()), username=f"creator-{uuid.uuid4()}")
+        assignee = User(id=str(uuid.uuid4()), username=f"assignee-{uuid.uuid4()}")
+        ticket = Ticket(title="Disk full", description="...", status="Open", priority="High",
+                        user_id=creator.id, assignee_id=assignee.id)
+        ticket.attachments.append(Attachment(file_url="https://files/log.txt", user_id=creator.id))
+        db.session.add_all([creator, assignee, ticket])
+    db.session.commit()
+    # Written behind the services' back: measure fresh queries, not cached pages
+    response_cache.invalidate(TICKETS, LOGS)
+
+def _statements(client, path, headers):
+    response = client.get(path, headers=headers)
+    assert response.status_code == 200, response.get_json()
+    return int(response.headers[HEADER])
+
+def test_list_endpoints_run_a_constant_number_of_statements(app, client, auth_headers):
+    counts = []
+    for added in (2, 10):
+        with app.app_context():
+            _add_tickets(added)
+        counts.append([
+            _statements(client, path, auth_headers)
+            for path in ('/api/tickets?limit=100', '/api/sync', '/api/logs')
+        ])
+    assert counts[0] == counts[1]
+
+def test_attachments_are_a_relationship_separate_from_the_legacy_column(app):
+    with app.app_context():
+        _add_tickets(1)
+        ticket = Ticket.query.one()
+        assert ticket.attachments_info == '...'
+        assert ticket.to_json()['attachments'] == [ticket.attachments[0].to_json()]
+        assert ticket.attachments[0].ticket is ticket
+
+        assert TicketService.deleteFisical(ticket.id)
+        assert Attachment.query.count() == 0
@@ -0,0 +1,85 @@
+import json
+from datetime import datetime
+from flask_restful.representations.json import output_json as stdlib_output_json
+from app.extensions import db
+from app.models.log import Log
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.schemas.ticket import TicketSchema
+from app.controllers.log import LogSchema
+from app.services.log import LogService
+from app.services.ticket import TicketService
+
+def _seed():
+    alice = User(id="u-alice", username="alice")
+    bob = User(id="u-bob", username="bob")
+    db.session.add_all([alice, bob])
+    for index in range(7):
+        db.session.add(Ticket(
+            id=f"t-{index}", title=f"Ticket {index}", description="Falha no módulo ✓",
+            status="Open", priority=("High", "Middle", "Low")[index % 3],
+            created_at=datetime(2026, 3, 20, 10, index, 0, 0 if index % 2 else 123456),
+            user_id=alice.id, assignee_id=bob.id if index % 2 else None
+        ))
+        db.session.add(Log(
+            id=f"l-{index}", timestamp=datetime(2026, 3, 20, 10, index),
+            action="TICKET_MOVE", details=None if index == 3 else f"Ticket t-{index}"
+        ))
+    db.session.commit()
+
+def test_core_rows_match_the_schema_dump_page_by_page(app):
+    with app.app_context():
+        _seed()
+        ticket_cursor = log_cursor = None
+        for _ in range(3):
+            tickets, next_cursor = TicketService.get_page(3, cursor=ticket_cursor)
+            rows, ticket_cursor = TicketService.get_page_rows(3, cursor=ticket_cursor)
+            assert rows == TicketSchema(many=True).dump(tickets)
+            assert list(rows[0]) == list(TicketSchema().dump(tickets[0]))
+            assert ticket_cursor == next_cursor
+
+            logs, next_cursor = LogService.get_page(3, cursor=log_cursor)
+            rows, log_cursor = LogService.get_page_rows(3, cursor=log_cursor)
+            assert rows == LogSchema(many=True).dump(logs)
+            assert log_cursor == next_cursor
+        assert ticket_cursor is None and log_cursor is None
+
+def test_list_endpoints_encode_the_same_document(app, client, auth_headers):
+    with app.app_context():
+        _seed()
+        expected = TicketSchema(many=True).dump(TicketService.get_page(50)[0])
+
+    response = client.get('/api/tickets?limit=50', headers=auth_headers)
+    assert response.status_code == 200
+    assert response.content_type == 'application/json'
+    assert json.loads(response.data)['data'] == expected
+    assert list(json.loads(response.data)) == ['success', 'message', 'data', 'next_cursor']
+
+    response = client.get('/api/logs?action=TICKET_MOVE&limit=2', headers=auth_headers)
+    assert [log['id'] for log in response.get_json()['data']] == ['l-6', 'l-5']
+    assert response.get_json()['next_cursor']
+
+def test_list_responses_keep_the_stdlib_bytes_by_default(app, client, auth_headers):
+    with app.app_context():
+        _seed()
+        tickets, next_cursor = TicketService.get_page(5)
+        logs, next_log_cursor = LogService.get_page(5, action="TICKET_MOVE")
+        documents = {
+            '/api/tickets?limit=5': {"data": TicketSchema(many=True).dump(tickets), "next_cursor": next_cursor},
+            '/api/logs?action=TICKET_MOVE&limit=5': {"data": LogSchema(many=True).dump(logs), "next_cursor": next_log_cursor},
+        }
+
+    for path, document in documents.items():
+        with app.test_request_context():
+            expected = stdlib_output_json({"success": True, "message": "Success", **document}, 200).get_data()
+        assert client.get(path, headers=auth_headers).data == expected
+
+def test_orjson_is_opt_in_and_encodes_the_same_document(app, client, auth_headers):
+    with app.app_context():
+        _seed()
+    stdlib = client.get('/api/tickets?limit=5', headers=auth_headers).data
+
+    app.config['RESPONSE_JSON_ENCODER'] = 'orjson'
+    fast = client.get('/api/tickets?limit=5', headers=auth_headers).data
+    assert json.loads(fast) == json.loads(stdlib)
+    assert 'módulo'.encode() in fast and 'módulo'.encode() not in stdlib
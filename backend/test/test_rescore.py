@@ -0,0 +1,51 @@
+import json
+from app.extensions import db
+from app.models.telemetry import Telemetry
+from app.services.rescore import rescore_telemetry
+
+SAMPLES = [
+    (98.5, 0.2, 5, 8, 2),
+    (12.0, 14.5, 0, 0, 0),
+    (85.0, 1.5, 0, 1, 1),
+    (37.6, 6.5, 0, 0, 0),
+    (54.6, 1.6, 3, 9, 2)
+]
+
+def _seed(count=50):
+    rows = []
+    for index in range(count):
+        cpu, ram, threats, untrusted, expected = SAMPLES[index % len(SAMPLES)]
+        # Every third row carries a stale verdict
+        stale = (expected + 1) % 3 if index % 3 == 0 else expected
+        rows.append(Telemetry(
+            id=f"row-{index:04d}", device_id="WS-1", cpu_usage_pct=cpu, mem_available_gb=ram,
+            active_threats=threats, untrusted_processes=untrusted, andon_status=stale, model_version="old"
+        ))
+    db.session.add_all(rows)
+    db.session.commit()
+
+def test_dry_run_reports_without_writing(app):
+    with app.app_context():
+        _seed()
+        report = rescore_telemetry(workers=2, chunk_size=7, dry_run=True)
+
+        assert report.scanned == 50
+        assert report.changed == 17
+        assert sum(report.transitions.values()) == 17
+        assert Telemetry.query.filter_by(model_version="old").count() == 50
+
+def test_rescore_updates_and_resumes_from_checkpoint(app, tmp_path):
+    checkpoint = tmp_path / 'rescore.json'
+    with app.app_context():
+        _seed()
+        report = rescore_telemetry(workers=2, chunk_size=7, checkpoint=str(checkpoint))
+
+        assert report.changed == 17
+        assert Telemetry.query.filter_by(model_version="old").count() == 0
+        assert db.session.get(Telemetry, "row-0000").andon_status == 2
+        assert json.loads(checkpoint.read_text())["last_id"] == "row-0049"
+
+        # Nothing left after the checkpoint
+        resumed = rescore_telemetry(workers=1, chunk_size=7, checkpoint=str(checkpoint))
+        assert resumed.scanned == 50
+        assert resumed.changed == 17
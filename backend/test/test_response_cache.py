@@ -0,0 +1,54 @@
+from app.services.response_cache import ResponseCache, FileVersions, LocalVersions, TICKETS, LOGS, response_cache
+from app.utils.query_counter import HEADER
+
+TICKET = {"title": "Disk full", "description": "...", "priority": "High"}
+
+def _get(client, path, headers):
+    response = client.get(path, headers=headers)
+    assert response.status_code == 200
+    return int(response.headers[HEADER]), response.get_json()
+
+def test_ticket_list_is_served_from_cache_until_a_write(app, client, auth_headers):
+    client.post('/api/tickets', json=TICKET, headers=auth_headers)
+
+    statements, first = _get(client, '/api/tickets', auth_headers)
+    assert statements > 0
+    # Same normalized parameters: explicit default limit and an empty filter
+    statements, cached = _get(client, '/api/tickets?status=&limit=100', auth_headers)
+    assert statements == 0 and cached == first
+
+    created = client.post('/api/tickets', json=TICKET, headers=auth_headers).get_json()['data']
+    statements, fresh = _get(client, '/api/tickets', auth_headers)
+    assert statements > 0 and len(fresh['data']) == 2
+
+    logs_version = response_cache.version(LOGS)
+    client.put(f"/api/tickets/{created['id']}", json={"status": "Closed"}, headers=auth_headers)
+    assert response_cache.version(LOGS) != logs_version
+    _, updated = _get(client, '/api/tickets', auth_headers)
+    assert {ticket['status'] for ticket in updated['data']} == {"Open", "Closed"}
+
+    stats = client.get('/api/cache', headers=auth_headers).get_json()['cache']
+    assert stats['hits'] == 1 and stats['stale'] >= 2
+
+def test_file_versions_are_shared_and_local_versions_are_per_process(tmp_path):
+    first, second = FileVersions(str(tmp_path)), FileVersions(str(tmp_path))
+    before = second.current(TICKETS)
+    first.bump(TICKETS)
+    assert second.current(TICKETS) != before
+    assert second.current(LOGS) == "0"
+
+    # Separate processes get separate nonces, so their tokens never collide
+    one, other = LocalVersions(), LocalVersions()
+    assert one.current(TICKETS) != other.current(TICKETS)
+    token = one.current(TICKETS)
+    one.bump(TICKETS)
+    assert one.current(TICKETS) != token
+
+def test_cache_is_bounded_and_counts_evictions():
+    cache = ResponseCache(capacity=2)
+    for page in range(3):
+        cache.get_or_compute(TICKETS, {"cursor": str(page)}, lambda: {"page": page})
+    assert cache.get_or_compute(TICKETS, {"cursor": "2"}, lambda: None) == {"page": 2}
+    assert cache.get_or_compute(TICKETS, {"cursor": "0"}, lambda: "recomputed") == "recomputed"
+    stats = cache.stats()
+    assert (stats['size'], stats['hits'], stats['misses'], stats['evictions']) == (2, 1, 4, 2)
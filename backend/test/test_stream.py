@@ -0,0 +1,26 @@
+from app.services.events import event_hub
+
+def _token(auth_headers):
+    return auth_headers['Authorization'].split(' ', 1)[1]
+
+def test_query_string_token_is_only_accepted_by_the_event_stream(client, auth_headers):
+    token = _token(auth_headers)
+    assert client.get(f'/api/tickets?jwt={token}').status_code == 401
+    assert client.get(f'/api/logs?jwt={token}').status_code == 401
+
+    stream = client.get(f'/api/stream?jwt={token}', buffered=False)
+    try:
+        assert stream.status_code == 200
+        assert stream.mimetype == 'text/event-stream'
+    finally:
+        stream.close()
+
+def test_a_stream_closed_before_its_first_frame_frees_its_slot(app, auth_headers):
+    before = event_hub.subscriber_count()
+    with app.test_request_context('/api/stream', headers=auth_headers):
+        # What the server does when the client is gone before the body is read
+        response = app.full_dispatch_request()
+        assert response.status_code == 200
+        assert event_hub.subscriber_count() == before + 1
+        response.close()
+    assert event_hub.subscriber_count() == before
@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime, timedelta
+from app.extensions import db
+from app.models.log import Log
+
+def _log(timestamp):
+    entry = Log(id=str(uuid.uuid4()), timestamp=timestamp, action="TICKET_MOVE", details="late")
+    db.session.add(entry)
+    db.session.commit()
+    return entry.id
+
+def _sync(client, headers, cursor=None):
+    response = client.get('/api/sync' + (f'?since={cursor}' if cursor else ''), headers=headers)
+    assert response.status_code == 200
+    return response.get_json()
+
+def test_logs_committed_after_a_newer_cursor_are_still_delivered(app, client, auth_headers):
+    with app.app_context():
+        _log(datetime.utcnow())
+    first = _sync(client, auth_headers)
+    second = _sync(client, auth_headers, first['cursor'])
+
+    # Stamped 300 ms before the last delivered log, committed only now
+    with app.app_context():
+        newest = max(datetime.fromisoformat(log['timestamp']) for log in first['logs'] + second['logs'])
+        late_id = _log(newest - timedelta(milliseconds=300))
+
+    third = _sync(client, auth_headers, second['cursor'])
+    assert late_id in [log['id'] for log in third['logs']]
+
+def test_logs_older_than_the_window_are_not_sent_again(app, client, auth_headers):
+    with app.app_context():
+        old_id = _log(datetime.utcnow() - timedelta(minutes=5))
+    first = _sync(client, auth_headers)
+    assert old_id in [log['id'] for log in first['logs']]
+
+    again = _sync(client, auth_headers, first['cursor'])
+    assert old_id not in [log['id'] for log in again['logs']]
+
+def test_logs_committed_one_audit_flush_late_are_still_delivered(app, client, auth_headers):
+    from app.config import SYNC_CLOCK_SKEW_SECONDS
+    with app.app_context():
+        _log(datetime.utcnow())
+    first = _sync(client, auth_headers)
+
+    # Event older than the clock-skew window, committed only now by a delayed flush
+    with app.app_context():
+        late_id = _log(datetime.utcnow() - timedelta(seconds=SYNC_CLOCK_SKEW_SECONDS + 0.5))
+
+    second = _sync(client, auth_headers, first['cursor'])
+    assert late_id in [log['id'] for log in second['logs']]
@@ -0,0 +1,67 @@
+from app.extensions import db
+from app.models.ticket import Ticket
+from app.models.ticket_counter import TicketCounter
+from app.services.ticket import TicketService
+
+def _summary(client, headers):
+    response = client.get('/api/tickets/summary', headers=headers)
+    assert response.status_code == 200
+    return response.get_json()
+
+def _create(client, headers, priority):
+    response = client.post('/api/tickets', headers=headers,
+                           json={'title': f'{priority} ticket', 'description': 'counter', 'priority': priority})
+    assert response.status_code == 201
+    return response.get_json()['data']['id']
+
+def _counts(app):
+    with app.app_context():
+        return {(c.status, c.priority): c.count for c in TicketCounter.query.all()}
+
+def test_summary_follows_create_move_and_delete(app, client, auth_headers):
+    high = _create(client, auth_headers, 'High')
+    _create(client, auth_headers, 'Low')
+    summary = _summary(client, auth_headers)
+    assert (summary['open'], summary['in_progress'], summary['closed']) == (2, 0, 0)
+    assert summary['highest_open_priority'] == 'High'
+
+    assert client.put(f'/api/tickets/{high}', headers=auth_headers, json={'status': 'Closed'}).status_code == 200
+    summary = _summary(client, auth_headers)
+    assert (summary['open'], summary['closed']) == (1, 1)
+    assert summary['highest_open_priority'] == 'Low'
+    assert _counts(app)[('Open', 'High')] == 0
+
+    with app.app_context():
+        assert TicketService.deleteFisical(high)
+    summary = _summary(client, auth_headers)
+    assert (summary['open'], summary['closed']) == (1, 0)
+
+def test_moving_to_the_same_status_leaves_counters_alone(app, client, auth_headers):
+    tid = _create(client, auth_headers, 'Middle')
+    for _ in range(2):
+        assert client.put(f'/api/tickets/{tid}', headers=auth_headers, json={'status': 'Open'}).status_code == 200
+    assert _counts(app) == {('Open', 'Middle'): 1}
+
+def test_a_move_from_a_stale_status_bumps_counters_once(app, client, auth_headers):
+    tid = _create(client, auth_headers, 'High')
+
+    with app.app_context():
+        stale = Ticket.query.get(tid)
+        # Another writer closes the ticket (bypassing the counters) after our read
+        with db.engine.begin() as connection:
+            connection.execute(db.update(Ticket).where(Ticket.id == tid).values(status='Closed'))
+        assert stale.status == 'Open'
+        assert TicketService.update_status(tid, 'Closed').status == 'Closed'
+
+    counts = _counts(app)
+    assert counts[('Open', 'High')] == 1  # the other writer's move was never counted
+    assert counts.get(('Closed', 'High'), 0) == 0
+
+def test_counter_rows_are_upserted(app):
+    with app.app_context():
+        from app.services.ticket import _bump_counter
+        _bump_counter('Open', 'Low', 1)
+        _bump_counter('Open', 'Low', 1)
+        _bump_counter('Open', 'Low', -1)
+        db.session.commit()
+        assert TicketCounter.query.get(('Open', 'Low')).count == 1
@@ -0,0 +1,73 @@
+from datetime import datetime
+from sqlalchemy import text
+from app.extensions import db
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.services.ticket import PAGE_ORDER, _filter_page
+from app.utils.migrations import fill_priority_rank
+from app.utils.pagination import encode_cursor
+
+PRIORITIES = ("Low", "High", "Middle")
+
+def _seed(app):
+    with app.app_context():
+        db.session.add_all([User(id="u-alice", username="alice"), User(id="u-bob", username="bob")])
+        for index in range(9):
+            db.session.add(Ticket(
+                id=f"t-{index}", title=f"Ticket {index}", description="...",
+                status="Closed" if index == 8 else "Open", priority=PRIORITIES[index % 3],
+                created_at=datetime(2026, 3, 20, 10, index),
+                user_id="u-alice" if index % 2 else "u-bob", assignee_id="u-bob" if index < 3 else None
+            ))
+        db.session.commit()
+
+def _ids(client, headers, query=''):
+    response = client.get(f'/api/tickets?{query}', headers=headers)
+    assert response.status_code == 200
+    return [ticket['id'] for ticket in response.get_json()['data']], response.get_json()['next_cursor']
+
+def test_board_order_is_high_middle_low_newest_first(app, client, auth_headers):
+    _seed(app)
+    ids, next_cursor = _ids(client, auth_headers)
+    assert ids == ['t-7', 't-4', 't-1', 't-8', 't-5', 't-2', 't-6', 't-3', 't-0']
+    assert next_cursor is None
+
+def test_each_filter_narrows_the_page(app, client, auth_headers):
+    _seed(app)
+    assert _ids(client, auth_headers, 'status=Closed')[0] == ['t-8']
+    assert _ids(client, auth_headers, 'priority=Middle')[0] == ['t-8', 't-5', 't-2']
+    assert _ids(client, auth_headers, 'assignee_id=u-bob')[0] == ['t-1', 't-2', 't-0']
+    assert _ids(client, auth_headers, 'creator=u-alice')[0] == ['t-7', 't-1', 't-5', 't-3']
+    assert _ids(client, auth_headers, 'status=Open&priority=High&creator=u-alice')[0] == ['t-7', 't-1']
+
+def test_cursor_continues_where_the_page_ended(app, client, auth_headers):
+    _seed(app)
+    seen, cursor = [], None
+    while True:
+        ids, cursor = _ids(client, auth_headers, 'status=Open&limit=3' + (f'&cursor={cursor}' if cursor else ''))
+        seen += ids
+        if cursor is None:
+            break
+    assert seen == ['t-7', 't-4', 't-1', 't-5', 't-2', 't-6', 't-3', 't-0']
+
+    assert client.get('/api/tickets?cursor=not-a-cursor', headers=auth_headers).status_code == 400
+
+def test_pages_are_read_in_index_order_without_sorting(app):
+    cursor = encode_cursor(1, datetime(2026, 3, 20), 't-1')
+    with app.app_context():
+        for status in ('Open', None):
+            for page_cursor in (None, cursor):
+                query = _filter_page(Ticket.query, page_cursor, status, None, None, None).order_by(*PAGE_ORDER).limit(51)
+                sql = str(query.statement.compile(db.engine, compile_kwargs={"literal_binds": True}))
+                plan = ' '.join(row[-1] for row in db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}')))
+                assert 'rank_created' in plan
+                assert 'TEMP B-TREE' not in plan
+
+def test_rank_is_filled_in_for_tickets_created_before_the_column(app):
+    _seed(app)
+    with app.app_context():
+        db.session.execute(text("UPDATE tickets SET priority_rank = NULL"))
+        db.session.commit()
+        assert fill_priority_rank() == 9
+        assert fill_priority_rank() == 0
+        assert {ticket.priority: ticket.priority_rank for ticket in Ticket.query} == {'High': 2, 'Middle': 1, 'Low': 0}
@@ -0,0 +1,83 @@
+import gzip
+import json
+import zlib
+import msgpack
+
+SAMPLE = {"device_id": "WS-1", "cpu_usage_pct": 98.5, "mem_available_gb": 0.2, "active_threats": 5, "untrusted_processes": 8}
+
+def test_msgpack_and_compressed_bodies_reach_the_same_validation(client, auth_headers):
+    batch = [SAMPLE, {**SAMPLE, "cpu_usage_pct": "n/a"}]
+    as_json = client.post('/api/andon/analyze/batch', json=batch, headers=auth_headers).get_json()['data']
+
+    packed = client.post('/api/andon/analyze/batch', data=gzip.compress(msgpack.packb(batch)), headers={
+        **auth_headers, 'Content-Type': 'application/msgpack', 'Content-Encoding': 'gzip', 'Accept': 'application/msgpack'
+    })
+    assert packed.status_code == 201
+    assert packed.content_type == 'application/msgpack'
+    as_msgpack = msgpack.unpackb(packed.data)['data']
+    assert as_msgpack['errors'] == as_json['errors']
+    assert [item['andon_status'] for item in as_msgpack['results']] == [item['andon_status'] for item in as_json['results']]
+
+    single = client.post('/api/andon/analyze', data=zlib.compress(json.dumps(SAMPLE).encode()), headers={
+        **auth_headers, 'Content-Type': 'application/json', 'Content-Encoding': 'deflate'
+    })
+    assert single.status_code == 201
+    assert single.get_json()['data']['andon_status'] == 2
+
+def test_malformed_and_oversized_bodies_are_rejected(app, client, auth_headers):
+    headers = {**auth_headers, 'Content-Type': 'application/json', 'Content-Encoding': 'gzip'}
+    assert client.post('/api/andon/analyze', data=b'not gzip', headers=headers).status_code == 400
+    assert client.post('/api/andon/analyze', data=gzip.compress(b'{"device_id":')[:-4], headers=headers).status_code == 400
+
+    app.config['REQUEST_MAX_DECOMPRESSED_BYTES'] = 1024
+    bomb = gzip.compress(json.dumps([SAMPLE] * 100).encode())
+    assert len(bomb) < 1024
+    assert client.post('/api/andon/analyze/batch', data=bomb, headers=headers).status_code == 413
+
+def test_large_responses_are_compressed_and_keep_distinct_etags(client, auth_headers):
+    for index in range(30):
+        client.post('/api/tickets', json={"title": f"Ticket {index}", "description": "...", "priority": "High"}, headers=auth_headers)
+
+    plain = client.get('/api/tickets', headers=auth_headers)
+    assert 'Content-Encoding' not in plain.headers
+
+    compressed = client.get('/api/tickets', headers={**auth_headers, 'Accept-Encoding': 'gzip'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(compressed.data)) == plain.get_json()
+    assert compressed.headers['ETag'] == plain.headers['ETag'][:-1] + '-gzip"'
+    assert len(compressed.data) < len(plain.data)
+
+    revalidated = client.get('/api/tickets', headers={
+        **auth_headers, 'Accept-Encoding': 'gzip', 'If-None-Match': compressed.headers['ETag']
+    })
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == compressed.headers['ETag']
+
+    packed = client.get('/api/tickets', headers={**auth_headers, 'Accept': 'application/msgpack'})
+    assert msgpack.unpackb(packed.data) == plain.get_json()
+    assert packed.headers['ETag'] != plain.headers['ETag']
+
+    small = client.get('/api/tickets/summary', headers={**auth_headers, 'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in small.headers
+
+def test_concatenated_gzip_members_are_read_whole(client, auth_headers):
+    body = json.dumps([SAMPLE, {**SAMPLE, "device_id": "WS-2"}]).encode()
+    middle = len(body) // 2
+    response = client.post('/api/andon/analyze/batch', data=gzip.compress(body[:middle]) + gzip.compress(body[middle:]), headers={
+        **auth_headers, 'Content-Type': 'application/json', 'Content-Encoding': 'gzip'
+    })
+    assert response.status_code == 201
+    assert len(response.get_json()['data']['results']) == 2
+
+    trailing = zlib.compress(json.dumps(SAMPLE).encode()) + b'garbage'
+    assert client.post('/api/andon/analyze', data=trailing, headers={
+        **auth_headers, 'Content-Type': 'application/json', 'Content-Encoding': 'deflate'
+    }).status_code == 400
+
+def test_compressed_bodies_are_capped_before_they_are_read(app, client, auth_headers):
+    app.config['REQUEST_MAX_COMPRESSED_BYTES'] = 64
+    headers = {**auth_headers, 'Content-Type': 'application/json', 'Content-Encoding': 'gzip'}
+    large = gzip.compress(json.dumps([SAMPLE] * 20).encode(), compresslevel=0)
+    assert client.post('/api/andon/analyze/batch', data=large, headers=headers).status_code == 413
+    # Identity bodies are not affected by the compressed-size cap
+    assert client.post('/api/andon/analyze', json=SAMPLE, headers=auth_headers).status_code == 201
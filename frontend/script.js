@@ -4,6 +4,12 @@ document.addEventListener('DOMContentLoaded', () => {
     let draggedCard = null;
     let pollingInterval = null;
     let isPollingActive = false;
+    // Estado local do delta sync (/api/sync)
+    let syncCursor = null;
+    const ticketCache = new Map();
+    let logCache = [];
+    let eventSource = null;
+    let refreshTimer = null;
 
     const ui = {
         auth: document.getElementById('auth-section'),
@@ -33,11 +39,11 @@ document.addEventListener('DOMContentLoaded', () => {
         setTimeout(() => ui.msg.className = 'message', 5000);
     }
 
-    // CORREÇÃO 1: Adicionado 'cache: no-store' para obrigar o navegador a buscar os dados novos do Polling
+    // CORREÇÃO 1: 'cache: no-cache' obriga o navegador a revalidar cada Polling (If-None-Match -> 304 quando nada mudou)
     async function fetchAPI(end, opt = {}) {
         const headers = { ...opt.headers, 'Content-Type': 'application/json' };
         if (global_access_token) headers['Authorization'] = `Bearer ${global_access_token}`;
-        return fetch(`${API_URL}${end}`, { ...opt, headers, cache: 'no-store' });
+        return fetch(`${API_URL}${end}`, { ...opt, headers, cache: 'no-cache' });
     }
 
     // --- 1. AUTENTICAÇÃO ---
@@ -56,6 +62,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 ui.batch.style.display = 'block'; ui.andon.style.display = 'block'; ui.logout.style.display = 'block';
                 setupDragAndDrop();
                 fetchData();
+                openEventStream();
                 showMsg("Logged in!", "success");
             } else {
                 showMsg("Login falhou. Verifique usuário e senha.");
@@ -99,15 +106,29 @@ document.addEventListener('DOMContentLoaded', () => {
     // --- 2. DASHBOARD E TICKETS ---
     async function fetchData() {
         try {
-            const [resT, resL] = await Promise.all([fetchAPI('/api/tickets'), fetchAPI('/api/logs')]);
-            const tickets = await resT.json(); const logs = await resL.json();
-            const tList = tickets.data || (Array.isArray(tickets) ? tickets : []);
-            const lList = logs.data || (Array.isArray(logs) ? logs : []);
+            const syncUrl = syncCursor ? `/api/sync?since=${encodeURIComponent(syncCursor)}` : '/api/sync';
+            const [resSync, resS] = await Promise.all([fetchAPI(syncUrl), fetchAPI('/api/tickets/summary')]);
+            const sync = await resSync.json(); const summary = await resS.json();
+
+            if (sync.reset) { ticketCache.clear(); logCache = []; }
+            (sync.tickets || []).forEach(t => ticketCache.set(t.id, t));
+            (sync.deleted || []).forEach(id => ticketCache.delete(id));
+            // Logs da janela de atraso podem vir repetidos: deduplicar por id
+            const seenLogs = new Set();
+            logCache = [...(sync.logs || []).reverse(), ...logCache]
+                .filter(l => !seenLogs.has(l.id) && seenLogs.add(l.id))
+                .sort((a, b) => (a.timestamp < b.timestamp ? 1 : -1))
+                .slice(0, 20);
+            if (sync.cursor) syncCursor = sync.cursor;
+
+            const rank = p => ({ high: 2, middle: 1, low: 0 })[(p || '').toLowerCase()] ?? -1;
+            const tList = [...ticketCache.values()].sort((a, b) =>
+                (rank(b.priority) - rank(a.priority)) || String(b.created_at).localeCompare(String(a.created_at)));
+            const lList = logCache;
 
             const cols = { "open": document.getElementById('column-open'), "inprogress": document.getElementById('column-inprogress'), "closed": document.getElementById('column-closed') };
             Object.values(cols).forEach(c => { if(c) c.innerHTML = ''; });
             
-            let maxV = 0;
             tList.forEach(t => {
                 const key = t.status.toLowerCase().replace(/\s+/g, '');
                 if (cols[key]) {
@@ -115,31 +136,26 @@ document.addEventListener('DOMContentLoaded', () => {
                         cols[key].appendChild(createCard(t));
                     }
                 }
-                if (t.status !== 'Closed') {
-                    const v = t.priority.toLowerCase() === 'high' ? 2 : (t.priority.toLowerCase() === 'middle' ? 1 : 0);
-                    if (v > maxV) maxV = v;
-                }
             });
             
+            // Luz Andon e contadores vêm prontos do servidor (/api/tickets/summary)
+            const maxV = summary.andon_status || 0;
             ui.light.className = `andon-light status-${maxV}`;
             ui.statusText.textContent = `Status: ${maxV === 2 ? 'CRITICAL' : (maxV === 1 ? 'WARNING' : 'STABLE')}`;
             
-            // ---> AQUI ESTÁ A CORREÇÃO: ATUALIZANDO OS CONTADORES <---
             if (document.getElementById('count-open')) {
-                document.getElementById('count-open').textContent = tList.filter(t => t.status.toLowerCase().replace(/\s+/g, '') === 'open').length;
+                document.getElementById('count-open').textContent = summary.open || 0;
             }
             if (document.getElementById('count-inprogress')) {
-                document.getElementById('count-inprogress').textContent = tList.filter(t => t.status.toLowerCase().replace(/\s+/g, '') === 'inprogress').length;
+                document.getElementById('count-inprogress').textContent = summary.in_progress || 0;
             }
             if (document.getElementById('count-closed')) {
-                document.getElementById('count-closed').textContent = tList.filter(t => t.status.toLowerCase().replace(/\s+/g, '') === 'closed').length;
+                document.getElementById('count-closed').textContent = summary.closed || 0;
             }
             
             // Logs
             ui.logCont.innerHTML = '';
-            const sortedLogs = lList.sort((a, b) => (b.id || 0) - (a.id || 0)).slice(0, 20);
-            
-            sortedLogs.forEach(l => {
+            lList.forEach(l => {
                 const div = document.createElement('div'); 
                 div.className = 'log-card';
                 let timeStr = new Date().toLocaleTimeString();
@@ -153,6 +169,18 @@ document.addEventListener('DOMContentLoaded', () => {
         } catch (e) { console.error("Refresh Error"); }
     }
 
+    // Push do servidor (SSE): qualquer mudança de ticket ou alerta da IA dispara um refresh agrupado
+    function openEventStream() {
+        if (eventSource || !window.EventSource) return;
+        eventSource = new EventSource(`${API_URL}/api/stream?jwt=${encodeURIComponent(global_access_token)}`);
+        const scheduleRefresh = () => {
+            clearTimeout(refreshTimer);
+            refreshTimer = setTimeout(fetchData, 250);
+        };
+        ['ticket.created', 'ticket.updated', 'ticket.deleted', 'andon.analysis', 'andon.batch']
+            .forEach(evt => eventSource.addEventListener(evt, scheduleRefresh));
+    }
+
     // --- 3. IA ANALYSIS ---
     async function runAIAnalysis(item) {
         try {